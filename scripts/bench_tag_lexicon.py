@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from functools import partial
+
+from ansimon_ai.structuring.tag_patterns import TAG_LEXICON, TAG_PATTERNS
+from ansimon_ai.timeline.tag_terms import TAG_RULE_LEXICON, TAG_RULE_TERMS
+
+FILLER = (
+    "오늘 회사에서 업무 회의를 했고 점심은 같이 먹었습니다. "
+    "오후에는 보고서를 작성하고 퇴근 후 집으로 돌아왔습니다. "
+)
+DENSE = "그만해 야한 사진 보내 반복해서 연락 협박 미친 새끼 경찰에 신고 다른 번호로 전화 "
+
+def _build_text(kind: str, size: int) -> str:
+    body = FILLER if kind == "sparse" else DENSE
+    text = (body * (size // len(body) + 1))[:size]
+    if kind == "sparse":
+        text += " 그만해 달라고 했습니다"
+    return text
+
+def _naive_groups(groups: dict, text: str) -> frozenset[str]:
+    return frozenset(
+        group for group, terms in groups.items() if any(term in text for term in terms)
+    )
+
+def _time_ms(fn, text: str, repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (time.perf_counter() - started_at) * 1000 / repeat
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compiled tag lexicons")
+    parser.add_argument("--sizes", default="2000,20000,100000", help="comma separated text sizes")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    lexicons = {
+        "tag_patterns": (TAG_LEXICON, TAG_PATTERNS),
+        "tag_rules": (TAG_RULE_LEXICON, TAG_RULE_TERMS),
+    }
+    print(f"{'lexicon':<14}{'text':<8}{'chars':>8}{'naive_ms':>12}{'compiled_ms':>14}")
+    for name, (lexicon, groups) in lexicons.items():
+        for kind in ("sparse", "dense"):
+            for size in (int(value) for value in args.sizes.split(",")):
+                text = _build_text(kind, size)
+                if lexicon.find(text) != _naive_groups(groups, text):
+                    raise SystemExit(f"mismatch for {name}/{kind}/{size}")
+                naive_ms = _time_ms(partial(_naive_groups, groups), text, args.repeat)
+                compiled_ms = _time_ms(lexicon.find, text, args.repeat)
+                print(f"{name:<14}{kind:<8}{size:>8}{naive_ms:>12.3f}{compiled_ms:>14.3f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from ansimon_ai.timeline import (
+    EvidenceProcessingResult,
+    TimelineIndex,
+    assemble_timeline_items,
+)
+
+def _build_results(count: int, *, buckets: int, seed: int) -> list[EvidenceProcessingResult]:
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, 9, 0)
+    return [
+        EvidenceProcessingResult(
+            evidence_id=uuid4(),
+            type="MESSAGE",
+            status="completed",
+            timestamp=start + timedelta(minutes=rng.randrange(buckets)),
+            title=f"message {index}",
+            description="repeated contact",
+            tags=["repeat"],
+        )
+        for index in range(count)
+    ]
+
+def _time_ms(fn) -> float:
+    started_at = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started_at) * 1000
+
+def _best_ms(fn, repeat: int = 3) -> float:
+    return min(_time_ms(fn) for _ in range(repeat))
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark timeline assembly against TimelineIndex")
+    parser.add_argument("--sizes", default="1000,10000,20000", help="comma separated evidence counts")
+    parser.add_argument("--updates", type=int, default=20, help="incremental updates per size")
+    parser.add_argument("--buckets", type=int, default=0, help="distinct minutes (0 = one per evidence)")
+    args = parser.parse_args(argv)
+
+    print(f"{'evidences':>10}{'full_ms':>12}{'index_ms':>12}{'rebuild_upd_ms':>16}{'index_upd_ms':>14}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        results = _build_results(size, buckets=args.buckets or size, seed=size)
+        extra = _build_results(args.updates, buckets=args.buckets or size, seed=-size)
+
+        full_ms = _best_ms(lambda: assemble_timeline_items(results))
+        index_ms = _best_ms(lambda: TimelineIndex.from_results(results).snapshot())
+        index = TimelineIndex.from_results(results)
+        if index.snapshot() != assemble_timeline_items(results):
+            raise SystemExit(f"index output differs from full assembly at {size}")
+
+        live = list(results)
+
+        def rebuild_updates() -> None:
+            for result in extra:
+                live.append(result)
+                assemble_timeline_items(live)
+
+        def index_updates() -> None:
+            for result in extra:
+                index.add(result)
+                index.snapshot()
+
+        rebuild_ms = _time_ms(rebuild_updates) / len(extra)
+        index_update_ms = _time_ms(index_updates) / len(extra)
+        print(f"{size:>10}{full_ms:>12.1f}{index_ms:>12.1f}{rebuild_ms:>16.2f}{index_update_ms:>14.2f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
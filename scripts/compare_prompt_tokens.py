@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Callable
+
+from ansimon_ai.eval.runner_v0 import build_eval_structuring_input_v0, load_evalset_v0
+from ansimon_ai.llm.rate_limit import estimate_message_tokens
+from ansimon_ai.pdf.document_structuring import build_structuring_input_from_document
+from ansimon_ai.prompting.build_messages import build_structuring_messages
+from ansimon_ai.prompting.segments import decode_compact_segments, encode_segments
+
+DEFAULT_EVALSETS = [
+    Path("data/evalsets/v0/eval_smoke_v0.json"),
+    Path("data/evalsets/v0/eval_full_v0.json"),
+]
+
+def _token_counter(encoding_name: str) -> tuple[str, Callable[[list[dict]], int]]:
+    try:
+        import tiktoken
+    except ModuleNotFoundError:
+        return "estimate", estimate_message_tokens
+
+    encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(messages: list[dict]) -> int:
+        return sum(len(encoding.encode(message["content"])) for message in messages)
+
+    return encoding_name, count
+
+def _segments_round_trip(struct_input) -> bool:
+    # The compact form must carry the same segments, or the model sees less.
+    decoded = decode_compact_segments(
+        struct_input.full_text,
+        encode_segments(struct_input, "compact"),
+    )
+    expected = [
+        segment.model_copy(update={"speaker": segment.speaker or None})
+        for segment in struct_input.segments
+    ]
+    return decoded == expected
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare structuring prompt tokens between segment encodings",
+    )
+    parser.add_argument("evalsets", nargs="*", type=Path, default=DEFAULT_EVALSETS)
+    parser.add_argument(
+        "--document",
+        action="append",
+        type=Path,
+        default=[],
+        help="text file to measure as a document input (repeatable)",
+    )
+    parser.add_argument("--tokenizer", default="o200k_base", help="tiktoken encoding when installed")
+    args = parser.parse_args(argv)
+
+    tokenizer, count_tokens = _token_counter(args.tokenizer)
+    total_json = 0
+    total_compact = 0
+    mismatches = 0
+    inputs = []
+    for path in args.evalsets:
+        evalset = load_evalset_v0(path)
+        for case in evalset.cases:
+            inputs.append((f"{evalset.name}/{case.case_id}", build_eval_structuring_input_v0(case)))
+    for path in args.document:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        inputs.append((str(path), build_structuring_input_from_document(lines)))
+
+    for label, struct_input in inputs:
+        json_tokens = count_tokens(build_structuring_messages(struct_input, segment_encoding="json"))
+        compact_tokens = count_tokens(
+            build_structuring_messages(struct_input, segment_encoding="compact")
+        )
+        round_trip = _segments_round_trip(struct_input)
+        mismatches += int(not round_trip)
+        total_json += json_tokens
+        total_compact += compact_tokens
+        print(
+            f"{label} source={struct_input.source_type} "
+            f"json={json_tokens} compact={compact_tokens} "
+            f"saved={json_tokens - compact_tokens} round_trip={'ok' if round_trip else 'MISMATCH'}"
+        )
+
+    saved = total_json - total_compact
+    share = saved / total_json if total_json else 0.0
+    print(
+        f"\nTotal ({tokenizer}): json={total_json} compact={total_compact} "
+        f"saved={saved} ({share:.1%}) round_trip_mismatches={mismatches}"
+    )
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
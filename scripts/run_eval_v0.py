@@ -6,6 +6,8 @@ import sys
 from pathlib import Path
 
 from ansimon_ai.eval.runner_v0 import load_evalset_v0, run_evalset_v0
+from ansimon_ai.llm.usage import cached_prompt_ratio
+from ansimon_ai.prompting.assets import PROMPT_ASSETS
 
 def _default_evalset_path(suite: str) -> Path:
     suite = suite.strip().lower()
@@ -66,6 +68,13 @@ def main(argv: list[str]) -> int:
         f"(suite={evalset.name}, cases={len(results)})"
     )
 
+    prompt_tokens = sum(r.usage_metrics.prompt_tokens or 0 for r in results)
+    cached_prompt_tokens = sum(r.usage_metrics.cached_prompt_tokens or 0 for r in results)
+    ratio = cached_prompt_ratio(prompt_tokens, cached_prompt_tokens)
+    if ratio is not None:
+        print(f"Prompt cache: cached_tokens={cached_prompt_tokens}/{prompt_tokens} ratio={ratio:.2%}")
+    print(f"Prompts: {' '.join(PROMPT_ASSETS.fingerprints().values())}")
+
     if args.out:
         out_path = Path(args.out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -9,11 +9,13 @@ from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 from ansimon_ai.eval.types_v0 import EvalCaseV0, EvalInputKind, EvalSetV0
 from ansimon_ai.eval.validator_adapter_v0 import StructuringValidatorV0
 from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.llm.usage import cached_prompt_ratio
 from ansimon_ai.requirements.event_io_v0 import run_requirement_service_v0
 from ansimon_ai.stt.mock import MockSTT
 from ansimon_ai.structuring.anchor.matcher import AnchorMatcher
 from ansimon_ai.structuring.from_stt import build_structuring_input_from_stt
 from ansimon_ai.structuring.run import run_structuring_pipeline_with_tags
+from ansimon_ai.structuring.types import StageMetrics, StructuringInput
 from ansimon_ai.validator.tag_validator_v0 import validate_evidence_tags_v0
 
 EvalCaseStatus = Literal["pass", "warn", "fail"]
@@ -28,6 +30,8 @@ class UsageMetricsV0:
     completion_tokens: Optional[int] = None
     total_tokens: Optional[int] = None
     estimated_cost: Optional[float] = None
+    cached_prompt_tokens: Optional[int] = None
+    cached_prompt_ratio: Optional[float] = None
 
 @dataclass(frozen=True)
 class EvalCaseResultV0:
@@ -53,6 +57,25 @@ def load_evalset_v0(path: Path) -> EvalSetV0:
 def _json_size_chars(obj: Any) -> int:
     return len(json.dumps(obj, ensure_ascii=False, separators=(",", ":")))
 
+def _token_usage(stage_metrics: Sequence[StageMetrics]) -> Dict[str, Any]:
+    # Only stages that reported provider usage count; a cache hit spends none.
+    reported = [item for item in stage_metrics if item.prompt_tokens is not None]
+    if not reported:
+        return {}
+
+    prompt_tokens = sum(item.prompt_tokens for item in reported)
+    completion_tokens = sum(item.completion_tokens or 0 for item in reported)
+    cached_prompt_tokens = sum(item.cached_prompt_tokens or 0 for item in reported)
+    costs = [item.estimated_cost for item in reported if item.estimated_cost is not None]
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "cached_prompt_tokens": cached_prompt_tokens,
+        "cached_prompt_ratio": cached_prompt_ratio(prompt_tokens, cached_prompt_tokens),
+        "estimated_cost": sum(costs) if costs else None,
+    }
+
 def _subset_contains(*, required: Sequence[str], actual: Sequence[str]) -> bool:
     actual_set = set(actual)
     return all(code in actual_set for code in required)
@@ -103,6 +126,16 @@ def _compare_case(
 
     return (len(mismatches) == 0), mismatches
 
+def build_eval_structuring_input_v0(case: EvalCaseV0) -> StructuringInput:
+    if case.input.kind == EvalInputKind.TEXT:
+        stt = MockSTT()
+        stt_result = stt.transcribe(case.input.text or "")
+        return build_structuring_input_from_stt(stt_result)
+
+    if not case.input.structuring_input:
+        raise ValueError("structuring_input is required when kind=structuring_input")
+    return StructuringInput.model_validate(case.input.structuring_input)
+
 def run_eval_case_v0(
     *,
     case: EvalCaseV0,
@@ -125,18 +158,8 @@ def run_eval_case_v0(
     anchor_matcher = anchor_matcher or AnchorMatcher()
     validator = validator or StructuringValidatorV0()
 
-    if case.input.kind == EvalInputKind.TEXT:
-        stt = MockSTT()
-        stt_result = stt.transcribe(case.input.text or "")
-        struct_input = build_structuring_input_from_stt(stt_result)
-        input_chars = len(struct_input.full_text)
-    else:
-        if not case.input.structuring_input:
-            raise ValueError("structuring_input is required when kind=structuring_input")
-        from ansimon_ai.structuring.types import StructuringInput
-
-        struct_input = StructuringInput.model_validate(case.input.structuring_input)
-        input_chars = len(struct_input.full_text)
+    struct_input = build_eval_structuring_input_v0(case)
+    input_chars = len(struct_input.full_text)
 
     t0 = time.perf_counter()
     try:
@@ -190,6 +213,7 @@ def run_eval_case_v0(
             input_chars=input_chars,
             output_chars=output_chars,
             cache_hit=getattr(result, "cache_hit", None),
+            **_token_usage(result.stage_metrics),
         )
 
         summary: Dict[str, Any] = {
@@ -1,9 +1,61 @@
-from .base import LLMClient
+from .base import (
+    AsyncLLMClient,
+    LLMClient,
+    LLMResponse,
+    agenerate_json_with,
+    agenerate_with,
+    generate_json_with,
+)
+from .caching import CachingLLMClient, JsonFileLLMCache, llm_cache_key
+from .cassette import CassetteMissError, RecordingLLMClient, ReplayLLMClient
+from .hedging import HedgedLLMClient, LatencyTracker
 from .mock import MockLLMClient
-from .openai_client import OpenAILLMClient
+from .openai_client import AsyncOpenAILLMClient, OpenAILLMClient
+from .rate_limit import (
+    InMemoryRateLimitStore,
+    RateLimitedLLMClient,
+    RateLimiter,
+    SQLiteRateLimitStore,
+    estimate_message_tokens,
+)
+from .streaming import (
+    IncrementalJSONObjectParser,
+    StreamUsage,
+    astream_json_with,
+    astream_with,
+    iter_json_fields_with,
+    stream_json_with,
+    stream_with,
+)
 
 __all__ = [
+    "AsyncLLMClient",
+    "AsyncOpenAILLMClient",
+    "CachingLLMClient",
+    "CassetteMissError",
+    "HedgedLLMClient",
+    "IncrementalJSONObjectParser",
+    "InMemoryRateLimitStore",
+    "JsonFileLLMCache",
+    "LatencyTracker",
     "LLMClient",
+    "LLMResponse",
     "MockLLMClient",
     "OpenAILLMClient",
-]
\ No newline at end of file
+    "RateLimitedLLMClient",
+    "RateLimiter",
+    "RecordingLLMClient",
+    "ReplayLLMClient",
+    "SQLiteRateLimitStore",
+    "StreamUsage",
+    "agenerate_json_with",
+    "agenerate_with",
+    "astream_json_with",
+    "astream_with",
+    "estimate_message_tokens",
+    "generate_json_with",
+    "iter_json_fields_with",
+    "llm_cache_key",
+    "stream_json_with",
+    "stream_with",
+]
@@ -1,7 +1,58 @@
+import asyncio
+import json
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(frozen=True)
+class LLMResponse:
+    text: str
+    data: dict
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    cached_prompt_tokens: Optional[int] = None
+    model: Optional[str] = None
+    cache_hit: bool = False
+
+    @property
+    def total_tokens(self) -> Optional[int]:
+        if self.prompt_tokens is None or self.completion_tokens is None:
+            return None
+        return self.prompt_tokens + self.completion_tokens
 
 class LLMClient(ABC):
     @abstractmethod
     def generate(self, messages: list[dict]) -> str:
 
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+class AsyncLLMClient(ABC):
+    @abstractmethod
+    async def agenerate(self, messages: list[dict]) -> str:
+
+        raise NotImplementedError
+
+async def agenerate_with(llm_client, messages: list[dict]) -> str:
+    agenerate = getattr(llm_client, "agenerate", None)
+    if agenerate is not None:
+        return await agenerate(messages)
+
+    return await asyncio.to_thread(llm_client.generate, messages)
+
+def generate_json_with(llm_client, messages: list[dict]) -> LLMResponse:
+    # Clients that already parsed the response expose generate_json, so the
+    # JSON content is parsed once per call.
+    generate_json = getattr(llm_client, "generate_json", None)
+    if generate_json is not None:
+        return generate_json(messages)
+
+    text = llm_client.generate(messages)
+    return LLMResponse(text=text, data=json.loads(text))
+
+async def agenerate_json_with(llm_client, messages: list[dict]) -> LLMResponse:
+    agenerate_json = getattr(llm_client, "agenerate_json", None)
+    if agenerate_json is not None:
+        return await agenerate_json(messages)
+
+    text = await agenerate_with(llm_client, messages)
+    return LLMResponse(text=text, data=json.loads(text))
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from .base import AsyncLLMClient, LLMClient, LLMResponse, agenerate_json_with, generate_json_with
+
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+def llm_cache_key(
+    messages: list[dict],
+    *,
+    model: Optional[str],
+    response_format: Optional[dict] = None,
+) -> str:
+    payload = json.dumps(
+        {"model": model, "response_format": response_format, "messages": messages},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return f"llm::{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+class JsonFileLLMCache:
+    """Persistent cache tier with one JSON file per key under ``directory``."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def set(self, key: str, value: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        # Readers in other processes never see a half written file.
+        os.replace(temp_path, path)
+
+    def _path(self, key: str) -> Path:
+        digest = key.rsplit("::", 1)[-1]
+        return self.directory / digest[:2] / f"{digest}.json"
+
+class CachingLLMClient(LLMClient, AsyncLLMClient):
+    """Reuses responses for identical (model, messages, response_format) calls.
+
+    Responses are kept in an in-memory LRU of ``max_entries`` and, when a
+    ``backend`` is given, in a persistent tier: any object with
+    ``get(key) -> Optional[dict]`` and ``set(key, dict)``, like the pipeline
+    caches. A cached response reports no token usage, since none was spent.
+    """
+
+    def __init__(
+        self,
+        inner,
+        backend: Optional[Any] = None,
+        *,
+        model: Optional[str] = None,
+        response_format: Optional[dict] = None,
+        max_entries: int = 1024,
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must not be negative.")
+        self.inner = inner
+        self.backend = backend
+        self.model = model if model is not None else getattr(inner, "model", None)
+        self.response_format = response_format if response_format is not None else JSON_RESPONSE_FORMAT
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def generate(self, messages: list[dict]) -> str:
+        return self.generate_json(messages).text
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        key = self._key(messages)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = generate_json_with(self.inner, messages)
+        self._store(key, response)
+        return response
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        return (await self.agenerate_json(messages)).text
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        key = self._key(messages)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = await agenerate_json_with(self.inner, messages)
+        self._store(key, response)
+        return response
+
+    def _key(self, messages: list[dict]) -> str:
+        return llm_cache_key(messages, model=self.model, response_format=self.response_format)
+
+    def _lookup(self, key: str) -> Optional[LLMResponse]:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+
+        if text is None and self.backend is not None:
+            stored = self.backend.get(key)
+            if stored is not None:
+                text = stored["text"]
+                self._remember(key, text)
+
+        with self._lock:
+            if text is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return LLMResponse(text=text, data=json.loads(text), model=self.model, cache_hit=True)
+
+    def _store(self, key: str, response: LLMResponse) -> None:
+        self._remember(key, response.text)
+        if self.backend is not None:
+            self.backend.set(key, {"text": response.text})
+
+    def _remember(self, key: str, text: str) -> None:
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
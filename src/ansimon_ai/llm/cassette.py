@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Literal, Optional
+
+from .base import AsyncLLMClient, LLMClient, LLMResponse, agenerate_json_with, generate_json_with
+
+ReplayLatency = Literal["none", "recorded", "sampled"]
+
+class CassetteMissError(KeyError):
+    pass
+
+@dataclass(frozen=True)
+class CassetteEntry:
+    key: str
+    text: str
+    latency_ms: float
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    cached_prompt_tokens: Optional[int] = None
+    model: Optional[str] = None
+
+    def to_response(self) -> LLMResponse:
+        return LLMResponse(
+            text=self.text,
+            data=json.loads(self.text),
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            cached_prompt_tokens=self.cached_prompt_tokens,
+            model=self.model,
+        )
+
+def cassette_key(messages: list[dict]) -> str:
+    # Only the digest is stored, so evidence text and images stay out of the file.
+    payload = json.dumps(messages, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def load_cassette(path: str | Path) -> List[CassetteEntry]:
+    with open(path, encoding="utf-8") as handle:
+        return [CassetteEntry(**json.loads(line)) for line in handle if line.strip()]
+
+class RecordingLLMClient(LLMClient, AsyncLLMClient):
+    """Passes calls to ``inner`` and appends each response to a JSONL cassette."""
+
+    def __init__(self, inner, path: str | Path) -> None:
+        self.inner = inner
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def generate(self, messages: list[dict]) -> str:
+        return self.generate_json(messages).text
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        started_at = time.perf_counter()
+        response = generate_json_with(self.inner, messages)
+        self._record(messages, response, time.perf_counter() - started_at)
+        return response
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        return (await self.agenerate_json(messages)).text
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        started_at = time.perf_counter()
+        response = await agenerate_json_with(self.inner, messages)
+        self._record(messages, response, time.perf_counter() - started_at)
+        return response
+
+    def _record(self, messages: list[dict], response: LLMResponse, seconds: float) -> None:
+        entry = CassetteEntry(
+            key=cassette_key(messages),
+            text=response.text,
+            latency_ms=seconds * 1000,
+            prompt_tokens=response.prompt_tokens,
+            completion_tokens=response.completion_tokens,
+            cached_prompt_tokens=response.cached_prompt_tokens,
+            model=response.model,
+        )
+        line = json.dumps(asdict(entry), ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+class ReplayLLMClient(LLMClient, AsyncLLMClient):
+    """Serves recorded responses back without a network.
+
+    Repeated prompts replay their recordings in order and then cycle.
+    ``latency`` chooses the injected delay: none, the entry's own recorded
+    latency, or one drawn from all recorded latencies (seeded with ``seed``).
+    An unrecorded prompt raises ``CassetteMissError`` unless ``fallback`` is
+    given.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        latency: ReplayLatency = "none",
+        latency_scale: float = 1.0,
+        seed: Optional[int] = None,
+        fallback=None,
+    ) -> None:
+        entries = load_cassette(path)
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.fallback = fallback
+        self._entries: Dict[str, List[CassetteEntry]] = {}
+        for entry in entries:
+            self._entries.setdefault(entry.key, []).append(entry)
+        self._latencies = [entry.latency_ms / 1000 for entry in entries]
+        self._positions: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate(self, messages: list[dict]) -> str:
+        return self.generate_json(messages).text
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        entry = self._next_entry(messages)
+        if entry is None:
+            return generate_json_with(self.fallback, messages)
+        time.sleep(self._delay_seconds(entry))
+        return entry.to_response()
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        return (await self.agenerate_json(messages)).text
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        entry = self._next_entry(messages)
+        if entry is None:
+            return await agenerate_json_with(self.fallback, messages)
+        await asyncio.sleep(self._delay_seconds(entry))
+        return entry.to_response()
+
+    def _next_entry(self, messages: list[dict]) -> Optional[CassetteEntry]:
+        key = cassette_key(messages)
+        recorded = self._entries.get(key)
+        if recorded is None:
+            if self.fallback is None:
+                raise CassetteMissError(key)
+            return None
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        return recorded[position % len(recorded)]
+
+    def _delay_seconds(self, entry: CassetteEntry) -> float:
+        if self.latency == "recorded":
+            return entry.latency_ms / 1000 * self.latency_scale
+        if self.latency == "sampled":
+            with self._lock:
+                return self._random.choice(self._latencies) * self.latency_scale
+        return 0.0
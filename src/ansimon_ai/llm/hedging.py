@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+
+from .base import AsyncLLMClient, LLMClient, LLMResponse, agenerate_json_with, generate_json_with
+
+class LatencyTracker:
+    """Rolling window of recent successful LLM call latencies in seconds."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(fraction * len(samples)))
+        return samples[index]
+
+class HedgedLLMClient(LLMClient, AsyncLLMClient):
+    """Sends a duplicate request when the first one is slower than usual.
+
+    Once ``min_samples`` latencies are known, the hedge is sent after the
+    first request has run longer than their ``hedge_percentile``; before
+    that, after ``hedge_after_seconds`` (no hedging when it is None). The
+    first response wins. A losing async request is cancelled; a losing sync
+    request cannot be and runs to completion on the pool.
+    """
+
+    def __init__(
+        self,
+        inner,
+        *,
+        hedge_percentile: float = 0.95,
+        hedge_after_seconds: Optional[float] = None,
+        min_samples: int = 20,
+        tracker: Optional[LatencyTracker] = None,
+        max_workers: int = 16,
+    ) -> None:
+        if not 0 < hedge_percentile < 1:
+            raise ValueError("hedge_percentile must be between 0 and 1.")
+        self.inner = inner
+        self.hedge_percentile = hedge_percentile
+        self.hedge_after_seconds = hedge_after_seconds
+        self.min_samples = min_samples
+        self.tracker = tracker or LatencyTracker()
+        self.hedged_requests = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-hedge")
+
+    def hedge_delay(self) -> Optional[float]:
+        if len(self.tracker) >= self.min_samples:
+            return self.tracker.percentile(self.hedge_percentile)
+        return self.hedge_after_seconds
+
+    def generate(self, messages: list[dict]) -> str:
+        return self.generate_json(messages).text
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed_generate(messages)
+
+        primary = self._executor.submit(self._timed_generate, messages)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        self._count_hedge()
+        pending = {primary, self._executor.submit(self._timed_generate, messages)}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = error or future.exception()
+        raise error
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        return (await self.agenerate_json(messages)).text
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._atimed_generate(messages)
+
+        pending = {asyncio.ensure_future(self._atimed_generate(messages))}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return done.pop().result()
+
+            self._count_hedge()
+            pending.add(asyncio.ensure_future(self._atimed_generate(messages)))
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _timed_generate(self, messages: list[dict]) -> LLMResponse:
+        started_at = time.perf_counter()
+        output = generate_json_with(self.inner, messages)
+        self.tracker.record(time.perf_counter() - started_at)
+        return output
+
+    async def _atimed_generate(self, messages: list[dict]) -> LLMResponse:
+        started_at = time.perf_counter()
+        output = await agenerate_json_with(self.inner, messages)
+        self.tracker.record(time.perf_counter() - started_at)
+        return output
+
+    def _count_hedge(self) -> None:
+        with self._lock:
+            self.hedged_requests += 1
@@ -1,8 +1,23 @@
 import json
+from collections.abc import AsyncIterator, Iterator
 
-from .base import LLMClient
+from .base import AsyncLLMClient, LLMClient
+
+STREAM_CHUNK_SIZE = 32
+
+class MockLLMClient(LLMClient, AsyncLLMClient):
+    async def agenerate(self, messages: list[dict]) -> str:
+        return self.generate(messages)
+
+    def stream(self, messages: list[dict]) -> Iterator[str]:
+        text = self.generate(messages)
+        for start in range(0, len(text), STREAM_CHUNK_SIZE):
+            yield text[start:start + STREAM_CHUNK_SIZE]
+
+    async def astream(self, messages: list[dict]) -> AsyncIterator[str]:
+        for chunk in self.stream(messages):
+            yield chunk
 
-class MockLLMClient(LLMClient):
     def generate(self, messages: list[dict]) -> str:
         user_content = _extract_user_text(messages)
 
@@ -1,8 +1,11 @@
+import asyncio
 import json
 import os
-from typing import Optional
+from collections.abc import AsyncIterator, Iterator
+from typing import Optional, Union
 
-from .base import LLMClient
+from .base import AsyncLLMClient, LLMClient, LLMResponse
+from .streaming import StreamUsage
 
 class OpenAILLMClient(LLMClient):
     def __init__(
@@ -11,37 +14,215 @@ class OpenAILLMClient(LLMClient):
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
     ) -> None:
-        try:
-            from dotenv import load_dotenv
-        except ModuleNotFoundError:
-            load_dotenv = None
-
-        if load_dotenv is not None:
-            load_dotenv()
-
-        resolved_api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not resolved_api_key:
-            raise ValueError("OPENAI_API_KEY is required.")
+        resolved_api_key, resolved_model, resolved_base_url = _resolve_openai_settings(
+            api_key=api_key,
+            model=model,
+            base_url=base_url,
+        )
 
         from openai import OpenAI
 
-        self.model = model or os.getenv("OPENAI_MODEL", "gpt-5-mini")
+        self.model = resolved_model
         self.client = OpenAI(
             api_key=resolved_api_key,
-            base_url=base_url or os.getenv("OPENAI_BASE_URL"),
+            base_url=resolved_base_url,
+            **_request_options(timeout=timeout, max_retries=max_retries),
         )
 
     def generate(self, messages: list[dict]) -> str:
+        return self.generate_json(messages).text
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
         response = self.client.chat.completions.create(
             model=self.model,
             messages=messages,
             response_format={"type": "json_object"},
         )
 
-        content = response.choices[0].message.content
-        if not content:
-            raise ValueError("OpenAI returned empty content.")
+        return _parse_json_response(response)
+
+    def stream(self, messages: list[dict]) -> Iterator[Union[str, StreamUsage]]:
+        chunks = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            response_format={"type": "json_object"},
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        usage = None
+        for chunk in chunks:
+            text = _delta_text(chunk)
+            if text:
+                yield text
+            usage = _stream_usage(chunk) or usage
+        if usage is not None:
+            yield usage
+
+class AsyncOpenAILLMClient(AsyncLLMClient):
+    """Async OpenAI client with one tuned connection pool shared by all calls.
+
+    ``max_in_flight`` caps concurrent requests on this client; callers over
+    the cap wait for a slot instead of queueing inside the connection pool,
+    where the wait would count against the request timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        max_in_flight: Optional[int] = None,
+    ) -> None:
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be greater than 0.")
+        resolved_api_key, resolved_model, resolved_base_url = _resolve_openai_settings(
+            api_key=api_key,
+            model=model,
+            base_url=base_url,
+        )
+
+        import httpx
+        from openai import AsyncOpenAI
+
+        self.model = resolved_model
+        self.client = AsyncOpenAI(
+            api_key=resolved_api_key,
+            base_url=resolved_base_url,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                follow_redirects=True,
+            ),
+            **_request_options(timeout=timeout, max_retries=max_retries),
+        )
+        self._semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        return (await self.agenerate_json(messages)).text
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        if self._semaphore is None:
+            response = await self._create(messages)
+        else:
+            async with self._semaphore:
+                response = await self._create(messages)
+
+        return _parse_json_response(response)
+
+    async def astream(self, messages: list[dict]) -> AsyncIterator[Union[str, StreamUsage]]:
+        # The in-flight slot is held until the whole stream is read.
+        if self._semaphore is None:
+            async for text in self._astream(messages):
+                yield text
+        else:
+            async with self._semaphore:
+                async for text in self._astream(messages):
+                    yield text
+
+    async def _create(self, messages: list[dict], *, stream: bool = False):
+        options = {"stream": True, "stream_options": {"include_usage": True}} if stream else {}
+        return await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            response_format={"type": "json_object"},
+            **options,
+        )
+
+    async def _astream(self, messages: list[dict]) -> AsyncIterator[Union[str, StreamUsage]]:
+        chunks = await self._create(messages, stream=True)
+        usage = None
+        async for chunk in chunks:
+            text = _delta_text(chunk)
+            if text:
+                yield text
+            usage = _stream_usage(chunk) or usage
+        if usage is not None:
+            yield usage
+
+    async def aclose(self) -> None:
+        await self.client.close()
+
+def _resolve_openai_settings(
+    *,
+    api_key: Optional[str],
+    model: Optional[str],
+    base_url: Optional[str],
+) -> tuple[str, str, Optional[str]]:
+    try:
+        from dotenv import load_dotenv
+    except ModuleNotFoundError:
+        load_dotenv = None
+
+    if load_dotenv is not None:
+        load_dotenv()
+
+    resolved_api_key = api_key or os.getenv("OPENAI_API_KEY")
+    if not resolved_api_key:
+        raise ValueError("OPENAI_API_KEY is required.")
+
+    return (
+        resolved_api_key,
+        model or os.getenv("OPENAI_MODEL", "gpt-5-mini"),
+        base_url or os.getenv("OPENAI_BASE_URL"),
+    )
+
+def _request_options(
+    *,
+    timeout: Optional[float],
+    max_retries: Optional[int],
+) -> dict:
+    # Unset options keep the SDK defaults (a 10 minute timeout, 2 retries).
+    options = {}
+    if timeout is not None:
+        options["timeout"] = timeout
+    if max_retries is not None:
+        options["max_retries"] = max_retries
+    return options
+
+def _parse_json_response(response) -> LLMResponse:
+    content = response.choices[0].message.content
+    if not content:
+        raise ValueError("OpenAI returned empty content.")
+
+    usage = _usage_fields(response)
+    return LLMResponse(
+        text=content,
+        data=json.loads(content),
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        cached_prompt_tokens=usage.cached_prompt_tokens,
+        model=usage.model,
+    )
+
+def _usage_fields(response) -> StreamUsage:
+    usage = getattr(response, "usage", None)
+    prompt_details = getattr(usage, "prompt_tokens_details", None)
+    return StreamUsage(
+        prompt_tokens=getattr(usage, "prompt_tokens", None),
+        completion_tokens=getattr(usage, "completion_tokens", None),
+        cached_prompt_tokens=getattr(prompt_details, "cached_tokens", None),
+        model=getattr(response, "model", None),
+    )
+
+def _stream_usage(chunk) -> Optional[StreamUsage]:
+    # With include_usage, only the final chunk (with no choices) carries usage.
+    if getattr(chunk, "usage", None) is None:
+        return None
+    return _usage_fields(chunk)
 
-        json.loads(content)
-        return content
\ No newline at end of file
+def _delta_text(chunk) -> Optional[str]:
+    if not chunk.choices:
+        return None
+    return chunk.choices[0].delta.content
@@ -0,0 +1,299 @@
+import asyncio
+import math
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Optional, Tuple, TypeVar
+
+from .base import AsyncLLMClient, LLMClient, LLMResponse, agenerate_json_with, generate_json_with
+
+T = TypeVar("T")
+
+@dataclass(frozen=True)
+class BucketState:
+    # Levels are the capacity left; a reservation may push them below zero,
+    # and the caller then waits until the refill covers the deficit.
+    requests: float
+    tokens: float
+    updated_at: float
+    blocked_until: float = 0.0
+
+class InMemoryRateLimitStore:
+    """Bucket states shared by every thread of one process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: Dict[str, BucketState] = {}
+
+    def transact(
+        self,
+        key: str,
+        fn: Callable[[Optional[BucketState]], Tuple[BucketState, T]],
+    ) -> T:
+        with self._lock:
+            state, value = fn(self._states.get(key))
+            self._states[key] = state
+            return value
+
+class SQLiteRateLimitStore:
+    """Bucket states in a local SQLite file, shared by every process on the host.
+
+    Each update runs in an IMMEDIATE transaction, so concurrent processes see
+    one another's reservations.
+    """
+
+    def __init__(self, path: str | Path, *, timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, requests REAL NOT NULL, tokens REAL NOT NULL, "
+                "updated_at REAL NOT NULL, blocked_until REAL NOT NULL)"
+            )
+
+    def transact(
+        self,
+        key: str,
+        fn: Callable[[Optional[BucketState]], Tuple[BucketState, T]],
+    ) -> T:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT requests, tokens, updated_at, blocked_until FROM rate_limit_buckets WHERE key = ?",
+                (key,),
+            ).fetchone()
+            state, value = fn(BucketState(*row) if row is not None else None)
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets VALUES (?, ?, ?, ?, ?)",
+                (key, state.requests, state.tokens, state.updated_at, state.blocked_until),
+            )
+            connection.execute("COMMIT")
+            return value
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+class RateLimiter:
+    """Token buckets for requests and tokens per minute over a shared store.
+
+    Reservations are taken up front from estimated token counts and corrected
+    with ``adjust`` once the real usage is known. ``backoff`` blocks every
+    caller of the same store key, so one 429 slows all workers down.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        store=None,
+        key: str = "default",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.store = store or InMemoryRateLimitStore()
+        self.key = key
+        # Wall-clock time, so states written by other processes compare.
+        self.clock = clock
+
+    def reserve(self, tokens: int) -> float:
+        """Reserves one request and ``tokens``; returns the seconds to wait first."""
+
+        def update(state: Optional[BucketState]) -> Tuple[BucketState, float]:
+            now = self.clock()
+            state = self._refill(state, now)
+            state = replace(state, requests=state.requests - 1, tokens=state.tokens - tokens)
+            return state, max(
+                0.0,
+                state.blocked_until - now,
+                _deficit_seconds(state.requests, self.requests_per_minute),
+                _deficit_seconds(state.tokens, self.tokens_per_minute),
+            )
+
+        return self.store.transact(self.key, update)
+
+    def adjust(self, tokens: int) -> None:
+        """Charges ``tokens`` more (or refunds, when negative) than reserved."""
+        if tokens == 0:
+            return
+
+        def update(state: Optional[BucketState]) -> Tuple[BucketState, None]:
+            state = self._refill(state, self.clock())
+            return replace(state, tokens=state.tokens - tokens), None
+
+        self.store.transact(self.key, update)
+
+    def backoff(self, seconds: float) -> None:
+        def update(state: Optional[BucketState]) -> Tuple[BucketState, None]:
+            now = self.clock()
+            state = self._refill(state, now)
+            return replace(state, blocked_until=max(state.blocked_until, now + seconds)), None
+
+        self.store.transact(self.key, update)
+
+    def _refill(self, state: Optional[BucketState], now: float) -> BucketState:
+        request_capacity = self.requests_per_minute or math.inf
+        token_capacity = self.tokens_per_minute or math.inf
+        if state is None:
+            return BucketState(requests=request_capacity, tokens=token_capacity, updated_at=now)
+
+        elapsed = max(0.0, now - state.updated_at)
+        return replace(
+            state,
+            requests=_refilled(state.requests, self.requests_per_minute, elapsed),
+            tokens=_refilled(state.tokens, self.tokens_per_minute, elapsed),
+            updated_at=now,
+        )
+
+class RateLimitedLLMClient(LLMClient, AsyncLLMClient):
+    """Paces requests through a ``RateLimiter`` and retries 429 responses.
+
+    A 429 backs off the shared limiter for the server's Retry-After, or an
+    exponential delay with jitter, and the request is retried up to
+    ``max_retries`` times.
+
+    Retries belong to this wrapper alone, so SDK clients along the ``inner``
+    chain must be built with ``max_retries=0`` (``OpenAILLMClient(max_retries=0)``);
+    a throttled call then makes at most ``max_retries + 1`` requests on the
+    limiter's schedule. The async methods run limiter updates on a worker
+    thread, since a shared store may block on a file lock.
+    """
+
+    def __init__(
+        self,
+        inner,
+        limiter: RateLimiter,
+        *,
+        max_retries: int = 5,
+        base_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+        expected_output_tokens: int = 1000,
+    ) -> None:
+        _require_no_sdk_retries(inner)
+        self.inner = inner
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.expected_output_tokens = expected_output_tokens
+
+    def generate(self, messages: list[dict]) -> str:
+        return self.generate_json(messages).text
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        estimated = estimate_message_tokens(messages) + self.expected_output_tokens
+        for attempt in range(self.max_retries + 1):
+            time.sleep(self.limiter.reserve(estimated))
+            try:
+                response = generate_json_with(self.inner, messages)
+            except Exception as exc:
+                if not is_rate_limit_error(exc) or attempt == self.max_retries:
+                    raise
+                self._back_off(exc, attempt, estimated)
+                continue
+            self._correct(response, estimated)
+            return response
+        raise AssertionError("unreachable")
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        return (await self.agenerate_json(messages)).text
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        estimated = estimate_message_tokens(messages) + self.expected_output_tokens
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(await asyncio.to_thread(self.limiter.reserve, estimated))
+            try:
+                response = await agenerate_json_with(self.inner, messages)
+            except Exception as exc:
+                if not is_rate_limit_error(exc) or attempt == self.max_retries:
+                    raise
+                await asyncio.to_thread(self._back_off, exc, attempt, estimated)
+                continue
+            await asyncio.to_thread(self._correct, response, estimated)
+            return response
+        raise AssertionError("unreachable")
+
+    def _correct(self, response: LLMResponse, estimated: int) -> None:
+        if response.total_tokens is not None:
+            self.limiter.adjust(response.total_tokens - estimated)
+
+    def _back_off(self, exc: Exception, attempt: int, estimated: int) -> None:
+        # A rejected request consumed no tokens, so its reservation is refunded.
+        self.limiter.adjust(-estimated)
+        seconds = _retry_after_seconds(exc)
+        if seconds is None:
+            delay = min(self.max_backoff_seconds, self.base_backoff_seconds * 2**attempt)
+            seconds = delay * random.uniform(0.5, 1.0)
+        self.limiter.backoff(seconds)
+
+def estimate_message_tokens(
+    messages: list[dict],
+    *,
+    chars_per_token: float = 2.0,
+    image_tokens: int = 850,
+) -> int:
+    # Korean text runs close to one token per one or two characters, so the
+    # default errs high; usage from the response corrects the estimate.
+    chars = 0
+    images = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if not isinstance(part, dict):
+                    continue
+                if isinstance(part.get("text"), str):
+                    chars += len(part["text"])
+                elif part.get("type") == "image_url":
+                    images += 1
+    return math.ceil(chars / chars_per_token) + images * image_tokens + 4 * len(messages)
+
+def _require_no_sdk_retries(client) -> None:
+    # OpenAILLMClient keeps the SDK client on .client; wrappers keep theirs on .inner.
+    # The inner clients may be shared, so they are checked rather than reconfigured.
+    while client is not None:
+        sdk_client = getattr(client, "client", None)
+        if sdk_client is not None and getattr(sdk_client, "max_retries", 0):
+            raise ValueError(
+                f"{type(client).__name__} retries on its own; build it with max_retries=0 "
+                "to wrap it in RateLimitedLLMClient."
+            )
+        client = getattr(client, "inner", None)
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    return getattr(exc, "status_code", None) == 429 or type(exc).__name__ == "RateLimitError"
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+def _refilled(level: float, per_minute: Optional[float], elapsed: float) -> float:
+    if per_minute is None:
+        return math.inf
+    return min(per_minute, level + elapsed * per_minute / 60)
+
+def _deficit_seconds(level: float, per_minute: Optional[float]) -> float:
+    if per_minute is None or level >= 0:
+        return 0.0
+    return -level * 60 / per_minute
@@ -0,0 +1,194 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Generator, Iterator
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from .base import LLMResponse, agenerate_json_with, generate_json_with
+
+_WHITESPACE = " \t\r\n"
+
+FieldCallback = Callable[[str, Any], None]
+
+@dataclass(frozen=True)
+class StreamUsage:
+    """Token usage a client's ``stream`` yields after its last text chunk."""
+
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    cached_prompt_tokens: Optional[int] = None
+    model: Optional[str] = None
+
+UsageSink = Callable[[StreamUsage], None]
+
+class IncrementalJSONObjectParser:
+    """Parses a streamed JSON object and emits each top-level field once complete.
+
+    A field is complete when the comma or closing brace after its value
+    arrives. ``close`` parses the whole buffer, so a malformed or truncated
+    document still raises ``json.JSONDecodeError`` at the end.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._key_start: Optional[int] = None
+        self._key_end: Optional[int] = None
+        self._value_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        self._text += chunk
+        fields: List[Tuple[str, Any]] = []
+        text = self._text
+        for pos in range(self._pos, len(text)):
+            char = text[pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key_end is None and self._value_start is None:
+                        self._key_end = pos + 1
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._key_start is None:
+                    self._key_start = pos
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 1:
+                    self._finish_field(text, pos, fields)
+                self._depth -= 1
+            elif char == ":" and self._depth == 1 and self._value_start is None:
+                self._value_start = pos + 1
+            elif char == "," and self._depth == 1:
+                self._finish_field(text, pos, fields)
+        self._pos = len(text)
+        return fields
+
+    def close(self) -> dict:
+        document = json.loads(self._text)
+        if not isinstance(document, dict):
+            raise ValueError("Streamed JSON is not an object.")
+        return document
+
+    def _finish_field(self, text: str, end: int, fields: List[Tuple[str, Any]]) -> None:
+        if self._key_start is not None and self._key_end is not None and self._value_start is not None:
+            key = json.loads(text[self._key_start:self._key_end])
+            value = json.loads(text[self._value_start:end].strip(_WHITESPACE))
+            fields.append((key, value))
+        self._key_start = None
+        self._key_end = None
+        self._value_start = None
+
+def stream_with(
+    llm_client,
+    messages: list[dict],
+    *,
+    usage_sink: Optional[UsageSink] = None,
+) -> Iterator[str]:
+    """Yields the text chunks of a completion; usage goes to ``usage_sink``.
+
+    Clients without a stream method answer in one chunk and report no usage;
+    JSON callers use iter_json_fields_with, which keeps it.
+    """
+    stream = getattr(llm_client, "stream", None)
+    if stream is None:
+        yield llm_client.generate(messages)
+        return
+    for part in stream(messages):
+        if isinstance(part, StreamUsage):
+            if usage_sink is not None:
+                usage_sink(part)
+        else:
+            yield part
+
+async def astream_with(
+    llm_client,
+    messages: list[dict],
+    *,
+    usage_sink: Optional[UsageSink] = None,
+) -> AsyncIterator[str]:
+    astream = getattr(llm_client, "astream", None)
+    if astream is not None:
+        async for part in astream(messages):
+            if isinstance(part, StreamUsage):
+                if usage_sink is not None:
+                    usage_sink(part)
+            else:
+                yield part
+        return
+
+    agenerate = getattr(llm_client, "agenerate", None)
+    if agenerate is not None:
+        yield await agenerate(messages)
+    else:
+        yield await asyncio.to_thread(llm_client.generate, messages)
+
+def iter_json_fields_with(
+    llm_client,
+    messages: list[dict],
+) -> Generator[Tuple[str, Any], None, LLMResponse]:
+    """Yields each completed top-level field of a JSON completion; returns the response.
+
+    Clients without ``stream`` (including the caching, rate-limiting, hedging
+    and cassette wrappers) answer through ``generate_json_with``, so their
+    caching, pacing, usage and ``cache_hit`` still apply and every field
+    arrives at the end.
+    """
+    if getattr(llm_client, "stream", None) is None:
+        response = generate_json_with(llm_client, messages)
+        yield from response.data.items()
+        return response
+
+    parser = IncrementalJSONObjectParser()
+    chunks: List[str] = []
+    usage: List[StreamUsage] = []
+    for chunk in stream_with(llm_client, messages, usage_sink=usage.append):
+        chunks.append(chunk)
+        yield from parser.feed(chunk)
+    return build_streamed_response("".join(chunks), parser.close(), usage[-1] if usage else None)
+
+def stream_json_with(llm_client, messages: list[dict], on_field: FieldCallback) -> LLMResponse:
+    """Streams a JSON completion, calling ``on_field`` per completed top-level field."""
+    fields = iter_json_fields_with(llm_client, messages)
+    try:
+        while True:
+            on_field(*next(fields))
+    except StopIteration as finished:
+        return finished.value
+
+async def astream_json_with(llm_client, messages: list[dict], on_field: FieldCallback) -> LLMResponse:
+    if getattr(llm_client, "astream", None) is None:
+        response = await agenerate_json_with(llm_client, messages)
+        for key, value in response.data.items():
+            on_field(key, value)
+        return response
+
+    parser = IncrementalJSONObjectParser()
+    chunks: List[str] = []
+    usage: List[StreamUsage] = []
+    async for chunk in astream_with(llm_client, messages, usage_sink=usage.append):
+        chunks.append(chunk)
+        for key, value in parser.feed(chunk):
+            on_field(key, value)
+    return build_streamed_response("".join(chunks), parser.close(), usage[-1] if usage else None)
+
+def build_streamed_response(text: str, data: dict, usage: Optional[StreamUsage]) -> LLMResponse:
+    if usage is None:
+        return LLMResponse(text=text, data=data)
+    return LLMResponse(
+        text=text,
+        data=data,
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        cached_prompt_tokens=usage.cached_prompt_tokens,
+        model=usage.model,
+    )
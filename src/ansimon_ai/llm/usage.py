@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+@dataclass(frozen=True)
+class ModelPricing:
+    # USD per million tokens.
+    input: float
+    cached_input: float
+    output: float
+
+# Published list prices; dated model snapshots match by prefix.
+MODEL_PRICING: Dict[str, ModelPricing] = {
+    "gpt-5": ModelPricing(input=1.25, cached_input=0.125, output=10.0),
+    "gpt-5-mini": ModelPricing(input=0.25, cached_input=0.025, output=2.0),
+    "gpt-5-nano": ModelPricing(input=0.05, cached_input=0.005, output=0.4),
+    "gpt-4.1": ModelPricing(input=2.0, cached_input=0.5, output=8.0),
+    "gpt-4.1-mini": ModelPricing(input=0.4, cached_input=0.1, output=1.6),
+    "gpt-4o": ModelPricing(input=2.5, cached_input=1.25, output=10.0),
+    "gpt-4o-mini": ModelPricing(input=0.15, cached_input=0.075, output=0.6),
+}
+
+def find_model_pricing(
+    model: Optional[str],
+    pricing: Optional[Dict[str, ModelPricing]] = None,
+) -> Optional[ModelPricing]:
+    if model is None:
+        return None
+    if pricing is None:
+        pricing = MODEL_PRICING
+    matches = [name for name in pricing if model == name or model.startswith(f"{name}-")]
+    if not matches:
+        return None
+    return pricing[max(matches, key=len)]
+
+def cached_prompt_ratio(prompt_tokens: int, cached_prompt_tokens: int) -> Optional[float]:
+    if prompt_tokens <= 0:
+        return None
+    return cached_prompt_tokens / prompt_tokens
+
+def estimate_llm_cost(
+    model: Optional[str],
+    *,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_prompt_tokens: int = 0,
+    pricing: Optional[Dict[str, ModelPricing]] = None,
+) -> Optional[float]:
+    model_pricing = find_model_pricing(model, pricing)
+    if model_pricing is None:
+        return None
+    # prompt_tokens includes the cached ones, which are billed at a discount.
+    uncached_prompt_tokens = prompt_tokens - cached_prompt_tokens
+    return (
+        uncached_prompt_tokens * model_pricing.input
+        + cached_prompt_tokens * model_pricing.cached_input
+        + completion_tokens * model_pricing.output
+    ) / 1_000_000
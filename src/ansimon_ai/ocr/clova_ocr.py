@@ -11,7 +11,7 @@ from PIL import Image as PILImage
 from .layout import assign_speaker_sides
 from .types import OCRResult, OCRSegment, OCRTable, OCRTableCell, OCRTableLine, OCRTableWord, OCRVertex
 
-ImageInput = str | Path | PILImage.Image
+ImageInput = str | Path | bytes | PILImage.Image
 _TABLE_DETECTION_DISABLED_CODE = "0028"
 
 def clova_ocr_image_to_result(
@@ -121,12 +121,33 @@ def _infer_image_format(path: Path) -> str:
         raise ValueError(f"Unsupported image format for CLOVA OCR: {suffix}")
     return mapping[suffix]
 
+def _infer_image_bytes_format(image_bytes: bytes) -> str:
+    mapping = {
+        "JPEG": "jpg",
+        "PNG": "png",
+        "TIFF": "tiff",
+        "BMP": "bmp",
+        "WEBP": "webp",
+    }
+    try:
+        with PILImage.open(BytesIO(image_bytes)) as image:
+            image_format = image.format
+    except OSError as exc:
+        raise ValueError("Unsupported image bytes for CLOVA OCR.") from exc
+    if image_format not in mapping:
+        raise ValueError(f"Unsupported image format for CLOVA OCR: {image_format}")
+    return mapping[image_format]
+
 def _read_image_input(image_input: ImageInput) -> tuple[bytes, str, str]:
     if isinstance(image_input, PILImage.Image):
         buffer = BytesIO()
         image_input.save(buffer, format="PNG")
         return buffer.getvalue(), "png", "image.png"
 
+    if isinstance(image_input, bytes):
+        image_format = _infer_image_bytes_format(image_input)
+        return image_input, image_format, f"image.{image_format}"
+
     file_path = Path(image_input)
     return file_path.read_bytes(), _infer_image_format(file_path), file_path.name
 
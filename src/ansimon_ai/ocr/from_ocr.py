@@ -1,6 +1,7 @@
 import os
 import re
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
@@ -11,10 +12,10 @@ from .types import OCRSegment
 from .clova_ocr import clova_ocr_image_to_result
 from .table_formatting import format_ocr_result_text, is_tabular_table
 
-from ansimon_ai.structuring.types import StructuringInput, StructuringSegment
-from ansimon_ai.structuring.timestamp_utils import extract_timestamp
+from ansimon_ai.structuring.coalesce import CoalesceConfig, SourceSegment, coalesce_segments
+from ansimon_ai.structuring.types import StructuringInput
 
-ImageInput = str | Path | PILImage.Image
+ImageInput = str | Path | bytes | PILImage.Image
 
 _UI_EDGE_CHARS = "<>=_+-@…·|~ "
 _UI_ONLY_VALUES = {"글", "메시지 입력", "message"}
@@ -110,26 +111,30 @@ def _apply_speaker_prefix(text: str, speaker_side: Optional[str]) -> str:
 def build_structuring_input_from_ocr(
     ocr: OCRResult,
     metadata_fallback_timestamp: Optional[datetime] = None,
+    *,
+    coalesce: Optional[CoalesceConfig] = None,
 ) -> StructuringInput:
     segments = preprocess_ocr_segments(ocr.segments)
     full_text = _build_ocr_full_text(ocr, segments)
-    return StructuringInput(
-        modality="text",
-        source_type="ocr",
-        language=ocr.language,
-        full_text=full_text or ocr.full_text,
-        segments=[
-            StructuringSegment(
+    coalesced = coalesce_segments(
+        [
+            SourceSegment(
                 text=seg.get("text", ""),
                 start=seg.get("start") if seg.get("start") is not None else 0.0,
                 end=seg.get("end") if seg.get("end") is not None else 0.0,
-                timestamp=extract_timestamp(
-                    seg.get("text", ""),
-                    fallback=metadata_fallback_timestamp,
-                ),
+                speaker_side=seg.get("speaker_side"),
             )
             for seg in segments
         ],
+        config=coalesce,
+        metadata_fallback_timestamp=metadata_fallback_timestamp,
+    )
+    return StructuringInput(
+        modality="text",
+        source_type="ocr",
+        language=ocr.language,
+        full_text=full_text or ocr.full_text,
+        segments=coalesced.segments,
     )
 
 def _build_ocr_full_text(ocr: OCRResult, segments: list[dict]) -> str:
@@ -283,6 +288,8 @@ def ocr_image_to_result(
 def _load_image_input(image_input: ImageInput) -> PILImage.Image:
     if isinstance(image_input, PILImage.Image):
         return image_input.copy()
+    if isinstance(image_input, bytes):
+        image_input = BytesIO(image_input)
 
     with PILImage.open(image_input) as image:
         return image.copy()
@@ -1,9 +1,10 @@
 from typing import List, Tuple
-import pdfplumber
 
-def detect_pdf_type(pdf_path: str, min_text_length: int = 10) -> Tuple[str, int]:
+from .extract_text_pdf import PdfInput, open_pdf
+
+def detect_pdf_type(pdf_path: PdfInput, min_text_length: int = 10) -> Tuple[str, int]:
     text_page_count = 0
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         for page in pdf.pages:
             text = page.extract_text() or ""
             if len(text.strip()) >= min_text_length:
@@ -13,9 +14,9 @@ def detect_pdf_type(pdf_path: str, min_text_length: int = 10) -> Tuple[str, int]
     else:
         return "image", 0
 
-def detect_pdf_page_types(pdf_path: str, min_text_length: int = 10) -> List[str]:
+def detect_pdf_page_types(pdf_path: PdfInput, min_text_length: int = 10) -> List[str]:
     page_types: List[str] = []
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         for page in pdf.pages:
             text = page.extract_text() or ""
             if len(text.strip()) >= min_text_length:
@@ -1,26 +1,23 @@
 from datetime import datetime
 from typing import List, Optional
-from ..structuring.types import StructuringInput, StructuringSegment
-from ..structuring.timestamp_utils import extract_timestamp
+from ..structuring.coalesce import CoalesceConfig, SourceSegment, coalesce_segments
+from ..structuring.types import StructuringInput
 
 def build_structuring_input_from_document(
     texts: List[str],
     metadata_fallback_timestamp: Optional[datetime] = None,
+    *,
+    coalesce: Optional[CoalesceConfig] = None,
 ) -> StructuringInput:
-    segments = []
-    for line in texts:
-        segments.append(
-            StructuringSegment(
-                text=line,
-                start=0.0,
-                end=0.0,
-                timestamp=extract_timestamp(line, fallback=metadata_fallback_timestamp),
-            )
-        )
+    coalesced = coalesce_segments(
+        [SourceSegment(text=line) for line in texts],
+        config=coalesce,
+        metadata_fallback_timestamp=metadata_fallback_timestamp,
+    )
     return StructuringInput(
         modality="text",
         source_type="document",
         language=None,
         full_text="\n".join(texts),
-        segments=segments
-    )
\ No newline at end of file
+        segments=coalesced.segments
+    )
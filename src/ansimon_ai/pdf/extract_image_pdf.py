@@ -1,15 +1,25 @@
+from pathlib import Path
 from typing import List, Optional
 from pdf2image import convert_from_path
 
 from ansimon_ai.ocr.from_ocr import ocr_image_to_result
 from ansimon_ai.ocr.table_formatting import format_ocr_result_text
 
+PdfInput = str | Path | bytes
+
+def _convert_pdf_to_images(pdf_path: PdfInput, **kwargs):
+    if isinstance(pdf_path, bytes):
+        from pdf2image import convert_from_bytes
+
+        return convert_from_bytes(pdf_path, **kwargs)
+    return convert_from_path(pdf_path, **kwargs)
+
 def extract_text_from_image_pdf(
-    pdf_path: str,
+    pdf_path: PdfInput,
     lang: str = "kor",
     engine: Optional[str] = None,
 ) -> List[str]:
-    images = convert_from_path(pdf_path)
+    images = _convert_pdf_to_images(pdf_path)
     texts = []
     for img in images:
         result = ocr_image_to_result(img, engine=engine, lang=lang)
@@ -17,12 +27,12 @@ def extract_text_from_image_pdf(
     return texts
 
 def extract_text_from_image_pdf_page(
-    pdf_path: str,
+    pdf_path: PdfInput,
     page_index: int,
     lang: str = "kor",
     engine: Optional[str] = None,
 ) -> str:
-    images = convert_from_path(
+    images = _convert_pdf_to_images(
         pdf_path,
         first_page=page_index + 1,
         last_page=page_index + 1,
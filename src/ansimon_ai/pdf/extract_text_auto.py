@@ -1,10 +1,10 @@
 from typing import List, Optional
 from .detect_pdf_type import detect_pdf_page_types, detect_pdf_type
-from .extract_text_pdf import extract_text_from_pdf, extract_text_from_pdf_page
+from .extract_text_pdf import PdfInput, extract_text_from_pdf, extract_text_from_pdf_page
 from .extract_image_pdf import extract_text_from_image_pdf, extract_text_from_image_pdf_page
 
 def extract_text_auto(
-    pdf_path: str,
+    pdf_path: PdfInput,
     lang: str = "kor",
     engine: Optional[str] = None,
 ) -> List[str]:
@@ -1,4 +1,5 @@
 from io import BytesIO
+from pathlib import Path
 import re
 from typing import Optional
 from zipfile import ZipFile
@@ -8,6 +9,8 @@ from PIL import Image, UnidentifiedImageError
 from ansimon_ai.ocr.from_ocr import ocr_image_to_result
 from ansimon_ai.ocr.table_formatting import format_ocr_result_text
 
+DocxInput = str | Path | bytes
+
 def _normalize_line(text: str) -> str:
     text = text.replace("\r", " ").replace("\n", " ")
     text = re.sub(r"\s+", " ", text).strip()
@@ -31,8 +34,13 @@ def _append_normalized_lines(lines: list[str], text: str) -> None:
         if normalized:
             lines.append(normalized)
 
+def _open_docx_source(docx_path: DocxInput):
+    if isinstance(docx_path, bytes):
+        return BytesIO(docx_path)
+    return docx_path
+
 def _extract_text_from_docx_images(
-    docx_path: str,
+    docx_path: DocxInput,
     *,
     engine: Optional[str] = None,
     lang: str = "kor",
@@ -40,7 +48,7 @@ def _extract_text_from_docx_images(
     image_texts: list[str] = []
     supported_suffixes = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp"}
 
-    with ZipFile(docx_path) as archive:
+    with ZipFile(_open_docx_source(docx_path)) as archive:
         image_names = sorted(
             name
             for name in archive.namelist()
@@ -63,14 +71,14 @@ def _extract_text_from_docx_images(
     return image_texts
 
 def extract_text_from_docx(
-    docx_path: str,
+    docx_path: DocxInput,
     *,
     engine: Optional[str] = None,
     lang: str = "kor",
 ) -> str:
     from docx import Document
 
-    document = Document(docx_path)
+    document = Document(_open_docx_source(docx_path))
     lines: list[str] = []
 
     for paragraph in document.paragraphs:
@@ -1,15 +1,24 @@
+from io import BytesIO
+from pathlib import Path
 import pdfplumber
 from typing import List
 
-def extract_text_from_pdf(pdf_path: str) -> List[str]:
+PdfInput = str | Path | bytes
+
+def open_pdf(pdf_path: PdfInput):
+    if isinstance(pdf_path, bytes):
+        return pdfplumber.open(BytesIO(pdf_path))
+    return pdfplumber.open(pdf_path)
+
+def extract_text_from_pdf(pdf_path: PdfInput) -> List[str]:
     texts = []
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         for page in pdf.pages:
             text = page.extract_text() or ""
             texts.append(text)
     return texts
 
-def extract_text_from_pdf_page(pdf_path: str, page_index: int) -> str:
-    with pdfplumber.open(pdf_path) as pdf:
+def extract_text_from_pdf_page(pdf_path: PdfInput, page_index: int) -> str:
+    with open_pdf(pdf_path) as pdf:
         page = pdf.pages[page_index]
         return page.extract_text() or ""
\ No newline at end of file
@@ -0,0 +1,75 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Tuple
+
+PROMPT_DIR = Path(__file__).parent
+
+@dataclass(frozen=True)
+class PromptAsset:
+    name: str
+    version: str
+    text: str
+    sha256: str
+
+    @property
+    def fingerprint(self) -> str:
+        return f"{self.name}@{self.version}:{self.sha256[:12]}"
+
+class PromptAssetRegistry:
+    """Loads each registered prompt file once and keeps its text and hash.
+
+    Prompts are read on first use, so a process pays one disk read per
+    asset and every call gets the same string object.
+    """
+
+    def __init__(self, directory: Path = PROMPT_DIR) -> None:
+        self.directory = directory
+        self._sources: Dict[str, Tuple[str, str]] = {}
+        self._assets: Dict[str, PromptAsset] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, file_name: str, *, version: str) -> None:
+        with self._lock:
+            self._sources[name] = (file_name, version)
+            self._assets.pop(name, None)
+
+    def path(self, name: str) -> Path:
+        file_name, _ = self._sources[name]
+        return self.directory / file_name
+
+    def get(self, name: str) -> PromptAsset:
+        asset = self._assets.get(name)
+        if asset is not None:
+            return asset
+
+        with self._lock:
+            asset = self._assets.get(name)
+            if asset is None:
+                file_name, version = self._sources[name]
+                text = (self.directory / file_name).read_text(encoding="utf-8")
+                asset = PromptAsset(
+                    name=name,
+                    version=version,
+                    text=text,
+                    sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+                )
+                self._assets[name] = asset
+        return asset
+
+    def fingerprints(self) -> Dict[str, str]:
+        return {name: self.get(name).fingerprint for name in sorted(self._sources)}
+
+PROMPT_ASSETS = PromptAssetRegistry()
+PROMPT_ASSETS.register("structuring", "system_prompt_v0.txt", version="v0")
+PROMPT_ASSETS.register(
+    "complaint_document",
+    "complaint_document_system_prompt_v0.txt",
+    version="v0",
+)
+PROMPT_ASSETS.register(
+    "damage_facts_statement",
+    "damage_facts_statement_system_prompt_v0.txt",
+    version="v0",
+)
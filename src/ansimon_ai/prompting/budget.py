@@ -0,0 +1,203 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from schemas.complaint_writing import ComplaintWritingAiInput
+from ansimon_ai.llm.rate_limit import estimate_message_tokens
+from ansimon_ai.prompting.build_messages import (
+    build_complaint_document_messages,
+    build_structuring_messages,
+    build_victim_video_messages,
+)
+from ansimon_ai.prompting.segments import SegmentEncoding, resolve_segment_encoding
+from ansimon_ai.structuring.types import StructuringInput, StructuringSegment
+from ansimon_ai.video import ExtractedVideoFrame
+
+@dataclass(frozen=True)
+class TokenBudget:
+    """Preflight cap on the prompt tokens of one request.
+
+    Estimates use the rate limiter's heuristic: ``chars_per_token`` for text
+    and a flat ``image_tokens`` per image.
+    """
+
+    max_prompt_tokens: int
+    chars_per_token: float = 2.0
+    image_tokens: int = 850
+    min_frames: int = 1
+
+    def estimate(self, messages: list[dict]) -> int:
+        return estimate_message_tokens(
+            messages,
+            chars_per_token=self.chars_per_token,
+            image_tokens=self.image_tokens,
+        )
+
+@dataclass
+class BudgetReport:
+    budget_tokens: int
+    original_tokens: int
+    estimated_tokens: int
+    trimmed: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def within_budget(self) -> bool:
+        return self.estimated_tokens <= self.budget_tokens
+
+    def record(self, stage: Optional[Dict[str, Any]]) -> None:
+        if stage is None:
+            return
+        stage["estimated_prompt_tokens"] = self.estimated_tokens
+        if self.trimmed:
+            stage["trimmed"] = dict(self.trimmed)
+
+class TokenBudgetExceededError(ValueError):
+    def __init__(self, report: BudgetReport) -> None:
+        super().__init__(
+            f"Prompt needs about {report.estimated_tokens} tokens after trimming "
+            f"{report.trimmed or 'nothing'}; the budget is {report.budget_tokens}."
+        )
+        self.report = report
+
+def fit_structuring_messages(
+    struct_input: StructuringInput,
+    budget: TokenBudget,
+    *,
+    segment_encoding: Optional[SegmentEncoding] = None,
+) -> Tuple[list[dict], BudgetReport]:
+    """Builds structuring messages within budget.
+
+    Switches to the compact segment encoding first, then drops the least
+    useful segments: duplicates and empty ones, then short ones without a
+    timestamp. full_text is never trimmed, since anchors index into it; an
+    input whose text alone is over budget needs windowing instead.
+    """
+    messages = build_structuring_messages(struct_input, segment_encoding=segment_encoding)
+    report = _report(budget, budget.estimate(messages))
+    if report.within_budget:
+        return messages, report
+
+    if resolve_segment_encoding(struct_input, segment_encoding) != "compact":
+        segment_encoding = "compact"
+        messages = build_structuring_messages(struct_input, segment_encoding=segment_encoding)
+        report.estimated_tokens = budget.estimate(messages)
+        report.trimmed["segment_encoding"] = 1
+        if report.within_budget:
+            return messages, report
+
+    segments = struct_input.segments
+    drop_order = _segment_drop_order(segments)
+
+    def build(drop_count: int) -> list[dict]:
+        dropped = set(drop_order[:drop_count])
+        kept = [segment for index, segment in enumerate(segments) if index not in dropped]
+        trimmed_input = struct_input.model_copy(update={"segments": kept})
+        return build_structuring_messages(trimmed_input, segment_encoding=segment_encoding)
+
+    drop_count, messages = _fit(build, len(drop_order), budget)
+    report.estimated_tokens = budget.estimate(messages)
+    if drop_count:
+        report.trimmed["segments"] = drop_count
+    return _checked(messages, report)
+
+def fit_video_frames(
+    frames: Sequence[ExtractedVideoFrame],
+    budget: TokenBudget,
+    *,
+    file_name: Optional[str] = None,
+) -> Tuple[list[dict], BudgetReport]:
+    """Builds video messages with as many evenly spaced frames as fit."""
+    # Frames are sized without encoding them; each adds one image and a caption.
+    base_tokens = budget.estimate(build_victim_video_messages(frames=[], file_name=file_name))
+    frame_tokens = [
+        budget.image_tokens
+        + len(f"Scene at {frame.frame_timestamp_seconds} seconds") / budget.chars_per_token
+        for frame in frames
+    ]
+
+    def tokens_for(count: int) -> int:
+        kept = _evenly_spaced(list(range(len(frames))), count)
+        return math.ceil(base_tokens + sum(frame_tokens[index] for index in kept))
+
+    report = _report(budget, tokens_for(len(frames)))
+    keep = len(frames)
+    while keep > budget.min_frames and tokens_for(keep) > budget.max_prompt_tokens:
+        keep -= 1
+    kept_frames = _evenly_spaced(list(frames), keep)
+
+    messages = build_victim_video_messages(frames=kept_frames, file_name=file_name)
+    report.estimated_tokens = budget.estimate(messages)
+    if keep < len(frames):
+        report.trimmed["frames"] = len(frames) - keep
+    return _checked(messages, report)
+
+def fit_writing_messages(
+    ai_input: ComplaintWritingAiInput,
+    budget: TokenBudget,
+    *,
+    build: Callable[[ComplaintWritingAiInput], list[dict]] = build_complaint_document_messages,
+) -> Tuple[list[dict], BudgetReport]:
+    """Builds writing messages, dropping trailing structured_contexts to fit."""
+    messages = build(ai_input)
+    report = _report(budget, budget.estimate(messages))
+    contexts = ai_input.structured_contexts or []
+    if report.within_budget or not contexts:
+        return _checked(messages, report)
+
+    def build_trimmed(drop_count: int) -> list[dict]:
+        kept = contexts[:len(contexts) - drop_count]
+        return build(ai_input.model_copy(update={"structured_contexts": kept or None}))
+
+    drop_count, messages = _fit(build_trimmed, len(contexts), budget)
+    report.estimated_tokens = budget.estimate(messages)
+    if drop_count:
+        report.trimmed["structured_contexts"] = drop_count
+    return _checked(messages, report)
+
+def _report(budget: TokenBudget, tokens: int) -> BudgetReport:
+    return BudgetReport(
+        budget_tokens=budget.max_prompt_tokens,
+        original_tokens=tokens,
+        estimated_tokens=tokens,
+    )
+
+def _checked(messages: list[dict], report: BudgetReport) -> Tuple[list[dict], BudgetReport]:
+    if not report.within_budget:
+        raise TokenBudgetExceededError(report)
+    return messages, report
+
+def _fit(
+    build: Callable[[int], list[dict]],
+    max_drop: int,
+    budget: TokenBudget,
+) -> Tuple[int, list[dict]]:
+    # Smallest drop count that fits; the estimate only shrinks as more goes.
+    low, high = 1, max_drop
+    best = (max_drop, build(max_drop))
+    while low <= high:
+        middle = (low + high) // 2
+        messages = build(middle)
+        if budget.estimate(messages) <= budget.max_prompt_tokens:
+            best = (middle, messages)
+            high = middle - 1
+        else:
+            low = middle + 1
+    return best
+
+def _segment_drop_order(segments: Sequence[StructuringSegment]) -> List[int]:
+    seen = set()
+    ranked = []
+    for index, segment in enumerate(segments):
+        text = segment.text.strip()
+        redundant = not text or text in seen
+        seen.add(text)
+        ranked.append(((not redundant, segment.timestamp is not None, len(text)), index))
+    return [index for _, index in sorted(ranked)]
+
+def _evenly_spaced(items: List[Any], count: int) -> List[Any]:
+    if count >= len(items):
+        return items
+    if count <= 1:
+        return items[:count]
+    step = (len(items) - 1) / (count - 1)
+    return [items[round(position * step)] for position in range(count)]
@@ -1,34 +1,33 @@
 import base64
 import json
 from pathlib import Path
+from typing import Optional
 
 from schemas.complaint_writing import ComplaintWritingAiInput
+from ansimon_ai.prompting.assets import PROMPT_ASSETS
+from ansimon_ai.prompting.segments import SegmentEncoding, encode_segments
 from ansimon_ai.structuring.types import StructuringInput
 from ansimon_ai.video import ExtractedVideoFrame
 
-PROMPT_PATH = Path(__file__).parent / "system_prompt_v0.txt"
-COMPLAINT_DOCUMENT_PROMPT_PATH = (
-    Path(__file__).parent / "complaint_document_system_prompt_v0.txt"
-)
-DAMAGE_FACTS_STATEMENT_PROMPT_PATH = (
-    Path(__file__).parent / "damage_facts_statement_system_prompt_v0.txt"
-)
+PROMPT_PATH = PROMPT_ASSETS.path("structuring")
+COMPLAINT_DOCUMENT_PROMPT_PATH = PROMPT_ASSETS.path("complaint_document")
+DAMAGE_FACTS_STATEMENT_PROMPT_PATH = PROMPT_ASSETS.path("damage_facts_statement")
 
 def load_system_prompt() -> str:
-    return PROMPT_PATH.read_text(encoding="utf-8")
+    return PROMPT_ASSETS.get("structuring").text
 
 def load_complaint_document_system_prompt() -> str:
-    return COMPLAINT_DOCUMENT_PROMPT_PATH.read_text(encoding="utf-8")
+    return PROMPT_ASSETS.get("complaint_document").text
 
 def load_damage_facts_statement_system_prompt() -> str:
-    return DAMAGE_FACTS_STATEMENT_PROMPT_PATH.read_text(encoding="utf-8")
+    return PROMPT_ASSETS.get("damage_facts_statement").text
 
-def build_structuring_messages(struct_input: StructuringInput) -> list[dict]:
-    segments_json = json.dumps(
-        [seg.model_dump(mode="json") for seg in struct_input.segments],
-        ensure_ascii=False,
-        indent=2,
-    )
+def build_structuring_messages(
+    struct_input: StructuringInput,
+    *,
+    segment_encoding: Optional[SegmentEncoding] = None,
+) -> list[dict]:
+    segments_section = encode_segments(struct_input, segment_encoding)
     stt_section = _build_stt_context_section(struct_input)
 
     return [
@@ -42,79 +41,86 @@ def build_structuring_messages(struct_input: StructuringInput) -> list[dict]:
                 f"{stt_section}"
                 "### INPUT TEXT (anchor base)\n\n"
                 f"{struct_input.full_text}\n\n"
-                "### SEGMENTS (json)\n\n"
-                f"{segments_json}"
+                f"{segments_section}"
             ),
         },
     ]
 
+_STT_INTERPRETATION_NOTE = (
+    "### STT INTERPRETATION NOTE\n\n"
+    "For call or conversation evidence, summarize the ordered flow of contact, "
+    "pressure, refusal, warning, and response instead of replaying every line. "
+    "Use `피해자` or `상대방` in the final Korean title/description when the role "
+    "is clear; omit the subject only when it is unclear. Do not replace unclear "
+    "subjects with analytic phrases such as `한쪽`, `응답 측`, or `전화를 건 측`. "
+    "Do not infer the aggressor or threat evidence from swear words or reporting/"
+    "legal warnings alone. If the call involves an unknown number, another number "
+    "after blocking, or monitoring context, treat that as contact or block-bypass "
+    "context before interpreting later warnings. Korean response phrases such as "
+    "`신고한다`, `끝까지 간다`, or `고소한다` are possible defensive reporting/"
+    "legal-response language in that context. Because STT text can contain "
+    "misrecognitions, avoid direct quotation unless wording is short, clear, and "
+    "important; summarize awkward phrases as `취지의 발언`, `표현`, or `언급`.\n\n"
+)
+
+_VOICE_DESCRIPTION_NOTE = (
+    "### VOICE DESCRIPTION NOTE\n\n"
+    "For the final Korean title/description, do not use analytic wording such as "
+    "`발화`, `한쪽`, `다른 쪽`, `한 사람`, `다른 사람`, `응답 측`, `발신 측`, "
+    "`수신 측`, `전화를 건 측`, or `연락받은 쪽`. Use `피해자` and `상대방` when the call flow makes the roles "
+    "clear. If someone continues contact by referencing blocked contact, no response, "
+    "a changed number/account, another number, or other bypass of avoidance, treat "
+    "that person as the contact-continuing `상대방` unless the input explicitly says "
+    "the victim initiated that contact. Reporting/legal warnings or strong refusal "
+    "against that continued contact may be the `피해자`'s defensive response. Center "
+    "the summary on the bypassed/continued contact, monitoring/contextual pressure, "
+    "and the other person's response. "
+    "Do not title or describe a victim's defensive swear words or reporting warnings "
+    "as the main incident. Summarize phrases like `신고한다` or `끝까지 간다` as "
+    "`피해자가 신고하겠다는 대응을 했습니다` when they respond to prior contact "
+    "or monitoring.\n\n"
+)
+
+_SPEAKER_ATTRIBUTION_NOTE = (
+    "### SPEAKER ATTRIBUTION NOTE\n\n"
+    "Use speaker labels in INPUT TEXT and SEGMENTS as the primary source for "
+    "speaker attribution. Same labels indicate the same speaker; different labels "
+    "must not be merged into one continuous statement. Do not use raw labels in "
+    "the final Korean summary.\n\n"
+)
+
+_SPEAKER_ROLE_CONSISTENCY_NOTE = (
+    "### SPEAKER ROLE CONSISTENCY NOTE\n\n"
+    "Relationship terms and self-references such as senior, junior, freshman, "
+    "sunbae, hoobae, `선배`, `후배`, `신입생`, `내가`, or `저는` belong only to "
+    "the speaker label that said them. Do not combine a refusal from one speaker "
+    "with another speaker's relationship justification. If ownership is unclear, "
+    "omit the relationship label and describe the safer flow, such as contact "
+    "refusal plus repeated requests for reasons. Avoid using relationship labels "
+    "as grammatical subjects when the Korean sentence can be subjectless.\n\n"
+)
+
 def _build_stt_context_section(struct_input: StructuringInput) -> str:
+    # Notes are module constants ordered from the most to the least shared, so
+    # STT calls keep a byte-identical prefix that provider prompt caching reuses.
+    # The prefix ends at the first per-evidence part: the single-speaker note
+    # when there is one, else the transcript; INPUT TEXT and SEGMENTS follow.
     if struct_input.source_type != "stt":
         return ""
 
-    interpretation_note = (
-        "### STT INTERPRETATION NOTE\n\n"
-        "For call or conversation evidence, summarize the ordered flow of contact, "
-        "pressure, refusal, warning, and response instead of replaying every line. "
-        "Use `피해자` or `상대방` in the final Korean title/description when the role "
-        "is clear; omit the subject only when it is unclear. Do not replace unclear "
-        "subjects with analytic phrases such as `한쪽`, `응답 측`, or `전화를 건 측`. "
-        "Do not infer the aggressor or threat evidence from swear words or reporting/"
-        "legal warnings alone. If the call involves an unknown number, another number "
-        "after blocking, or monitoring context, treat that as contact or block-bypass "
-        "context before interpreting later warnings. Korean response phrases such as "
-        "`신고한다`, `끝까지 간다`, or `고소한다` are possible defensive reporting/"
-        "legal-response language in that context. Because STT text can contain "
-        "misrecognitions, avoid direct quotation unless wording is short, clear, and "
-        "important; summarize awkward phrases as `취지의 발언`, `표현`, or `언급`.\n\n"
-    )
-    voice_description_note = (
-        "### VOICE DESCRIPTION NOTE\n\n"
-        "For the final Korean title/description, do not use analytic wording such as "
-        "`발화`, `한쪽`, `다른 쪽`, `한 사람`, `다른 사람`, `응답 측`, `발신 측`, "
-        "`수신 측`, `전화를 건 측`, or `연락받은 쪽`. Use `피해자` and `상대방` when the call flow makes the roles "
-        "clear. If someone continues contact by referencing blocked contact, no response, "
-        "a changed number/account, another number, or other bypass of avoidance, treat "
-        "that person as the contact-continuing `상대방` unless the input explicitly says "
-        "the victim initiated that contact. Reporting/legal warnings or strong refusal "
-        "against that continued contact may be the `피해자`'s defensive response. Center "
-        "the summary on the bypassed/continued contact, monitoring/contextual pressure, "
-        "and the other person's response. "
-        "Do not title or describe a victim's defensive swear words or reporting warnings "
-        "as the main incident. Summarize phrases like `신고한다` or `끝까지 간다` as "
-        "`피해자가 신고하겠다는 대응을 했습니다` when they respond to prior contact "
-        "or monitoring.\n\n"
-    )
-
     if not any(segment.speaker for segment in struct_input.segments):
-        return f"{interpretation_note}{voice_description_note}"
-
-    note = (
-        "### SPEAKER ATTRIBUTION NOTE\n\n"
-        "Use speaker labels in INPUT TEXT and SEGMENTS as the primary source for "
-        "speaker attribution. Same labels indicate the same speaker; different labels "
-        "must not be merged into one continuous statement. Do not use raw labels in "
-        "the final Korean summary.\n\n"
-    )
-    role_note = (
-        "### SPEAKER ROLE CONSISTENCY NOTE\n\n"
-        "Relationship terms and self-references such as senior, junior, freshman, "
-        "sunbae, hoobae, `선배`, `후배`, `신입생`, `내가`, or `저는` belong only to "
-        "the speaker label that said them. Do not combine a refusal from one speaker "
-        "with another speaker's relationship justification. If ownership is unclear, "
-        "omit the relationship label and describe the safer flow, such as contact "
-        "refusal plus repeated requests for reasons. Avoid using relationship labels "
-        "as grammatical subjects when the Korean sentence can be subjectless.\n\n"
-    )
+        return f"{_STT_INTERPRETATION_NOTE}{_VOICE_DESCRIPTION_NOTE}"
+
     single_speaker_note = _build_single_speaker_note(struct_input)
+    notes = (
+        f"{_STT_INTERPRETATION_NOTE}{_VOICE_DESCRIPTION_NOTE}"
+        f"{_SPEAKER_ATTRIBUTION_NOTE}{_SPEAKER_ROLE_CONSISTENCY_NOTE}{single_speaker_note}"
+    )
     transcript = _build_speaker_labeled_transcript(struct_input)
     if _full_text_has_speaker_labels(struct_input) or not transcript:
-        return f"{interpretation_note}{voice_description_note}{note}{role_note}{single_speaker_note}"
+        return notes
 
-    return (
-        f"{interpretation_note}{voice_description_note}{note}{role_note}{single_speaker_note}"
-        f"### SPEAKER-LABELED TRANSCRIPT (context only)\n\n{transcript}\n\n"
-    )
+    return f"{notes}### SPEAKER-LABELED TRANSCRIPT (context only)\n\n{transcript}\n\n"
 
 def _build_single_speaker_note(struct_input: StructuringInput) -> str:
     speakers = {
@@ -163,9 +169,9 @@ def build_complaint_document_messages(
         {
             "role": "user",
             "content": (
+                "Write the complaint document sections strictly from the provided input.\n\n"
                 "### STEP3 INPUT (json)\n\n"
-                f"{ai_input_json}\n\n"
-                "Write the complaint document sections strictly from the provided input."
+                f"{ai_input_json}"
             ),
         },
     ]
@@ -183,9 +189,9 @@ def build_damage_facts_statement_messages(
         {
             "role": "user",
             "content": (
+                "Write the damage facts statement strictly from the provided input.\n\n"
                 "### STEP3 INPUT (json)\n\n"
-                f"{ai_input_json}\n\n"
-                "Write the damage facts statement strictly from the provided input."
+                f"{ai_input_json}"
             ),
         },
     ]
@@ -0,0 +1,85 @@
+import json
+from typing import Dict, List, Literal, Optional
+
+from ansimon_ai.structuring.coalesce import find_text_span
+from ansimon_ai.structuring.types import StructuringInput, StructuringSegment
+
+SegmentEncoding = Literal["json", "compact"]
+
+# "json" is the original pretty-printed list; "compact" points into INPUT TEXT.
+# Compact is opt-in (per call, or per source type here) until an eval shows
+# it leaves the structured output unchanged; the token budget still falls
+# back to it for prompts that would not fit otherwise.
+SEGMENT_ENCODINGS: Dict[str, SegmentEncoding] = {
+    "stt": "json",
+    "ocr": "json",
+    "document": "json",
+    "text": "json",
+}
+
+COMPACT_SEGMENTS_HEADER = (
+    "### SEGMENTS (jsonl; span = [start_char, end_char) in INPUT TEXT, "
+    "unset fields omitted)\n\n"
+)
+
+def resolve_segment_encoding(
+    struct_input: StructuringInput,
+    encoding: Optional[SegmentEncoding] = None,
+) -> SegmentEncoding:
+    if encoding is not None:
+        return encoding
+    return SEGMENT_ENCODINGS.get(struct_input.source_type, "json")
+
+def encode_segments(
+    struct_input: StructuringInput,
+    encoding: Optional[SegmentEncoding] = None,
+) -> str:
+    if resolve_segment_encoding(struct_input, encoding) == "json":
+        segments_json = json.dumps(
+            [seg.model_dump(mode="json") for seg in struct_input.segments],
+            ensure_ascii=False,
+            indent=2,
+        )
+        return f"### SEGMENTS (json)\n\n{segments_json}"
+
+    lines = [
+        json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+        for item in _compact_segments(struct_input)
+    ]
+    return COMPACT_SEGMENTS_HEADER + "\n".join(lines)
+
+def decode_compact_segments(full_text: str, encoded: str) -> List[StructuringSegment]:
+    body = encoded[len(COMPACT_SEGMENTS_HEADER):] if encoded.startswith(COMPACT_SEGMENTS_HEADER) else encoded
+    segments = []
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        if "span" in item:
+            start_char, end_char = item.pop("span")
+            item["text"] = full_text[start_char:end_char]
+        item.setdefault("start", 0.0)
+        item.setdefault("end", 0.0)
+        segments.append(StructuringSegment.model_validate(item))
+    return segments
+
+def _compact_segments(struct_input: StructuringInput) -> List[dict]:
+    items = []
+    cursor = 0
+    for segment in struct_input.segments:
+        item: dict = {}
+        span = find_text_span(struct_input.full_text, segment.text, cursor)
+        if span is None:
+            item["text"] = segment.text
+        else:
+            item["span"] = list(span)
+            cursor = span[1]
+        if segment.start or segment.end:
+            item["start"] = segment.start
+            item["end"] = segment.end
+        if segment.timestamp is not None:
+            item["timestamp"] = segment.timestamp.isoformat()
+        if segment.speaker:
+            item["speaker"] = segment.speaker
+        items.append(item)
+    return items
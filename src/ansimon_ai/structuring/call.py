@@ -1,13 +1,54 @@
-import json
+from typing import Any, Dict, Optional
+from ansimon_ai.prompting.budget import TokenBudget, fit_structuring_messages
 from ansimon_ai.prompting.build_messages import build_structuring_messages
+from ansimon_ai.structuring.metrics import record_llm_usage
 from ansimon_ai.structuring.types import StructuringInput
-from ansimon_ai.llm.base import LLMClient
+from ansimon_ai.llm.base import LLMClient, agenerate_json_with, generate_json_with
+from ansimon_ai.llm.streaming import FieldCallback, astream_json_with, stream_json_with
 
 def call_structuring_ai(
     struct_input: StructuringInput,
     llm_client: LLMClient,
+    *,
+    stage: Optional[Dict[str, Any]] = None,
+    on_field: Optional[FieldCallback] = None,
+    budget: Optional[TokenBudget] = None,
 ) -> dict:
-    messages = build_structuring_messages(struct_input)
-    raw_output = llm_client.generate(messages)
+    messages = _build_messages(struct_input, stage=stage, budget=budget)
+    if on_field is None:
+        response = generate_json_with(llm_client, messages)
+    else:
+        response = stream_json_with(llm_client, messages, on_field)
+    record_llm_usage(stage, messages, response)
 
-    return json.loads(raw_output)
\ No newline at end of file
+    return response.data
+
+async def acall_structuring_ai(
+    struct_input: StructuringInput,
+    llm_client,
+    *,
+    stage: Optional[Dict[str, Any]] = None,
+    on_field: Optional[FieldCallback] = None,
+    budget: Optional[TokenBudget] = None,
+) -> dict:
+    messages = _build_messages(struct_input, stage=stage, budget=budget)
+    if on_field is None:
+        response = await agenerate_json_with(llm_client, messages)
+    else:
+        response = await astream_json_with(llm_client, messages, on_field)
+    record_llm_usage(stage, messages, response)
+
+    return response.data
+
+def _build_messages(
+    struct_input: StructuringInput,
+    *,
+    stage: Optional[Dict[str, Any]],
+    budget: Optional[TokenBudget],
+) -> list[dict]:
+    if budget is None:
+        return build_structuring_messages(struct_input)
+
+    messages, report = fit_structuring_messages(struct_input, budget)
+    report.record(stage)
+    return messages
@@ -0,0 +1,163 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from .timestamp_utils import extract_timestamp
+from .types import StructuringSegment
+
+# Cheaper than extract_timestamp: only says whether a line carries a date.
+_DATE_HINT_PATTERN = re.compile(r"\d{4}\s*(?:년|[-./])\s*\d{1,2}")
+
+@dataclass(frozen=True)
+class SourceSegment:
+    text: str
+    start: float = 0.0
+    end: float = 0.0
+    speaker: Optional[str] = None
+    speaker_side: Optional[str] = None
+
+@dataclass(frozen=True)
+class CoalesceConfig:
+    """How adjacent source segments merge into one structuring segment.
+
+    A new segment starts when the merged text would exceed ``max_chars``,
+    the speaker changes, a line carries its own date (so every segment keeps
+    at most one), or the silence before a line exceeds ``max_gap_seconds``.
+    """
+
+    max_chars: int = 800
+    max_gap_seconds: Optional[float] = None
+    separator: str = "\n"
+    split_on_speaker: bool = True
+    split_on_date: bool = True
+
+DOCUMENT_COALESCE = CoalesceConfig(max_chars=800)
+OCR_COALESCE = CoalesceConfig(max_chars=400)
+STT_COALESCE = CoalesceConfig(max_chars=400, max_gap_seconds=1.5, separator=" ")
+
+@dataclass(frozen=True)
+class SourceSpan:
+    source_index: int
+    segment_index: int
+    start_char: Optional[int]
+    end_char: Optional[int]
+    start: float
+    end: float
+
+class SegmentMap:
+    """Maps full_text character ranges back to the original source segments."""
+
+    def __init__(self, spans: Sequence[SourceSpan]) -> None:
+        self.spans = list(spans)
+
+    def sources_for_segment(self, segment_index: int) -> List[SourceSpan]:
+        return [span for span in self.spans if span.segment_index == segment_index]
+
+    def sources_for_anchor(self, start_char: int, end_char: int) -> List[SourceSpan]:
+        return [
+            span
+            for span in self.spans
+            if span.start_char is not None
+            and span.start_char < end_char
+            and start_char < span.end_char
+        ]
+
+    def time_range_for_anchor(self, start_char: int, end_char: int) -> Optional[Tuple[float, float]]:
+        spans = self.sources_for_anchor(start_char, end_char)
+        if not spans:
+            return None
+        return min(span.start for span in spans), max(span.end for span in spans)
+
+@dataclass(frozen=True)
+class CoalescedSegments:
+    segments: List[StructuringSegment]
+    groups: List[List[int]]
+    sources: List[SourceSegment]
+
+    def segment_map(self, full_text: str) -> SegmentMap:
+        spans = []
+        cursor = 0
+        for segment_index, group in enumerate(self.groups):
+            for source_index in group:
+                source = self.sources[source_index]
+                found = find_text_span(full_text, source.text, cursor)
+                if found is not None:
+                    cursor = found[1]
+                spans.append(
+                    SourceSpan(
+                        source_index=source_index,
+                        segment_index=segment_index,
+                        start_char=found[0] if found else None,
+                        end_char=found[1] if found else None,
+                        start=source.start,
+                        end=source.end,
+                    )
+                )
+        return SegmentMap(spans)
+
+def coalesce_segments(
+    sources: Sequence[SourceSegment],
+    *,
+    config: Optional[CoalesceConfig] = None,
+    metadata_fallback_timestamp: Optional[datetime] = None,
+) -> CoalescedSegments:
+    # Without a config every source stays its own segment.
+    groups: List[List[int]] = []
+    group_chars = 0
+    for index, source in enumerate(sources):
+        if groups and config is not None and _joins_group(sources, groups[-1], group_chars, source, config):
+            groups[-1].append(index)
+            group_chars += len(config.separator) + len(source.text)
+        else:
+            groups.append([index])
+            group_chars = len(source.text)
+
+    separator = config.separator if config is not None else ""
+    segments = []
+    for group in groups:
+        first = sources[group[0]]
+        last = sources[group[-1]]
+        text = separator.join(sources[index].text for index in group)
+        segments.append(
+            StructuringSegment(
+                text=text,
+                start=first.start,
+                end=last.end,
+                speaker=first.speaker,
+                timestamp=extract_timestamp(text, fallback=metadata_fallback_timestamp),
+            )
+        )
+    return CoalescedSegments(segments=segments, groups=groups, sources=list(sources))
+
+def find_text_span(full_text: str, text: str, cursor: int = 0) -> Optional[Tuple[int, int]]:
+    if not text:
+        return None
+    # Segments follow full_text order, so search forward first; a repeated
+    # line then maps to its own occurrence rather than the first one.
+    index = full_text.find(text, cursor)
+    if index < 0:
+        index = full_text.find(text)
+    if index < 0:
+        return None
+    return index, index + len(text)
+
+def _joins_group(
+    sources: Sequence[SourceSegment],
+    group: List[int],
+    group_chars: int,
+    source: SourceSegment,
+    config: CoalesceConfig,
+) -> bool:
+    previous = sources[group[-1]]
+    if group_chars + len(config.separator) + len(source.text) > config.max_chars:
+        return False
+    if config.split_on_speaker and (
+        source.speaker != previous.speaker or source.speaker_side != previous.speaker_side
+    ):
+        return False
+    if config.split_on_date and _DATE_HINT_PATTERN.search(source.text):
+        return False
+    if config.max_gap_seconds is not None and source.start - previous.end > config.max_gap_seconds:
+        return False
+    return True
@@ -0,0 +1,67 @@
+import re
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Set
+
+MAX_CACHED_PATTERNS = 256
+
+class TermLexicon:
+    """Matches named groups of literal terms against a text in one pass.
+
+    Terms are compiled into a single longest-first alternation. Each term also
+    carries the groups of every shorter term it contains, so resuming the
+    search one character after each match start reports every group hit,
+    overlapping terms included. Once a group is hit, the search switches to a
+    pattern without the terms that can only report groups already found.
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]) -> None:
+        term_groups: Dict[str, Set[str]] = {}
+        for group, terms in groups.items():
+            for term in terms:
+                if term:
+                    term_groups.setdefault(term, set()).add(group)
+
+        self.groups: FrozenSet[str] = frozenset(groups)
+        self._term_groups: Dict[str, FrozenSet[str]] = {
+            term: frozenset(
+                group
+                for other, other_groups in term_groups.items()
+                if other in term
+                for group in other_groups
+            )
+            for term in term_groups
+        }
+        self._patterns: Dict[FrozenSet[str], Optional[re.Pattern[str]]] = {}
+
+    def find(self, text: str) -> FrozenSet[str]:
+        hits: FrozenSet[str] = frozenset()
+        if not text:
+            return hits
+
+        pattern = self._pattern_for(hits)
+        position = 0
+        while pattern is not None:
+            match = pattern.search(text, position)
+            if match is None:
+                break
+            found = self._term_groups[match.group()]
+            if not found <= hits:
+                hits = hits | found
+                pattern = self._pattern_for(hits)
+            position = match.start() + 1
+        return hits
+
+    def contains(self, text: str, group: str) -> bool:
+        return group in self.find(text)
+
+    def _pattern_for(self, hits: FrozenSet[str]) -> Optional[re.Pattern[str]]:
+        if hits in self._patterns:
+            return self._patterns[hits]
+
+        terms = sorted(
+            (term for term, groups in self._term_groups.items() if not groups <= hits),
+            key=lambda term: (-len(term), term),
+        )
+        pattern = re.compile("|".join(re.escape(term) for term in terms)) if terms else None
+        if len(self._patterns) < MAX_CACHED_PATTERNS:
+            self._patterns[hits] = pattern
+        return pattern
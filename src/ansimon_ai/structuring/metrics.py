@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from ansimon_ai.llm.base import LLMResponse
+from ansimon_ai.llm.usage import cached_prompt_ratio, estimate_llm_cost
+from ansimon_ai.structuring.types import StageMetrics, StageMetricsSummary
+
+class StageRecorder:
+    """Collects wall/CPU time and size counters for each processing stage.
+
+    CPU time is the calling thread's CPU time, so pass ``measure_cpu=False``
+    for stages that await other coroutines on the same thread.
+    """
+
+    def __init__(self) -> None:
+        self.metrics: List[StageMetrics] = []
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+        *,
+        measure_cpu: bool = True,
+        **counters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        values: Dict[str, Any] = dict(counters)
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield values
+        finally:
+            wall_ms = (time.perf_counter() - wall_started) * 1000
+            cpu_ms = (time.thread_time() - cpu_started) * 1000 if measure_cpu else None
+            self.metrics.append(
+                StageMetrics(stage=name, wall_ms=wall_ms, cpu_ms=cpu_ms, **values)
+            )
+
+    def extend(self, metrics: Iterable[StageMetrics]) -> None:
+        self.metrics.extend(metrics)
+
+def count_message_chars(messages: list[dict]) -> int:
+    total = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            total += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and isinstance(part.get("text"), str):
+                    total += len(part["text"])
+    return total
+
+def record_llm_sizes(
+    stage: Optional[Dict[str, Any]],
+    messages: list[dict],
+    raw_output: str,
+) -> None:
+    if stage is None:
+        return
+    stage["prompt_chars"] = count_message_chars(messages)
+    stage["response_chars"] = len(raw_output)
+
+def record_llm_usage(
+    stage: Optional[Dict[str, Any]],
+    messages: list[dict],
+    response: LLMResponse,
+) -> None:
+    record_llm_sizes(stage, messages, response.text)
+    if stage is not None and response.cache_hit:
+        stage["cache_hit"] = True
+    if stage is None or response.prompt_tokens is None:
+        return
+    stage["prompt_tokens"] = response.prompt_tokens
+    stage["completion_tokens"] = response.completion_tokens
+    stage["cached_prompt_tokens"] = response.cached_prompt_tokens
+    stage["estimated_cost"] = estimate_llm_cost(
+        response.model,
+        prompt_tokens=response.prompt_tokens,
+        completion_tokens=response.completion_tokens or 0,
+        cached_prompt_tokens=response.cached_prompt_tokens or 0,
+    )
+
+def summarize_stage_metrics(metrics: Iterable[StageMetrics]) -> List[StageMetricsSummary]:
+    summaries: Dict[str, StageMetricsSummary] = {}
+    for item in metrics:
+        summary = summaries.get(item.stage)
+        if summary is None:
+            summary = StageMetricsSummary(
+                stage=item.stage,
+                count=0,
+                wall_ms=0.0,
+                max_wall_ms=0.0,
+                cpu_ms=0.0,
+            )
+            summaries[item.stage] = summary
+
+        summary.count += 1
+        summary.wall_ms += item.wall_ms
+        summary.max_wall_ms = max(summary.max_wall_ms, item.wall_ms)
+        summary.cpu_ms += item.cpu_ms or 0.0
+        summary.input_bytes += item.input_bytes or 0
+        summary.prompt_chars += item.prompt_chars or 0
+        summary.response_chars += item.response_chars or 0
+        summary.cache_hits += int(bool(item.cache_hit))
+        summary.prompt_tokens += item.prompt_tokens or 0
+        summary.completion_tokens += item.completion_tokens or 0
+        summary.cached_prompt_tokens += item.cached_prompt_tokens or 0
+        summary.estimated_cost += item.estimated_cost or 0.0
+
+    for summary in summaries.values():
+        summary.cached_prompt_ratio = cached_prompt_ratio(
+            summary.prompt_tokens,
+            summary.cached_prompt_tokens,
+        )
+    return list(summaries.values())
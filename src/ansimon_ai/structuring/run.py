@@ -1,5 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from uuid import UUID
+from ansimon_ai.llm.streaming import FieldCallback
+from ansimon_ai.prompting.budget import TokenBudget
 from ansimon_ai.structuring.types import (
     StructuringInput,
     StructuringResult,
@@ -8,12 +12,20 @@ from ansimon_ai.structuring.types import (
 )
 from ansimon_ai.structuring.anchor.matcher import AnchorMatcher
 from ansimon_ai.structuring.cache.hash import compute_input_hash
-from ansimon_ai.structuring.call import call_structuring_ai
+from ansimon_ai.structuring.call import acall_structuring_ai, call_structuring_ai
+from ansimon_ai.structuring.metrics import StageRecorder
 from ansimon_ai.structuring.anchor.apply import apply_anchors
 from ansimon_ai.structuring.anchor.store import collect_anchors, save_anchors
 from ansimon_ai.structuring.tags.generate import generate_evidence_tags
 from ansimon_ai.structuring.tags.types import EvidenceTag
 from ansimon_ai.structuring.versions import PROMPT_VERSION, SCHEMA_VERSION
+from ansimon_ai.structuring.windowing import (
+    StructuringWindow,
+    WindowingConfig,
+    merge_window_outputs,
+    should_window,
+    split_into_windows,
+)
 from ansimon_ai.trial.signals_v0.cache_manager import get_or_create_trial_signals_v0_from_structuring
 
 def run_structuring_pipeline(
@@ -24,41 +36,328 @@ def run_structuring_pipeline(
         validator,
         evidence_id: UUID | None = None,
         cache: Optional[object] = None,
+        recorder: Optional[StageRecorder] = None,
+        windowing: Optional[WindowingConfig] = None,
+        budget: Optional[TokenBudget] = None,
+        on_field: Optional[FieldCallback] = None,
+) -> StructuringResult:
+    if recorder is None:
+        recorder = StageRecorder()
+    output_json, cache_hit, cache_key = generate_structuring_output(
+        input=input,
+        llm_client=llm_client,
+        evidence_id=evidence_id,
+        cache=cache,
+        recorder=recorder,
+        windowing=windowing,
+        budget=budget,
+        on_field=on_field,
+    )
+
+    return build_structuring_result(
+        input,
+        output_json=output_json,
+        cache_hit=cache_hit,
+        cache_key=cache_key,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        recorder=recorder,
+    )
+
+async def arun_structuring_pipeline(
+        *,
+        input: StructuringInput,
+        llm_client,
+        anchor_matcher: AnchorMatcher,
+        validator,
+        evidence_id: UUID | None = None,
+        cache: Optional[object] = None,
+        recorder: Optional[StageRecorder] = None,
+        windowing: Optional[WindowingConfig] = None,
+        budget: Optional[TokenBudget] = None,
+        on_field: Optional[FieldCallback] = None,
 ) -> StructuringResult:
-    cache_hit = False
-    cached_output = None
-    cache_key = None
+    if recorder is None:
+        recorder = StageRecorder()
+    output_json, cache_hit, cache_key = await agenerate_structuring_output(
+        input=input,
+        llm_client=llm_client,
+        evidence_id=evidence_id,
+        cache=cache,
+        recorder=recorder,
+        windowing=windowing,
+        budget=budget,
+        on_field=on_field,
+    )
+
+    return build_structuring_result(
+        input,
+        output_json=output_json,
+        cache_hit=cache_hit,
+        cache_key=cache_key,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        recorder=recorder,
+    )
 
-    if cache is not None:
-        cache_key = compute_input_hash(
+def generate_structuring_output(
+        *,
+        input: StructuringInput,
+        llm_client,
+        evidence_id: UUID | None = None,
+        cache: Optional[object] = None,
+        recorder: Optional[StageRecorder] = None,
+        windowing: Optional[WindowingConfig] = None,
+        budget: Optional[TokenBudget] = None,
+        on_field: Optional[FieldCallback] = None,
+) -> tuple[dict, bool, Optional[str]]:
+    if recorder is None:
+        recorder = StageRecorder()
+    if should_window(input, windowing):
+        windowed = _generate_windowed_output(
             input,
-            schema_version=SCHEMA_VERSION,
-            prompt_version=PROMPT_VERSION,
+            llm_client=llm_client,
             evidence_id=evidence_id,
+            cache=cache,
+            recorder=recorder,
+            config=windowing,
+            budget=budget,
         )
-        cached_output = cache.get(cache_key)
+        # Window outputs are partial documents, so fields are reported once merged.
+        _report_fields(on_field, windowed[0])
+        return windowed
 
+    with recorder.stage("llm") as stage:
+        cache_key, cached_output = _lookup_cached_output(
+            input,
+            evidence_id=evidence_id,
+            cache=cache,
+        )
+        stage["cache_hit"] = cached_output is not None
         if cached_output is not None:
-            cache_hit = True
+            _report_fields(on_field, cached_output)
+            return cached_output, True, cache_key
 
-    if cached_output is None:
         output_json = call_structuring_ai(
             struct_input=input,
             llm_client=llm_client,
+            stage=stage,
+            budget=budget,
+            on_field=on_field,
+        )
+
+    if cache is not None and cache_key is not None:
+        cache.set(cache_key, output_json)
+    return output_json, False, cache_key
+
+async def agenerate_structuring_output(
+        *,
+        input: StructuringInput,
+        llm_client,
+        evidence_id: UUID | None = None,
+        cache: Optional[object] = None,
+        recorder: Optional[StageRecorder] = None,
+        windowing: Optional[WindowingConfig] = None,
+        budget: Optional[TokenBudget] = None,
+        on_field: Optional[FieldCallback] = None,
+) -> tuple[dict, bool, Optional[str]]:
+    if recorder is None:
+        recorder = StageRecorder()
+    if should_window(input, windowing):
+        windowed = await _agenerate_windowed_output(
+            input,
+            llm_client=llm_client,
+            evidence_id=evidence_id,
+            cache=cache,
+            recorder=recorder,
+            config=windowing,
+            budget=budget,
+        )
+        # Window outputs are partial documents, so fields are reported once merged.
+        _report_fields(on_field, windowed[0])
+        return windowed
+
+    with recorder.stage("llm", measure_cpu=False) as stage:
+        cache_key, cached_output = _lookup_cached_output(
+            input,
+            evidence_id=evidence_id,
+            cache=cache,
+        )
+        stage["cache_hit"] = cached_output is not None
+        if cached_output is not None:
+            _report_fields(on_field, cached_output)
+            return cached_output, True, cache_key
+
+        output_json = await acall_structuring_ai(
+            struct_input=input,
+            llm_client=llm_client,
+            stage=stage,
+            budget=budget,
+            on_field=on_field,
+        )
+
+    if cache is not None and cache_key is not None:
+        cache.set(cache_key, output_json)
+    return output_json, False, cache_key
+
+def _generate_windowed_output(
+        input: StructuringInput,
+        *,
+        llm_client,
+        evidence_id: UUID | None,
+        cache: Optional[object],
+        recorder: StageRecorder,
+        config: WindowingConfig,
+        budget: Optional[TokenBudget],
+) -> tuple[dict, bool, Optional[str]]:
+    # The merged document is cached under the whole input's key and every
+    # window under its own, so an edit re-runs only the windows it touches.
+    with recorder.stage("llm", measure_cpu=False) as stage:
+        cache_key, cached_output = _lookup_cached_output(
+            input,
+            evidence_id=evidence_id,
+            cache=cache,
+        )
+        stage["cache_hit"] = cached_output is not None
+        if cached_output is not None:
+            return cached_output, True, cache_key
+
+        windows = split_into_windows(input, config)
+
+        def structure_window(window: StructuringWindow) -> tuple[dict, bool]:
+            with recorder.stage("llm_window") as window_stage:
+                window_key, window_output = _lookup_cached_output(
+                    window.input,
+                    evidence_id=evidence_id,
+                    cache=cache,
+                )
+                window_stage["cache_hit"] = window_output is not None
+                if window_output is not None:
+                    return window_output, True
+
+                window_output = call_structuring_ai(
+                    struct_input=window.input,
+                    llm_client=llm_client,
+                    stage=window_stage,
+                    budget=budget,
+                )
+            if cache is not None and window_key is not None:
+                cache.set(window_key, window_output)
+            return window_output, False
+
+        with ThreadPoolExecutor(
+            max_workers=config.max_concurrency,
+            thread_name_prefix="structuring-window",
+        ) as executor:
+            window_results = list(executor.map(structure_window, windows))
+
+    return _finish_windowed_output(windows, window_results, cache=cache, cache_key=cache_key)
+
+async def _agenerate_windowed_output(
+        input: StructuringInput,
+        *,
+        llm_client,
+        evidence_id: UUID | None,
+        cache: Optional[object],
+        recorder: StageRecorder,
+        config: WindowingConfig,
+        budget: Optional[TokenBudget],
+) -> tuple[dict, bool, Optional[str]]:
+    with recorder.stage("llm", measure_cpu=False) as stage:
+        cache_key, cached_output = _lookup_cached_output(
+            input,
+            evidence_id=evidence_id,
+            cache=cache,
         )
+        stage["cache_hit"] = cached_output is not None
+        if cached_output is not None:
+            return cached_output, True, cache_key
+
+        windows = split_into_windows(input, config)
+        semaphore = asyncio.Semaphore(config.max_concurrency)
+
+        async def structure_window(window: StructuringWindow) -> tuple[dict, bool]:
+            async with semaphore:
+                with recorder.stage("llm_window", measure_cpu=False) as window_stage:
+                    window_key, window_output = _lookup_cached_output(
+                        window.input,
+                        evidence_id=evidence_id,
+                        cache=cache,
+                    )
+                    window_stage["cache_hit"] = window_output is not None
+                    if window_output is not None:
+                        return window_output, True
+
+                    window_output = await acall_structuring_ai(
+                        struct_input=window.input,
+                        llm_client=llm_client,
+                        stage=window_stage,
+                        budget=budget,
+                    )
+            if cache is not None and window_key is not None:
+                cache.set(window_key, window_output)
+            return window_output, False
+
+        window_results = await asyncio.gather(*(structure_window(window) for window in windows))
+
+    return _finish_windowed_output(windows, window_results, cache=cache, cache_key=cache_key)
+
+def _finish_windowed_output(
+        windows: list[StructuringWindow],
+        window_results,
+        *,
+        cache: Optional[object],
+        cache_key: Optional[str],
+) -> tuple[dict, bool, Optional[str]]:
+    output_json = merge_window_outputs([output for output, _ in window_results])
+    cache_hit = all(hit for _, hit in window_results)
+    if cache is not None and cache_key is not None:
+        cache.set(cache_key, output_json)
+    return output_json, cache_hit, cache_key
+
+def _report_fields(on_field: Optional[FieldCallback], output_json: dict) -> None:
+    if on_field is not None:
+        for key, value in output_json.items():
+            on_field(key, value)
+
+def _lookup_cached_output(
+        input: StructuringInput,
+        *,
+        evidence_id: UUID | None,
+        cache: Optional[object],
+) -> tuple[Optional[str], Optional[dict]]:
+    if cache is None:
+        return None, None
 
-        if cache is not None and cache_key is not None:
-            cache.set(cache_key, output_json)
-    else:
-        output_json = cached_output
-    
-    anchored_json = apply_anchors(
-        structuring_result=output_json,
-        full_text=input.full_text,
-        matcher=anchor_matcher,
+    cache_key = compute_input_hash(
+        input,
+        schema_version=SCHEMA_VERSION,
+        prompt_version=PROMPT_VERSION,
+        evidence_id=evidence_id,
     )
+    return cache_key, cache.get(cache_key)
 
-    anchors = collect_anchors(structuring_result=anchored_json)
+def build_structuring_result(
+        input: StructuringInput,
+        *,
+        output_json: dict,
+        cache_hit: bool,
+        cache_key: Optional[str],
+        anchor_matcher: AnchorMatcher,
+        validator,
+        recorder: Optional[StageRecorder] = None,
+) -> StructuringResult:
+    if recorder is None:
+        recorder = StageRecorder()
+
+    with recorder.stage("anchor"):
+        anchored_json = apply_anchors(
+            structuring_result=output_json,
+            full_text=input.full_text,
+            matcher=anchor_matcher,
+        )
+
+        anchors = collect_anchors(structuring_result=anchored_json)
 
     total_spans = len(anchors)
     matched = 0
@@ -79,13 +378,15 @@ def run_structuring_pipeline(
     )
 
     if cache_key is not None:
-        save_anchors(
-            anchors=anchors,
-            schema_version=SCHEMA_VERSION,
-            input_hash=cache_key,
-        )
+        with recorder.stage("anchor_store"):
+            save_anchors(
+                anchors=anchors,
+                schema_version=SCHEMA_VERSION,
+                input_hash=cache_key,
+            )
 
-    raw_validation = validator.validate(anchored_json)
+    with recorder.stage("validation"):
+        raw_validation = validator.validate(anchored_json)
 
     validation_result = ValidationResult(
         status=raw_validation.get("status", "FAIL"),
@@ -99,6 +400,7 @@ def run_structuring_pipeline(
         anchor_stats=anchor_stats,
         validation=validation_result,
         run_id=cache_key,
+        stage_metrics=list(recorder.metrics),
     )
 
     return result
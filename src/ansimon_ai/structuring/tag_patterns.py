@@ -1,5 +1,7 @@
 from typing import Iterable, List
 
+from .lexicon import TermLexicon
+
 TAG_PATTERNS = {
     "repeat": ["여러 번", "반복", "계속", "지속적으로"],
     "physical": ["폭행", "상해", "신체", "멍", "상처", "피해", "밀쳤다", "때렸다"],
@@ -11,6 +13,8 @@ TAG_PATTERNS = {
     "refusal": ["거절", "거부", "싫다", "하지 마", "그만해", "연락하지 말라", "차단"],
 }
 
+TAG_LEXICON = TermLexicon(TAG_PATTERNS)
+
 TAG_ORDER = ["repeat", "physical", "threat", "sexual_insult", "refusal"]
 ALLOWED_TAGS = set(TAG_ORDER)
 
@@ -19,10 +23,7 @@ def normalize_tags(tags: Iterable[str]) -> List[str]:
     return [tag for tag in TAG_ORDER if tag in normalized]
 
 def extract_tags_from_structuring_input(struct_input) -> List[str]:
-    tags = set()
-    for seg in struct_input.segments:
-        text = seg.text
-        for tag, patterns in TAG_PATTERNS.items():
-            if any(pat in text for pat in patterns):
-                tags.add(tag)
-    return normalize_tags(tags)
\ No newline at end of file
+    # No pattern contains a newline, so joining segments cannot create a match
+    # that spans two of them.
+    text = "\n".join(seg.text for seg in struct_input.segments)
+    return normalize_tags(TAG_LEXICON.find(text))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Literal, Dict, Any
 from datetime import datetime
 
@@ -30,9 +30,41 @@ class ValidationResult(BaseModel):
 
 VlidationResult = ValidationResult
 
+class StageMetrics(BaseModel):
+    stage: str
+    wall_ms: float
+    cpu_ms: Optional[float] = None
+    input_bytes: Optional[int] = None
+    prompt_chars: Optional[int] = None
+    response_chars: Optional[int] = None
+    cache_hit: Optional[bool] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    cached_prompt_tokens: Optional[int] = None
+    estimated_cost: Optional[float] = None
+    estimated_prompt_tokens: Optional[int] = None
+    trimmed: Optional[Dict[str, int]] = None
+
+class StageMetricsSummary(BaseModel):
+    stage: str
+    count: int
+    wall_ms: float
+    max_wall_ms: float
+    cpu_ms: float
+    input_bytes: int = 0
+    prompt_chars: int = 0
+    response_chars: int = 0
+    cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_prompt_tokens: int = 0
+    cached_prompt_ratio: Optional[float] = None
+    estimated_cost: float = 0.0
+
 class StructuringResult(BaseModel):
     output_json: Dict[str, Any]
     cache_hit: bool
     anchor_stats: AnchorStats
     validation: ValidationResult
-    run_id: Optional[str] = None
\ No newline at end of file
+    run_id: Optional[str] = None
+    stage_metrics: List[StageMetrics] = Field(default_factory=list)
\ No newline at end of file
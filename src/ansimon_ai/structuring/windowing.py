@@ -0,0 +1,179 @@
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from .coalesce import find_text_span
+from .types import StructuringInput, StructuringSegment
+
+_CONFIDENCE_RANK = {"high": 3, "medium": 2, "low": 1}
+_UNKNOWN = "unknown"
+
+@dataclass(frozen=True)
+class WindowingConfig:
+    """When and how a long input is structured as overlapping windows.
+
+    Inputs longer than ``threshold_chars`` are split on segment boundaries.
+    A window closes at a content-defined boundary once it holds
+    ``min_window_chars``, or unconditionally at ``max_window_chars``, so an
+    edit only moves the boundaries next to it and other windows keep their
+    cache keys. Each window repeats up to ``overlap_chars`` of the segments
+    before it.
+
+    Windowing is off unless a config is passed. Its ``max_concurrency``
+    threads come on top of any worker pool the caller already runs.
+    """
+
+    threshold_chars: int = 24_000
+    max_window_chars: int = 12_000
+    min_window_chars: int = 6_000
+    overlap_chars: int = 600
+    boundary_modulus: int = 8
+    max_concurrency: int = 4
+
+DEFAULT_WINDOWING = WindowingConfig()
+
+@dataclass(frozen=True)
+class StructuringWindow:
+    index: int
+    input: StructuringInput
+    # Where the window text starts in the full input; None when its
+    # segments could not be located in full_text.
+    char_offset: Optional[int]
+
+def should_window(struct_input: StructuringInput, config: Optional[WindowingConfig]) -> bool:
+    return (
+        config is not None
+        and len(struct_input.full_text) > config.threshold_chars
+        and len(struct_input.segments) > 1
+    )
+
+def split_into_windows(
+    struct_input: StructuringInput,
+    config: WindowingConfig = DEFAULT_WINDOWING,
+) -> List[StructuringWindow]:
+    segments = struct_input.segments
+    spans = _locate_segments(struct_input)
+
+    groups: List[List[int]] = []
+    current: List[int] = []
+    current_chars = 0
+    for index, segment in enumerate(segments):
+        if current and current_chars + len(segment.text) > config.max_window_chars:
+            groups.append(current)
+            current, current_chars = [], 0
+        current.append(index)
+        current_chars += len(segment.text)
+        if current_chars >= config.min_window_chars and _is_boundary(segment, config):
+            groups.append(current)
+            current, current_chars = [], 0
+    if current:
+        groups.append(current)
+
+    windows = []
+    for window_index, group in enumerate(groups):
+        indices = _with_overlap(segments, group, config.overlap_chars)
+        windows.append(_build_window(struct_input, spans, indices, window_index))
+    return windows
+
+def merge_window_outputs(outputs: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduces per-window documents into one.
+
+    List values are unioned in window order, dropping "unknown" once a real
+    value exists; other values come from the most confident window, with
+    "unknown" ranked last and earlier windows winning ties. Window anchors
+    are left as they are: apply_anchors re-anchors every evidence_span
+    against the full input afterwards.
+    """
+    keys: List[str] = []
+    for output in outputs:
+        keys.extend(key for key in output if key not in keys)
+
+    merged: Dict[str, Any] = {}
+    for key in keys:
+        fields = [output[key] for output in outputs if key in output]
+        if all(_is_field(field) for field in fields):
+            merged[key] = _merge_field(fields)
+        else:
+            merged[key] = fields[0]
+    return merged
+
+def _locate_segments(struct_input: StructuringInput) -> List[Optional[tuple]]:
+    spans = []
+    cursor = 0
+    for segment in struct_input.segments:
+        span = find_text_span(struct_input.full_text, segment.text, cursor)
+        if span is not None:
+            cursor = span[1]
+        spans.append(span)
+    return spans
+
+def _is_boundary(segment: StructuringSegment, config: WindowingConfig) -> bool:
+    checksum = zlib.crc32(segment.text.encode("utf-8"))
+    return checksum % config.boundary_modulus == 0
+
+def _with_overlap(
+    segments: Sequence[StructuringSegment],
+    group: List[int],
+    overlap_chars: int,
+) -> List[int]:
+    first = group[0]
+    overlap_chars_used = 0
+    while first > 0 and overlap_chars_used + len(segments[first - 1].text) <= overlap_chars:
+        first -= 1
+        overlap_chars_used += len(segments[first].text)
+    return list(range(first, group[-1] + 1))
+
+def _build_window(
+    struct_input: StructuringInput,
+    spans: Sequence[Optional[tuple]],
+    indices: List[int],
+    window_index: int,
+) -> StructuringWindow:
+    segments = [struct_input.segments[index] for index in indices]
+    located = [spans[index] for index in indices if spans[index] is not None]
+    if located:
+        start_char = min(span[0] for span in located)
+        end_char = max(span[1] for span in located)
+        full_text = struct_input.full_text[start_char:end_char]
+        char_offset: Optional[int] = start_char
+    else:
+        full_text = "\n".join(segment.text for segment in segments)
+        char_offset = None
+
+    window_input = struct_input.model_copy(update={"full_text": full_text, "segments": segments})
+    return StructuringWindow(index=window_index, input=window_input, char_offset=char_offset)
+
+def _is_field(value: Any) -> bool:
+    return isinstance(value, dict) and "value" in value and "confidence" in value
+
+def _rank(field: Dict[str, Any]) -> int:
+    if _is_unknown(field["value"]):
+        return 0
+    return _CONFIDENCE_RANK.get(field.get("confidence"), 0)
+
+def _is_unknown(value: Any) -> bool:
+    if value == _UNKNOWN or value is None or value == [] or value == [_UNKNOWN]:
+        return True
+    if isinstance(value, dict):
+        return all(_is_unknown(item) for item in value.values())
+    return False
+
+def _merge_field(fields: List[Dict[str, Any]]) -> Dict[str, Any]:
+    best = fields[0]
+    for field in fields[1:]:
+        if _rank(field) > _rank(best):
+            best = field
+    merged = dict(best)
+
+    if all(isinstance(field["value"], list) for field in fields):
+        values: List[Any] = []
+        for field in fields:
+            values.extend(item for item in field["value"] if item not in values)
+        if any(item != _UNKNOWN for item in values):
+            values = [item for item in values if item != _UNKNOWN]
+        merged["value"] = values
+        merged["confidence"] = max(
+            (field["confidence"] for field in fields),
+            key=lambda confidence: _CONFIDENCE_RANK.get(confidence, 0),
+        )
+    return merged
@@ -1,5 +1,31 @@
+from .assembly import TimelineIndex, assemble_timeline_items
+from .batch import build_timelines_batch
+from .deadlines import EvidenceDeadlines, EvidenceTimeoutError
 from .grouping import bucket_evidences_by_date_time, build_timeline_event_evidences
-from .prototype import build_timeline_prototype, process_single_evidence
+from .incremental import (
+    EvidenceResultStore,
+    StoredEvidenceResult,
+    compute_evidence_content_hash,
+    update_timeline,
+)
+from .prototype import (
+    EvidenceFieldCallback,
+    abuild_timeline_prototype,
+    aiter_timeline_prototype,
+    aprocess_single_evidence,
+    build_timeline_prototype,
+    build_timeline_prototype_staged,
+    iter_timeline_prototype,
+    process_single_evidence,
+)
+from .resources import (
+    ResourceGovernor,
+    ResourceLimits,
+    classify_evidence_resource,
+    estimate_evidence_memory,
+)
+from .scheduling import EvidenceCostModel, EvidenceSchedule, schedule_evidences
+from .stages import PipelineStage, StageExit, StagePipeline, StageStats
 from .types import (
     EvidenceProcessingResult,
     EvidenceProcessingStatus,
@@ -12,24 +38,52 @@ from .types import (
     TimelinePrototypeAiInput,
     TimelinePrototypeEvidenceInput,
     TimelinePrototypeOutput,
+    TimelineStreamEvent,
     TimelineTagType,
 )
 
 __all__ = [
+    "assemble_timeline_items",
     "bucket_evidences_by_date_time",
     "build_timeline_event_evidences",
+    "classify_evidence_resource",
+    "compute_evidence_content_hash",
+    "estimate_evidence_memory",
+    "iter_timeline_prototype",
+    "EvidenceCostModel",
+    "EvidenceDeadlines",
+    "EvidenceFieldCallback",
     "EvidenceProcessingResult",
     "EvidenceProcessingStatus",
+    "EvidenceResultStore",
+    "EvidenceSchedule",
+    "EvidenceTimeoutError",
     "EvidenceType",
     "FileFormat",
     "IncidentLogFormInput",
+    "abuild_timeline_prototype",
+    "aiter_timeline_prototype",
+    "aprocess_single_evidence",
     "build_timeline_prototype",
+    "build_timeline_prototype_staged",
+    "build_timelines_batch",
+    "PipelineStage",
     "process_single_evidence",
+    "ResourceGovernor",
+    "ResourceLimits",
+    "schedule_evidences",
+    "StageExit",
+    "StagePipeline",
+    "StageStats",
+    "StoredEvidenceResult",
     "TimelineDateItem",
     "TimelineEvent",
     "TimelineEvidenceItem",
+    "TimelineIndex",
     "TimelinePrototypeAiInput",
     "TimelinePrototypeEvidenceInput",
     "TimelinePrototypeOutput",
+    "TimelineStreamEvent",
     "TimelineTagType",
+    "update_timeline",
 ]
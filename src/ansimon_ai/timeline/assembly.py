@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from .grouping import (
+    _to_date_time_str,
+    bucket_evidences_by_date_time,
+    build_timeline_event_evidences,
+    build_timeline_event_item,
+    timeline_event_sort_key,
+    timeline_group_key,
+)
+from .types import (
+    EvidenceProcessingResult,
+    TimelineDateItem,
+    TimelineEvent,
+    TimelineEvidenceItem,
+)
+
+BucketKey = Tuple[str, str]
+GroupKey = Tuple[str, str]
+Member = Tuple[int, Dict[str, Any]]
+
+class _Bucket:
+    """Grouped timeline evidences of one (date, time) slot, kept in output order."""
+
+    def __init__(self) -> None:
+        self.groups: Dict[GroupKey, List[Member]] = {}
+        self.items: Dict[GroupKey, Dict[str, Any]] = {}
+        self.order: List[Tuple[str, str, GroupKey]] = []
+        self.order_keys: Dict[GroupKey, Tuple[str, str, GroupKey]] = {}
+
+    def load(self, members: List[Member]) -> None:
+        # Bulk path for an empty bucket: members arrive in position order.
+        groups = self.groups
+        for member in members:
+            group_key = timeline_group_key(member[1])
+            group = groups.get(group_key)
+            if group is None:
+                groups[group_key] = [member]
+            else:
+                group.append(member)
+
+        for group_key, group in groups.items():
+            item = build_timeline_event_item(group_key, [flat_evidence for _, flat_evidence in group])
+            self.items[group_key] = item
+            self.order_keys[group_key] = (item["title"], item["timeline_evidence_id"], group_key)
+        self.order = sorted(self.order_keys.values())
+
+    def add(self, position: int, flat_evidence: Dict[str, Any]) -> None:
+        group_key = timeline_group_key(flat_evidence)
+        insort(self.groups.setdefault(group_key, []), (position, flat_evidence), key=_member_position)
+        self._refresh(group_key)
+
+    def remove(self, position: int, flat_evidence: Dict[str, Any]) -> None:
+        group_key = timeline_group_key(flat_evidence)
+        members = self.groups[group_key]
+        del members[bisect_left(members, position, key=_member_position)]
+        if members:
+            self._refresh(group_key)
+            return
+
+        del self.groups[group_key]
+        del self.items[group_key]
+        self._discard_order_key(group_key)
+
+    def is_empty(self) -> bool:
+        return not self.groups
+
+    def to_event(self, time: str) -> TimelineEvent:
+        return TimelineEvent(
+            time=time,
+            evidences=[
+                TimelineEvidenceItem(index=index, **self.items[group_key])
+                for index, (_, _, group_key) in enumerate(self.order, start=1)
+            ],
+        )
+
+    def _refresh(self, group_key: GroupKey) -> None:
+        item = build_timeline_event_item(
+            group_key,
+            [flat_evidence for _, flat_evidence in self.groups[group_key]],
+        )
+        self.items[group_key] = item
+        order_key = (*timeline_event_sort_key(item), group_key)
+        if self.order_keys.get(group_key) != order_key:
+            self._discard_order_key(group_key)
+            insort(self.order, order_key)
+            self.order_keys[group_key] = order_key
+
+    def _discard_order_key(self, group_key: GroupKey) -> None:
+        order_key = self.order_keys.pop(group_key, None)
+        if order_key is not None:
+            del self.order[bisect_left(self.order, order_key)]
+
+class TimelineIndex:
+    """Timeline items kept sorted by date and time, updated per evidence.
+
+    Bucket keys live in a sorted list and evidences in their bucket's groups,
+    so adding or removing an evidence is a binary search plus a regroup of
+    its own timeline evidence. A snapshot only rebuilds the touched buckets.
+    An evidence id is indexed once; adding it again replaces the old entry.
+    """
+
+    def __init__(self) -> None:
+        self._bucket_keys: List[Tuple[Tuple[int, str], str]] = []
+        self._buckets: Dict[BucketKey, _Bucket] = {}
+        self._entries: Dict[UUID, Tuple[BucketKey, int, Dict[str, Any]]] = {}
+        self._events: Dict[BucketKey, TimelineEvent] = {}
+        self._dirty: set[BucketKey] = set()
+        self._next_position = 0
+
+    @classmethod
+    def from_results(cls, evidence_results: List[EvidenceProcessingResult]) -> TimelineIndex:
+        index = cls()
+        members: Dict[BucketKey, List[Member]] = {}
+        for position, result in enumerate(evidence_results):
+            evidence_id = result.evidence_id
+            if result.status != "completed" and evidence_id not in index._entries:
+                continue
+            if evidence_id in index._entries:
+                # Rare cases (repeated ids) take the regular replace path.
+                index._load(members)
+                members = {}
+                index.add(result, position=position)
+                continue
+            flat_evidence = _to_flat_evidence(result)
+            key = _to_date_time_str(result.timestamp)
+            members.setdefault(key, []).append((position, flat_evidence))
+            index._entries[evidence_id] = (key, position, flat_evidence)
+        index._load(members)
+        index._next_position = len(evidence_results)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, evidence_id: object) -> bool:
+        return _as_uuid(evidence_id) in self._entries
+
+    def add(
+        self,
+        result: EvidenceProcessingResult,
+        *,
+        position: Optional[int] = None,
+    ) -> None:
+        evidence_id = result.evidence_id
+        if evidence_id in self._entries:
+            previous_position = self._entries[evidence_id][1]
+            self.remove(evidence_id)
+            if position is None:
+                position = previous_position
+        if result.status != "completed":
+            return
+
+        if position is None:
+            position = self._next_position
+        self._next_position = max(self._next_position, position + 1)
+
+        flat_evidence = _to_flat_evidence(result)
+        key = _to_date_time_str(result.timestamp)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket()
+            insort(self._bucket_keys, _bucket_sort_key(key))
+        bucket.add(position, flat_evidence)
+        self._entries[evidence_id] = (key, position, flat_evidence)
+        self._dirty.add(key)
+
+    def remove(self, evidence_id: object) -> bool:
+        entry = self._entries.pop(_as_uuid(evidence_id), None)
+        if entry is None:
+            return False
+
+        key, position, flat_evidence = entry
+        bucket = self._buckets[key]
+        bucket.remove(position, flat_evidence)
+        if bucket.is_empty():
+            del self._buckets[key]
+            self._events.pop(key, None)
+            self._dirty.discard(key)
+            sort_key = _bucket_sort_key(key)
+            del self._bucket_keys[bisect_left(self._bucket_keys, sort_key)]
+        else:
+            self._dirty.add(key)
+        return True
+
+    def _load(self, members: Dict[BucketKey, List[Member]]) -> None:
+        for key, bucket_members in members.items():
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket()
+                bucket.load(bucket_members)
+            else:
+                for position, flat_evidence in bucket_members:
+                    bucket.add(position, flat_evidence)
+            self._dirty.add(key)
+        if members:
+            self._bucket_keys = sorted(_bucket_sort_key(key) for key in self._buckets)
+
+    def snapshot(self) -> List[TimelineDateItem]:
+        for key in self._dirty:
+            self._events[key] = self._buckets[key].to_event(key[1])
+        self._dirty.clear()
+
+        items: List[TimelineDateItem] = []
+        for (_, date), time in self._bucket_keys:
+            if not items or items[-1].date != date:
+                items.append(TimelineDateItem(date=date, events=[]))
+            items[-1].events.append(self._events[(date, time)])
+        return items
+
+def assemble_timeline_items(
+    evidence_results: List[EvidenceProcessingResult],
+) -> List[TimelineDateItem]:
+    # A one-shot build sorts once; TimelineIndex pays for per-item updates
+    # that only incremental and streaming callers need.
+    flat_evidences = [
+        _to_flat_evidence(result) for result in evidence_results if result.status == "completed"
+    ]
+    buckets = bucket_evidences_by_date_time(flat_evidences)
+    by_date: Dict[str, List[TimelineEvent]] = {}
+    for key in sorted(buckets, key=_bucket_sort_key):
+        grouped = build_timeline_event_evidences(buckets[key])
+        by_date.setdefault(key[0], []).append(
+            TimelineEvent(time=key[1], evidences=[TimelineEvidenceItem(**item) for item in grouped])
+        )
+    return [TimelineDateItem(date=date, events=events) for date, events in by_date.items()]
+
+def _to_flat_evidence(result: EvidenceProcessingResult) -> Dict[str, Any]:
+    return {
+        "evidence_id": result.evidence_id,
+        "evidence_type": result.type,
+        "timestamp": result.timestamp,
+        "title": result.title or str(result.evidence_id),
+        "description": result.description or "",
+        "tags": list(result.tags),
+    }
+
+def _as_uuid(evidence_id: object) -> UUID:
+    return evidence_id if isinstance(evidence_id, UUID) else UUID(str(evidence_id))
+
+def _member_position(member: Member) -> int:
+    return member[0]
+
+def _bucket_sort_key(key: BucketKey) -> Tuple[Tuple[int, str], str]:
+    return (_date_sort_key(key[0]), key[1])
+
+def _date_sort_key(date_str: str) -> Tuple[int, str]:
+    if date_str == "UNKNOWN":
+        return (1, date_str)
+    return (0, date_str)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import List, Optional, Tuple
+
+from ansimon_ai.eval.validator_adapter_v0 import StructuringValidatorV0
+from ansimon_ai.structuring.anchor.matcher import AnchorMatcher
+
+from .deadlines import EvidenceDeadlines
+from .prototype import (
+    DEFAULT_MODEL_VERSION,
+    _build_timeline_output,
+    _iter_evidence_completions,
+    _setup_build,
+)
+from .resources import ResourceGovernor
+from .scheduling import EvidenceCostModel, EvidenceSchedule
+from .types import (
+    EvidenceProcessingResult,
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    TimelinePrototypeOutput,
+)
+
+def build_timelines_batch(
+    inputs: Sequence[TimelinePrototypeAiInput],
+    *,
+    llm_client,
+    anchor_matcher: Optional[AnchorMatcher] = None,
+    validator: Optional[StructuringValidatorV0] = None,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    model_version: str = DEFAULT_MODEL_VERSION,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    victim_video_frame_interval_seconds: int = 3,
+    max_workers: int = 4,
+    schedule: EvidenceSchedule = "upload",
+    cost_model: Optional[EvidenceCostModel] = None,
+    resource_governor: Optional[ResourceGovernor] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+) -> List[TimelinePrototypeOutput]:
+    """Builds timelines for many complaints through one shared worker pool.
+
+    Engines, the LLM client, the cache and the resource governor are shared.
+    Evidences are interleaved round-robin across complaints, so one large
+    complaint does not hold back the rest. Outputs follow the input order
+    and match what ``build_timeline_prototype`` returns per complaint.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0.")
+    evidences: List[TimelinePrototypeEvidenceInput] = []
+    owners: List[Tuple[int, int]] = []
+    processors = []
+    weights: List[int] = []
+    complaint_orders: List[List[int]] = []
+    for complaint_index, ai_input in enumerate(inputs):
+        # Dedup stays scoped to one complaint, like a single build.
+        setup = _setup_build(
+            ai_input.evidences,
+            llm_client=llm_client,
+            anchor_matcher=anchor_matcher,
+            validator=validator,
+            stt_engine=stt_engine,
+            ocr_runner=ocr_runner,
+            cache=cache,
+            victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+            deadlines=deadlines,
+            schedule=schedule,
+            cost_model=cost_model,
+            resource_governor=resource_governor,
+        )
+        # Later complaints share the defaults resolved for the first one.
+        anchor_matcher = setup.anchor_matcher
+        validator = setup.validator
+        resource_governor = setup.governor
+
+        flat_order = []
+        for evidence_index, evidence in enumerate(ai_input.evidences):
+            flat_order.append(len(evidences))
+            evidences.append(evidence)
+            owners.append((complaint_index, evidence_index))
+            processors.append(setup.process_one)
+            weights.append(setup.weights[evidence_index])
+        complaint_orders.append([flat_order[index] for index in setup.order])
+
+    slots: List[List[Optional[EvidenceProcessingResult]]] = [
+        [None] * len(ai_input.evidences) for ai_input in inputs
+    ]
+    total_weight = sum(weights)
+    finished_weight = 0
+    for flat_index, result in _iter_evidence_completions(
+        evidences,
+        None,
+        max_workers=max_workers,
+        cancel_callback=cancel_callback,
+        order=_interleave(complaint_orders),
+        governor=resource_governor,
+        processors=processors,
+    ):
+        complaint_index, evidence_index = owners[flat_index]
+        slots[complaint_index][evidence_index] = result
+        finished_weight += weights[flat_index]
+        if progress_callback is not None:
+            progress_callback(finished_weight, total_weight)
+
+    return [
+        _build_timeline_output(
+            [result for result in complaint_slots if result is not None],
+            model_version=model_version,
+        )
+        for complaint_slots in slots
+    ]
+
+def _interleave(orders: List[List[int]]) -> List[int]:
+    interleaved: List[int] = []
+    longest = max((len(order) for order in orders), default=0)
+    for position in range(longest):
+        for order in orders:
+            if position < len(order):
+                interleaved.append(order[position])
+    return interleaved
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import CancelledError, Executor, Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+class EvidenceTimeoutError(TimeoutError):
+    def __init__(self, stage: str, seconds: float) -> None:
+        super().__init__(f"{stage} stage exceeded its {seconds:.1f}s deadline.")
+        self.stage = stage
+        self.seconds = seconds
+
+@dataclass(frozen=True)
+class EvidenceDeadlines:
+    """Wall-clock limits for processing one evidence.
+
+    ``stage_seconds`` bounds single stages ("extract", "llm") and
+    ``evidence_seconds`` bounds the whole evidence; a stage gets whichever
+    of the two leaves less time.
+    """
+
+    evidence_seconds: Optional[float] = None
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+
+class EvidenceDeadline:
+    """Deadline clock of one evidence, started when its processing starts.
+
+    Synchronous work that overruns is abandoned rather than interrupted: it
+    finishes on a daemon thread while the evidence is already reported as
+    timed out. collect_abandoned_work() lets a caller hold resources until
+    that thread returns.
+    """
+
+    def __init__(self, deadlines: Optional[EvidenceDeadlines] = None) -> None:
+        self.deadlines = deadlines
+        self.started_at = time.monotonic()
+
+    def budget(self, stage: str) -> Optional[float]:
+        if self.deadlines is None:
+            return None
+        budget = self.deadlines.stage_seconds.get(stage)
+        if self.deadlines.evidence_seconds is not None:
+            remaining = self.deadlines.evidence_seconds - (time.monotonic() - self.started_at)
+            budget = remaining if budget is None else min(budget, remaining)
+        return budget
+
+    def run(self, stage: str, fn: Callable[[], T]) -> T:
+        seconds = self.budget(stage)
+        if seconds is None:
+            return fn()
+        if seconds <= 0:
+            raise EvidenceTimeoutError(stage, 0.0)
+        return run_with_deadline(fn, seconds, stage=stage)
+
+    async def arun(self, stage: str, fn: Callable[[], Awaitable[T]]) -> T:
+        seconds = self.budget(stage)
+        if seconds is None:
+            return await fn()
+        if seconds <= 0:
+            raise EvidenceTimeoutError(stage, 0.0)
+        started: List[Future] = []
+        token = _executor_work.set(started)
+        try:
+            return await asyncio.wait_for(fn(), seconds)
+        except asyncio.TimeoutError:
+            for work in started:
+                # Work still queued is dropped; work on a thread is abandoned.
+                if not work.cancel():
+                    _abandon(work)
+            raise EvidenceTimeoutError(stage, seconds) from None
+        finally:
+            _executor_work.reset(token)
+
+class AbandonedWork:
+    """Deadline work that timed out on this thread but is still running."""
+
+    def __init__(self) -> None:
+        self.futures: List[Future] = []
+
+    def when_finished(self, callback: Callable[[], None]) -> None:
+        """Calls ``callback`` once every abandoned callable has returned."""
+        lock = threading.Lock()
+        remaining = [len(self.futures)]
+
+        def on_done(_future: Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                callback()
+
+        if not self.futures:
+            callback()
+            return
+        for future in self.futures:
+            future.add_done_callback(on_done)
+
+# Context variables rather than thread locals, so concurrent evidences on
+# one event loop each collect their own abandoned work.
+_collector: ContextVar[Optional[AbandonedWork]] = ContextVar("abandoned_work", default=None)
+_executor_work: ContextVar[Optional[List[Future]]] = ContextVar("deadline_executor_work", default=None)
+
+@contextmanager
+def collect_abandoned_work() -> Iterator[AbandonedWork]:
+    """Collects the work that run_with_deadline or EvidenceDeadline.arun abandons."""
+    work = AbandonedWork()
+    token = _collector.set(work)
+    try:
+        yield work
+    finally:
+        _collector.reset(token)
+
+def _abandon(future: Future) -> None:
+    work = _collector.get()
+    if work is not None:
+        work.futures.append(future)
+
+async def arun_in_executor(executor: Optional[Executor], fn: Callable[[], T]) -> T:
+    """``loop.run_in_executor`` whose thread an arun() deadline can abandon.
+
+    Cancelling the awaiting task does not stop a running executor thread,
+    so on a deadline the thread is reported to collect_abandoned_work().
+    """
+    work: Future = Future()
+
+    def target() -> T:
+        if not work.set_running_or_notify_cancel():
+            raise CancelledError()
+        try:
+            result = fn()
+        except BaseException as exc:
+            work.set_exception(exc)
+            raise
+        work.set_result(result)
+        return result
+
+    started = _executor_work.get()
+    if started is not None:
+        started.append(work)
+    return await asyncio.get_running_loop().run_in_executor(executor, target)
+
+def run_with_deadline(fn: Callable[[], T], seconds: float, *, stage: str) -> T:
+    future: Future = Future()
+
+    def target() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=target, name=f"deadline-{stage}", daemon=True).start()
+    try:
+        future.exception(timeout=seconds)
+    except TimeoutError:
+        _abandon(future)
+        raise EvidenceTimeoutError(stage, seconds) from None
+    return future.result()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple, TypeVar
+
+from ansimon_ai.structuring.types import StageMetrics, StructuringInput
+
+from .types import TimelinePrototypeEvidenceInput
+
+T = TypeVar("T")
+
+class ContentDeduplicator:
+    """Run-scoped single-flight memo for identical evidence content.
+
+    The first caller for a key does the work and later callers with the same
+    key reuse its value. Failures are not shared: a waiter whose owner failed
+    runs the work itself, so per-evidence error messages stay accurate.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        self._tasks: Dict[str, asyncio.Future] = {}
+
+    def run(self, key: Optional[str], fn: Callable[[], T]) -> Tuple[T, bool]:
+        if key is None:
+            return fn(), False
+
+        with self._lock:
+            future = self._futures.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._futures[key] = future
+
+        if is_owner:
+            try:
+                value = fn()
+            except BaseException as exc:
+                with self._lock:
+                    self._futures.pop(key, None)
+                future.set_exception(exc)
+                raise
+            future.set_result(value)
+            return value, False
+
+        try:
+            return future.result(), True
+        except BaseException:
+            return fn(), False
+
+    async def arun(
+        self,
+        key: Optional[str],
+        fn: Callable[[], Awaitable[T]],
+    ) -> Tuple[T, bool]:
+        if key is None:
+            return await fn(), False
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            try:
+                return await asyncio.shield(task), False
+            except BaseException:
+                self._tasks.pop(key, None)
+                raise
+
+        try:
+            return await asyncio.shield(task), True
+        except BaseException:
+            return await fn(), False
+
+def run_deduplicated(
+    deduplicator: Optional[ContentDeduplicator],
+    key: Optional[str],
+    fn: Callable[[], Tuple[T, List[StageMetrics]]],
+    *,
+    stage: str,
+) -> Tuple[T, List[StageMetrics]]:
+    if deduplicator is None:
+        return fn()
+
+    started_at = time.perf_counter()
+    (value, metrics), shared = deduplicator.run(key, fn)
+    if shared:
+        metrics = [_shared_stage_metrics(stage, started_at)]
+    return value, metrics
+
+async def arun_deduplicated(
+    deduplicator: Optional[ContentDeduplicator],
+    key: Optional[str],
+    fn: Callable[[], Awaitable[Tuple[T, List[StageMetrics]]]],
+    *,
+    stage: str,
+) -> Tuple[T, List[StageMetrics]]:
+    if deduplicator is None:
+        return await fn()
+
+    started_at = time.perf_counter()
+    (value, metrics), shared = await deduplicator.arun(key, fn)
+    if shared:
+        metrics = [_shared_stage_metrics(stage, started_at)]
+    return value, metrics
+
+def _shared_stage_metrics(stage: str, started_at: float) -> StageMetrics:
+    return StageMetrics(
+        stage=stage,
+        wall_ms=(time.perf_counter() - started_at) * 1000,
+        cache_hit=True,
+    )
+
+def extraction_dedup_key(evidence: TimelinePrototypeEvidenceInput) -> Optional[str]:
+    if evidence.type == "INCIDENT_LOG" and evidence.incident_log_form is not None:
+        return None
+
+    if evidence.extracted_text:
+        payload = evidence.extracted_text.encode("utf-8")
+        origin = "text"
+    elif evidence.file_bytes is not None:
+        payload = evidence.file_bytes
+        origin = "file"
+    else:
+        return None
+
+    # Evidence types that share an extraction path (and source_type) share a route,
+    # so the same screenshot uploaded as MESSAGE and VOICE is only OCR'd once.
+    if evidence.type in {"REPORT_RECORD", "INCIDENT_LOG"}:
+        route = "document"
+    elif evidence.type in {"MESSAGE", "VOICE"} and evidence.file_format == "IMAGE":
+        route = "ocr"
+    else:
+        route = evidence.type
+
+    digest = hashlib.sha256(payload).hexdigest()
+    return f"extract::{route}::{evidence.file_format}::{origin}::{digest}"
+
+def structuring_dedup_key(struct_input: StructuringInput) -> str:
+    digest = hashlib.sha256(struct_input.model_dump_json().encode("utf-8")).hexdigest()
+    return f"structuring::{digest}"
+
+def victim_dedup_key(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    frame_interval_seconds: int,
+) -> Optional[str]:
+    if evidence.file_bytes is None:
+        return None
+    digest = hashlib.sha256(evidence.file_bytes).hexdigest()
+    return f"victim::{evidence.file_format}::{frame_interval_seconds}::{digest}"
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import shutil
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+
+from .types import TimelinePrototypeEvidenceInput
+
+RUNTIME_TEMP_ROOT = Path("data") / "_timeline_runtime_tmp"
+
+class EvidenceFiles:
+    """Hands an evidence payload to extractors in the cheapest form they accept.
+
+    Libraries that read file-like objects get the bytes directly. A real path is
+    only created when asked for: ``device_path`` prefers an in-memory memfd and
+    ``path`` writes a named file under the runtime temp dir.
+    """
+
+    def __init__(
+        self,
+        evidence: TimelinePrototypeEvidenceInput,
+        *,
+        base_dir: Path = RUNTIME_TEMP_ROOT,
+    ) -> None:
+        self.evidence = evidence
+        self.base_dir = Path(base_dir)
+        self._temp_dir: Optional[Path] = None
+        self._file_path: Optional[str] = None
+        self._memfd: Optional[int] = None
+
+    def __enter__(self) -> EvidenceFiles:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def data(self) -> bytes:
+        if self.evidence.file_bytes is None:
+            raise ValueError("file_bytes or extracted_text is required for this evidence.")
+        return self.evidence.file_bytes
+
+    def stream(self) -> BytesIO:
+        return BytesIO(self.data)
+
+    def path(self) -> str:
+        if self._file_path is None:
+            file_path = self.work_dir() / _resolve_temp_file_name(self.evidence)
+            file_path.write_bytes(self.data)
+            self._file_path = str(file_path)
+        return self._file_path
+
+    def device_path(self) -> str:
+        # For subprocess-based tools (ffmpeg/ffprobe/whisper) that need a path
+        # but can read any file, including an anonymous in-memory one.
+        if self._memfd is None:
+            self._memfd = _create_memfd(self.data, name=_resolve_temp_file_name(self.evidence))
+        if self._memfd < 0:
+            return self.path()
+        return f"/proc/{os.getpid()}/fd/{self._memfd}"
+
+    def work_dir(self) -> Path:
+        if self._temp_dir is None:
+            temp_dir = self.base_dir / str(self.evidence.evidence_id)
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            self._temp_dir = temp_dir
+        return self._temp_dir
+
+    def close(self) -> None:
+        if self._memfd is not None and self._memfd >= 0:
+            os.close(self._memfd)
+        self._memfd = None
+        self._file_path = None
+
+        if self._temp_dir is not None:
+            try:
+                shutil.rmtree(self._temp_dir)
+            except OSError:
+                pass
+            self._temp_dir = None
+
+def _create_memfd(data: bytes, *, name: str) -> int:
+    memfd_create = getattr(os, "memfd_create", None)
+    if memfd_create is None or not Path(f"/proc/{os.getpid()}/fd").is_dir():
+        return -1
+
+    try:
+        fd = memfd_create(name)
+    except OSError:
+        return -1
+
+    try:
+        with open(fd, "wb", closefd=False) as handle:
+            handle.write(data)
+    except OSError:
+        os.close(fd)
+        return -1
+    return fd
+
+def _resolve_temp_file_name(evidence: TimelinePrototypeEvidenceInput) -> str:
+    if evidence.file_name:
+        return Path(evidence.file_name).name
+
+    suffix = _default_suffix_for_format(evidence.file_format)
+    return f"{evidence.evidence_id}{suffix}"
+
+def _default_suffix_for_format(file_format: Optional[str]) -> str:
+    mapping = {
+        "IMAGE": ".jpg",
+        "AUDIO": ".wav",
+        "VIDEO": ".mp4",
+        "PDF": ".pdf",
+        "HWP": ".hwp",
+        "DOCX": ".docx",
+        "TXT": ".txt",
+    }
+    return mapping.get(file_format or "", ".bin")
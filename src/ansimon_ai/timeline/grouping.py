@@ -28,36 +28,45 @@ def _resolve_timeline_evidence_id(ev: Dict[str, Any], key: Tuple[str, str]) -> s
 
     return str(uuid5(NAMESPACE_URL, f"timeline-evidence::{key[0]}::{key[1]}"))
 
-def build_timeline_event_evidences(evidences: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    grouped: Dict[Tuple[str, str], Dict[str, Any]] = {}
+def timeline_group_key(ev: Dict[str, Any]) -> Tuple[str, str]:
+    ev_type = ev.get("evidence_type")
+    if ev_type == "MESSAGE":
+        return ("MESSAGE", _message_group_key(ev))
+    return (str(ev_type), str(ev.get("evidence_id")))
 
-    for ev in evidences:
-        ev_type = ev.get("evidence_type")
-        if ev_type == "MESSAGE":
-            key = ("MESSAGE", _message_group_key(ev))
-        else:
-            key = (str(ev_type), str(ev.get("evidence_id")))
+def build_timeline_event_item(
+    key: Tuple[str, str],
+    members: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Builds one grouped timeline evidence from its members in input order."""
+    first = members[0]
+    if len(members) == 1:
+        tags = list(first.get("tags", []))
+    else:
+        tags = sorted({tag for ev in members for tag in ev.get("tags", [])})
+
+    # dict keys act as an insertion-ordered set of referenced ids.
+    referenced_ids = dict.fromkeys(ev.get("evidence_id") for ev in members)
+    return {
+        "timeline_evidence_id": _resolve_timeline_evidence_id(first, key),
+        "title": first.get("title", ""),
+        "description": first.get("description", ""),
+        "tags": tags,
+        "referenced_evidence_count": len(members),
+        "referenced_evidence_ids": list(referenced_ids),
+    }
 
-        if key not in grouped:
-            grouped[key] = {
-                "timeline_evidence_id": _resolve_timeline_evidence_id(ev, key),
-                "title": ev.get("title", ""),
-                "description": ev.get("description", ""),
-                "tags": list(ev.get("tags", [])),
-                "referenced_evidence_count": 1,
-                "referenced_evidence_ids": [ev.get("evidence_id")],
-            }
-        else:
-            grouped[key]["referenced_evidence_count"] += 1
-            tag_set = set(grouped[key]["tags"]) | set(ev.get("tags", []))
-            grouped[key]["tags"] = sorted(tag_set)
-            evidence_id = ev.get("evidence_id")
-            if evidence_id not in grouped[key]["referenced_evidence_ids"]:
-                grouped[key]["referenced_evidence_ids"].append(evidence_id)
+def timeline_event_sort_key(item: Dict[str, Any]) -> Tuple[str, str]:
+    return (item.get("title", ""), item.get("timeline_evidence_id", ""))
+
+def build_timeline_event_evidences(evidences: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    members: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for ev in evidences:
+        members.setdefault(timeline_group_key(ev), []).append(ev)
 
     sorted_items = sorted(
-        grouped.values(),
-        key=lambda item: (item.get("title", ""), item.get("timeline_evidence_id", "")),
+        (build_timeline_event_item(key, group) for key, group in members.items()),
+        key=timeline_event_sort_key,
     )
 
     for idx, item in enumerate(sorted_items, start=1):
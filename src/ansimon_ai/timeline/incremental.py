@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from ansimon_ai.eval.validator_adapter_v0 import StructuringValidatorV0
+from ansimon_ai.structuring.anchor.matcher import AnchorMatcher
+from ansimon_ai.structuring.types import StageMetrics
+from ansimon_ai.structuring.versions import PROMPT_VERSION, SCHEMA_VERSION
+
+from .assembly import TimelineIndex
+from .deadlines import EvidenceDeadlines
+from .prototype import (
+    VICTIM_PROMPT_VERSION,
+    _build_timeline_output,
+    _process_planned,
+    _setup_build,
+)
+from .resources import ResourceGovernor
+from .scheduling import EvidenceCostModel, EvidenceSchedule
+from .types import (
+    EvidenceProcessingResult,
+    TimelinePrototypeEvidenceInput,
+    TimelinePrototypeOutput,
+)
+
+REUSABLE_STATUSES = {"completed", "skipped"}
+
+class StoredEvidenceResult(BaseModel):
+    content_hash: str
+    result: EvidenceProcessingResult
+
+class EvidenceResultStore:
+    """Persists per-complaint evidence results as one JSON file per complaint."""
+
+    def __init__(self, base_dir: Path = Path("data/timeline_results")) -> None:
+        self.base_dir = Path(base_dir)
+
+    def load(self, complaint_id: UUID) -> Dict[str, StoredEvidenceResult]:
+        path = self._path(complaint_id)
+        if not path.exists():
+            return {}
+
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return {
+            evidence_id: StoredEvidenceResult.model_validate(entry)
+            for evidence_id, entry in payload.get("entries", {}).items()
+        }
+
+    def save(self, complaint_id: UUID, entries: Dict[str, StoredEvidenceResult]) -> None:
+        path = self._path(complaint_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "complaint_id": str(complaint_id),
+            "schema_version": SCHEMA_VERSION,
+            "prompt_version": PROMPT_VERSION,
+            "entries": {
+                evidence_id: entry.model_dump(mode="json")
+                for evidence_id, entry in entries.items()
+            },
+        }
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(
+            json.dumps(payload, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        # A crash or a concurrent writer never leaves a truncated store behind.
+        os.replace(temp_path, path)
+
+    def _path(self, complaint_id: UUID) -> Path:
+        return self.base_dir / f"{complaint_id}.json"
+
+def compute_evidence_content_hash(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    victim_video_frame_interval_seconds: int = 3,
+) -> str:
+    payload = {
+        "type": evidence.type,
+        "file_format": evidence.file_format,
+        "file_name": evidence.file_name,
+        "file_created_at": (
+            evidence.file_created_at.isoformat() if evidence.file_created_at is not None else None
+        ),
+        "file_hash": (
+            hashlib.sha256(evidence.file_bytes).hexdigest()
+            if evidence.file_bytes is not None
+            else None
+        ),
+        "extracted_text": evidence.extracted_text,
+        "incident_log_form": (
+            evidence.incident_log_form.model_dump(mode="json")
+            if evidence.incident_log_form is not None
+            else None
+        ),
+        "schema_version": SCHEMA_VERSION,
+        "prompt_version": PROMPT_VERSION,
+        "victim_prompt_version": VICTIM_PROMPT_VERSION,
+        "frame_interval_seconds": victim_video_frame_interval_seconds,
+    }
+    serialized = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+def update_timeline(
+    previous_output: TimelinePrototypeOutput,
+    changed_evidences: Sequence[TimelinePrototypeEvidenceInput],
+    removed_ids: Iterable[UUID] = (),
+    *,
+    complaint_id: UUID,
+    llm_client,
+    store: Optional[EvidenceResultStore] = None,
+    anchor_matcher: Optional[AnchorMatcher] = None,
+    validator: Optional[StructuringValidatorV0] = None,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    model_version: Optional[str] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    victim_video_frame_interval_seconds: int = 3,
+    max_workers: int = 1,
+    schedule: EvidenceSchedule = "upload",
+    cost_model: Optional[EvidenceCostModel] = None,
+    resource_governor: Optional[ResourceGovernor] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+    index: Optional[TimelineIndex] = None,
+) -> TimelinePrototypeOutput:
+    """Reprocesses only changed or added evidences and re-assembles the timeline.
+
+    Results of untouched evidences are carried over from ``previous_output``.
+    A changed evidence whose content hash matches the stored entry is reused
+    without running extraction or the LLM again; its stage metrics are
+    reported as cache hits so the summary does not count the old work twice.
+    Pass the ``index`` built for
+    ``previous_output`` (``TimelineIndex.from_results``) to update the items
+    in place instead of re-assembling the whole timeline.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0.")
+
+    removed = {str(evidence_id) for evidence_id in removed_ids}
+    stored = store.load(complaint_id) if store is not None else {}
+    for evidence_id in removed:
+        stored.pop(evidence_id, None)
+
+    content_hashes = {
+        str(evidence.evidence_id): compute_evidence_content_hash(
+            evidence,
+            victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+        )
+        for evidence in changed_evidences
+    }
+    updated: Dict[str, EvidenceProcessingResult] = {}
+    to_process: List[TimelinePrototypeEvidenceInput] = []
+    for evidence in changed_evidences:
+        evidence_id = str(evidence.evidence_id)
+        entry = stored.get(evidence_id)
+        if entry is not None and entry.content_hash == content_hashes[evidence_id]:
+            updated[evidence_id] = _as_reused(entry.result)
+        else:
+            to_process.append(evidence)
+
+    setup = _setup_build(
+        to_process,
+        llm_client=llm_client,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        stt_engine=stt_engine,
+        ocr_runner=ocr_runner,
+        cache=cache,
+        victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+        deadlines=deadlines,
+        schedule=schedule,
+        cost_model=cost_model,
+        resource_governor=resource_governor,
+    )
+    processed = _process_planned(
+        to_process,
+        setup,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        cancel_callback=cancel_callback,
+    )
+
+    for result in processed:
+        evidence_id = str(result.evidence_id)
+        updated[evidence_id] = result
+        if result.status in REUSABLE_STATUSES:
+            stored[evidence_id] = StoredEvidenceResult(
+                content_hash=content_hashes[evidence_id],
+                result=result,
+            )
+        else:
+            stored.pop(evidence_id, None)
+
+    evidence_results = _merge_evidence_results(
+        previous_output.evidence_results,
+        updated,
+        removed=removed,
+        order=[str(evidence.evidence_id) for evidence in changed_evidences],
+    )
+
+    if store is not None:
+        store.save(complaint_id, stored)
+
+    items = None
+    if index is not None:
+        for evidence_id in removed:
+            index.remove(evidence_id)
+        for evidence_id in [str(evidence.evidence_id) for evidence in changed_evidences]:
+            if evidence_id in updated:
+                index.add(updated[evidence_id])
+        items = index.snapshot()
+
+    return _build_timeline_output(
+        evidence_results,
+        model_version=model_version or previous_output.model_version,
+        items=items,
+    )
+
+def _as_reused(result: EvidenceProcessingResult) -> EvidenceProcessingResult:
+    return result.model_copy(
+        update={
+            "stage_metrics": [
+                StageMetrics(stage=metrics.stage, wall_ms=0.0, cache_hit=True)
+                for metrics in result.stage_metrics
+            ]
+        }
+    )
+
+def _merge_evidence_results(
+    previous_results: List[EvidenceProcessingResult],
+    updated: Dict[str, EvidenceProcessingResult],
+    *,
+    removed: set[str],
+    order: List[str],
+) -> List[EvidenceProcessingResult]:
+    merged: List[EvidenceProcessingResult] = []
+    seen: set[str] = set()
+    for result in previous_results:
+        evidence_id = str(result.evidence_id)
+        if evidence_id in removed or evidence_id in seen:
+            continue
+        seen.add(evidence_id)
+        merged.append(updated.get(evidence_id, result))
+
+    for evidence_id in order:
+        if evidence_id in seen or evidence_id not in updated:
+            continue
+        seen.add(evidence_id)
+        merged.append(updated[evidence_id])
+
+    return merged
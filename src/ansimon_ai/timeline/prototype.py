@@ -1,40 +1,79 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import hashlib
 import json
 import re
-import shutil
-from collections.abc import Callable
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
 from functools import partial
-from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
 
 from ansimon_ai.eval.validator_adapter_v0 import StructuringValidatorV0
+from ansimon_ai.llm.base import agenerate_json_with, generate_json_with
+from ansimon_ai.llm.streaming import FieldCallback
 from ansimon_ai.structuring.anchor.matcher import AnchorMatcher
+from ansimon_ai.structuring.coalesce import DOCUMENT_COALESCE
 from ansimon_ai.structuring.from_stt import build_structuring_input_from_stt
 from ansimon_ai.structuring.from_text import build_structuring_input_from_text
-from ansimon_ai.prompting.build_messages import (
-    build_victim_image_messages,
-    build_victim_video_messages,
+from ansimon_ai.structuring.metrics import StageRecorder, record_llm_usage, summarize_stage_metrics
+from ansimon_ai.prompting.budget import TokenBudget, fit_video_frames
+from ansimon_ai.prompting.build_messages import build_victim_image_messages
+from ansimon_ai.structuring.run import (
+    arun_structuring_pipeline,
+    build_structuring_result,
+    generate_structuring_output,
+    run_structuring_pipeline,
 )
-from ansimon_ai.structuring.run import run_structuring_pipeline
 from ansimon_ai.structuring.timestamp_utils import extract_timestamp
-from ansimon_ai.structuring.types import StructuringInput
+from ansimon_ai.structuring.types import StageMetrics, StructuringInput, StructuringResult
 from ansimon_ai.video import extract_frames_from_video, get_video_duration_seconds
 
-from .grouping import bucket_evidences_by_date_time, build_timeline_event_evidences
+from .assembly import TimelineIndex, assemble_timeline_items
+from .deadlines import (
+    EvidenceDeadline,
+    EvidenceDeadlines,
+    EvidenceTimeoutError,
+    arun_in_executor,
+    collect_abandoned_work,
+)
+from .dedup import (
+    ContentDeduplicator,
+    arun_deduplicated,
+    extraction_dedup_key,
+    run_deduplicated,
+    structuring_dedup_key,
+    victim_dedup_key,
+)
+from .evidence_files import EvidenceFiles
+from .resources import ResourceGovernor
+from .scheduling import (
+    EvidenceCostModel,
+    EvidenceSchedule,
+    progress_weights,
+    schedule_evidences,
+)
+from .stages import PipelineStage, StageExit, StagePipeline, StageStats
+from .tag_terms import tag_rule_hits
 from .types import (
     EvidenceProcessingResult,
     TimelineDateItem,
-    TimelineEvent,
-    TimelineEvidenceItem,
     TimelinePrototypeAiInput,
     TimelinePrototypeEvidenceInput,
     TimelinePrototypeOutput,
+    TimelineStreamEvent,
 )
 
 DEFAULT_MODEL_VERSION = "prototype-v1"
+VICTIM_PROMPT_VERSION = "victim_prompt_v0"
+
+# Preflight prompt caps; over-budget requests are trimmed before they are sent.
+STRUCTURING_TOKEN_BUDGET = TokenBudget(max_prompt_tokens=100_000)
+VICTIM_VIDEO_TOKEN_BUDGET = TokenBudget(max_prompt_tokens=60_000)
 
 UNSUPPORTED_TYPE_ERROR = "UNSUPPORTED_EVIDENCE_TYPE"
 UNSUPPORTED_FORMAT_ERROR = "UNSUPPORTED_FILE_FORMAT"
@@ -42,6 +81,13 @@ MISSING_INPUT_ERROR = "MISSING_EVIDENCE_INPUT"
 MISSING_DEPENDENCY_ERROR = "MISSING_DEPENDENCY"
 FILE_READ_ERROR = "FILE_READ_ERROR"
 STRUCTURING_ERROR = "STRUCTURING_ERROR"
+EVIDENCE_TIMEOUT_ERROR = "EVIDENCE_TIMEOUT"
+
+EXTRACTION_ERRORS = (NotImplementedError, ModuleNotFoundError, OSError, ValueError)
+
+# Receives (evidence_id, field, value) as each structured field completes.
+# Evidences that share a deduplicated structuring call report only once.
+EvidenceFieldCallback = Callable[[UUID, str, Any], None]
 
 def build_timeline_prototype(
     ai_input: TimelinePrototypeAiInput,
@@ -56,42 +102,1098 @@ def build_timeline_prototype(
     progress_callback: Optional[Callable[[int, int], None]] = None,
     cancel_callback: Optional[Callable[[], bool]] = None,
     victim_video_frame_interval_seconds: int = 3,
+    max_workers: int = 1,
+    schedule: EvidenceSchedule = "upload",
+    cost_model: Optional[EvidenceCostModel] = None,
+    resource_governor: Optional[ResourceGovernor] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+    field_callback: Optional[EvidenceFieldCallback] = None,
+) -> TimelinePrototypeOutput:
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0.")
+    setup = _setup_build(
+        ai_input.evidences,
+        llm_client=llm_client,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        stt_engine=stt_engine,
+        ocr_runner=ocr_runner,
+        cache=cache,
+        victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+        deadlines=deadlines,
+        schedule=schedule,
+        cost_model=cost_model,
+        resource_governor=resource_governor,
+        field_callback=field_callback,
+    )
+    evidence_results = _process_planned(
+        ai_input.evidences,
+        setup,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        cancel_callback=cancel_callback,
+    )
+
+    return _build_timeline_output(evidence_results, model_version=model_version)
+
+def _build_timeline_output(
+    evidence_results: List[EvidenceProcessingResult],
+    *,
+    model_version: str,
+    items: Optional[List[TimelineDateItem]] = None,
+) -> TimelinePrototypeOutput:
+    if items is None:
+        items = _assemble_timeline_items(evidence_results)
+    return TimelinePrototypeOutput(
+        items=items,
+        model_version=model_version,
+        evidence_results=evidence_results,
+        stage_summary=summarize_stage_metrics(
+            metrics
+            for result in evidence_results
+            for metrics in result.stage_metrics
+        ),
+    )
+
+@dataclass
+class _BuildSetup:
+    """Resolved defaults and the per-evidence processor shared by every build variant."""
+
+    anchor_matcher: AnchorMatcher
+    validator: StructuringValidatorV0
+    deduplicator: ContentDeduplicator
+    governor: ResourceGovernor
+    process_one: Callable[[TimelinePrototypeEvidenceInput], Any]
+    order: List[int]
+    weights: List[int]
+
+def _setup_build(
+    evidences: Sequence[TimelinePrototypeEvidenceInput],
+    *,
+    llm_client,
+    anchor_matcher: Optional[AnchorMatcher] = None,
+    validator: Optional[StructuringValidatorV0] = None,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    victim_video_frame_interval_seconds: int = 3,
+    deadlines: Optional[EvidenceDeadlines] = None,
+    field_callback: Optional[EvidenceFieldCallback] = None,
+    schedule: EvidenceSchedule = "upload",
+    cost_model: Optional[EvidenceCostModel] = None,
+    resource_governor: Optional[ResourceGovernor] = None,
+    asynchronous: bool = False,
+    executor: Optional[Executor] = None,
+) -> _BuildSetup:
+    if anchor_matcher is None:
+        anchor_matcher = AnchorMatcher()
+    if validator is None:
+        validator = StructuringValidatorV0()
+    # Dedup is scoped to one build, so every setup gets its own.
+    deduplicator = ContentDeduplicator()
+
+    process_options: dict[str, Any] = dict(
+        llm_client=llm_client,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        stt_engine=stt_engine,
+        ocr_runner=ocr_runner,
+        cache=cache,
+        victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+        deduplicator=deduplicator,
+        deadlines=deadlines,
+        field_callback=field_callback,
+    )
+    if asynchronous:
+        process_one = partial(aprocess_single_evidence, executor=executor, **process_options)
+    else:
+        process_one = partial(process_single_evidence, **process_options)
+
+    order, weights = _plan_evidences(list(evidences), schedule=schedule, cost_model=cost_model)
+    return _BuildSetup(
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        deduplicator=deduplicator,
+        governor=resource_governor or ResourceGovernor(),
+        process_one=process_one,
+        order=order,
+        weights=weights,
+    )
+
+def _process_planned(
+    evidences: List[TimelinePrototypeEvidenceInput],
+    setup: _BuildSetup,
+    *,
+    max_workers: int,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+) -> List[EvidenceProcessingResult]:
+    if max_workers > 1:
+        return _process_evidences_concurrently(
+            evidences,
+            setup.process_one,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+            cancel_callback=cancel_callback,
+            order=setup.order,
+            weights=setup.weights,
+            governor=setup.governor,
+        )
+    return _process_evidences_sequentially(
+        evidences,
+        setup.process_one,
+        progress_callback=progress_callback,
+        cancel_callback=cancel_callback,
+        order=setup.order,
+        weights=setup.weights,
+        governor=setup.governor,
+    )
+
+def _plan_evidences(
+    evidences: List[TimelinePrototypeEvidenceInput],
+    *,
+    schedule: EvidenceSchedule,
+    cost_model: Optional[EvidenceCostModel],
+) -> Tuple[List[int], List[int]]:
+    if cost_model is None:
+        cost_model = EvidenceCostModel()
+    costs = [cost_model.estimate(evidence) for evidence in evidences]
+    return schedule_evidences(evidences, schedule=schedule, costs=costs), progress_weights(costs)
+
+def _process_evidences_sequentially(
+    evidences: List[TimelinePrototypeEvidenceInput],
+    process_one: Callable[[TimelinePrototypeEvidenceInput], EvidenceProcessingResult],
+    *,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    order: Optional[List[int]] = None,
+    weights: Optional[List[int]] = None,
+    governor: Optional[ResourceGovernor] = None,
+) -> List[EvidenceProcessingResult]:
+    total = len(evidences)
+    if order is None:
+        order = list(range(total))
+    if weights is None:
+        weights = [1] * total
+    total_weight = sum(weights)
+    slots: List[Optional[EvidenceProcessingResult]] = [None] * total
+    finished_weight = 0
+
+    for index in order:
+        if cancel_callback is not None and cancel_callback():
+            break
+        slots[index] = _run_governed(governor, process_one, evidences[index])
+        finished_weight += weights[index]
+        if progress_callback is not None:
+            progress_callback(finished_weight, total_weight)
+
+    return [result for result in slots if result is not None]
+
+def _process_evidences_concurrently(
+    evidences: List[TimelinePrototypeEvidenceInput],
+    process_one: Callable[[TimelinePrototypeEvidenceInput], EvidenceProcessingResult],
+    *,
+    max_workers: int,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    order: Optional[List[int]] = None,
+    weights: Optional[List[int]] = None,
+    governor: Optional[ResourceGovernor] = None,
+) -> List[EvidenceProcessingResult]:
+    total = len(evidences)
+    if weights is None:
+        weights = [1] * total
+    total_weight = sum(weights)
+    slots: List[Optional[EvidenceProcessingResult]] = [None] * total
+    finished_weight = 0
+
+    for index, result in _iter_evidence_completions(
+        evidences,
+        process_one,
+        max_workers=max_workers,
+        cancel_callback=cancel_callback,
+        order=order,
+        governor=governor,
+    ):
+        slots[index] = result
+        finished_weight += weights[index]
+        if progress_callback is not None:
+            progress_callback(finished_weight, total_weight)
+
+    return [result for result in slots if result is not None]
+
+def _iter_evidence_completions(
+    evidences: List[TimelinePrototypeEvidenceInput],
+    process_one: Optional[Callable[[TimelinePrototypeEvidenceInput], EvidenceProcessingResult]],
+    *,
+    max_workers: int,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    order: Optional[List[int]] = None,
+    governor: Optional[ResourceGovernor] = None,
+    processors: Optional[List[Callable[[TimelinePrototypeEvidenceInput], EvidenceProcessingResult]]] = None,
+) -> Iterator[Tuple[int, EvidenceProcessingResult]]:
+    # Only max_workers evidences are in flight at a time, so a cancel stops
+    # scheduling immediately and only the already running work is drained.
+    # With a governor, an evidence whose resource class or memory budget is
+    # exhausted is passed over for the next one that fits. ``processors``
+    # overrides ``process_one`` per index (batch builds mix complaints).
+    if order is None:
+        order = list(range(len(evidences)))
+    if max_workers == 1:
+        for index in order:
+            if cancel_callback is not None and cancel_callback():
+                return
+            processor = processors[index] if processors is not None else process_one
+            yield index, _run_governed(governor, processor, evidences[index])
+        return
+
+    pending: dict[Future, int] = {}
+    waiting = list(order)
+    cancelled = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or (not cancelled and waiting):
+            while not cancelled and waiting and len(pending) < max_workers:
+                if cancel_callback is not None and cancel_callback():
+                    cancelled = True
+                    break
+                position = _next_admissible(waiting, evidences, governor)
+                if position is None:
+                    break
+                index = waiting.pop(position)
+                processor = processors[index] if processors is not None else process_one
+                future = executor.submit(_run_admitted, governor, processor, evidences[index])
+                pending[future] = index
+
+            if not pending:
+                if cancelled or not waiting:
+                    break
+                # Capacity is held by another build sharing the governor.
+                governor.wait_for_release(0.5)
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                yield index, future.result()
+
+def _next_admissible(
+    waiting: List[int],
+    evidences: List[TimelinePrototypeEvidenceInput],
+    governor: Optional[ResourceGovernor],
+) -> Optional[int]:
+    if governor is None:
+        return 0
+    for position, index in enumerate(waiting):
+        if governor.try_acquire(evidences[index]):
+            return position
+    return None
+
+def _run_admitted(
+    governor: Optional[ResourceGovernor],
+    process_one: Callable[[TimelinePrototypeEvidenceInput], EvidenceProcessingResult],
+    evidence: TimelinePrototypeEvidenceInput,
+) -> EvidenceProcessingResult:
+    if governor is None:
+        return process_one(evidence)
+
+    with collect_abandoned_work() as abandoned:
+        try:
+            return process_one(evidence)
+        finally:
+            # Work abandoned at a deadline keeps running, so it keeps the
+            # reservation until it actually returns.
+            abandoned.when_finished(partial(governor.release, evidence))
+
+def _run_governed(
+    governor: Optional[ResourceGovernor],
+    process_one: Callable[[TimelinePrototypeEvidenceInput], EvidenceProcessingResult],
+    evidence: TimelinePrototypeEvidenceInput,
+) -> EvidenceProcessingResult:
+    if governor is not None:
+        governor.wait_and_acquire(evidence)
+    return _run_admitted(governor, process_one, evidence)
+
+class _CancelLatch:
+    """Stays cancelled once ``cancel_callback`` has returned True."""
+
+    def __init__(self, cancel_callback: Optional[Callable[[], bool]]) -> None:
+        self.cancel_callback = cancel_callback
+        self.cancelled = False
+
+    def __call__(self) -> bool:
+        if not self.cancelled and self.cancel_callback is not None and self.cancel_callback():
+            self.cancelled = True
+        return self.cancelled
+
+async def _arun_governed(
+    setup: _BuildSetup,
+    semaphore: asyncio.Semaphore,
+    evidence: TimelinePrototypeEvidenceInput,
+    is_cancelled: Callable[[], bool],
+) -> Optional[EvidenceProcessingResult]:
+    # Resources are reserved before a concurrency slot, so heavy evidences
+    # waiting for memory do not hold slots that light ones could use.
+    await setup.governor.await_and_acquire(evidence)
+    with collect_abandoned_work() as abandoned:
+        try:
+            async with semaphore:
+                if is_cancelled():
+                    return None
+                return await setup.process_one(evidence)
+        finally:
+            # As in _run_admitted: an executor thread abandoned at a deadline
+            # keeps the reservation until it actually returns.
+            abandoned.when_finished(partial(setup.governor.release, evidence))
+
+def iter_timeline_prototype(
+    ai_input: TimelinePrototypeAiInput,
+    *,
+    llm_client,
+    anchor_matcher: Optional[AnchorMatcher] = None,
+    validator: Optional[StructuringValidatorV0] = None,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    model_version: str = DEFAULT_MODEL_VERSION,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    victim_video_frame_interval_seconds: int = 3,
+    max_workers: int = 1,
+    snapshot_every: int = 1,
+    schedule: EvidenceSchedule = "upload",
+    cost_model: Optional[EvidenceCostModel] = None,
+    resource_governor: Optional[ResourceGovernor] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+    field_callback: Optional[EvidenceFieldCallback] = None,
+) -> Iterator[TimelineStreamEvent]:
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0.")
+    if snapshot_every < 1:
+        raise ValueError("snapshot_every must be greater than 0.")
+    setup = _setup_build(
+        ai_input.evidences,
+        llm_client=llm_client,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        stt_engine=stt_engine,
+        ocr_runner=ocr_runner,
+        cache=cache,
+        victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+        deadlines=deadlines,
+        schedule=schedule,
+        cost_model=cost_model,
+        resource_governor=resource_governor,
+        field_callback=field_callback,
+    )
+    stream = _TimelineStream(len(ai_input.evidences), snapshot_every=snapshot_every)
+
+    for index, result in _iter_evidence_completions(
+        ai_input.evidences,
+        setup.process_one,
+        max_workers=max_workers,
+        cancel_callback=cancel_callback,
+        order=setup.order,
+        governor=setup.governor,
+    ):
+        yield from stream.accept(index, result)
+
+    yield stream.finish(model_version)
+
+async def aiter_timeline_prototype(
+    ai_input: TimelinePrototypeAiInput,
+    *,
+    llm_client,
+    anchor_matcher: Optional[AnchorMatcher] = None,
+    validator: Optional[StructuringValidatorV0] = None,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    model_version: str = DEFAULT_MODEL_VERSION,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    victim_video_frame_interval_seconds: int = 3,
+    max_concurrency: int = 8,
+    executor: Optional[Executor] = None,
+    snapshot_every: int = 1,
+    schedule: EvidenceSchedule = "upload",
+    cost_model: Optional[EvidenceCostModel] = None,
+    resource_governor: Optional[ResourceGovernor] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+    field_callback: Optional[EvidenceFieldCallback] = None,
+) -> AsyncIterator[TimelineStreamEvent]:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be greater than 0.")
+    if snapshot_every < 1:
+        raise ValueError("snapshot_every must be greater than 0.")
+    setup = _setup_build(
+        ai_input.evidences,
+        llm_client=llm_client,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        stt_engine=stt_engine,
+        ocr_runner=ocr_runner,
+        cache=cache,
+        victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+        deadlines=deadlines,
+        schedule=schedule,
+        cost_model=cost_model,
+        resource_governor=resource_governor,
+        field_callback=field_callback,
+        asynchronous=True,
+        executor=executor,
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+    is_cancelled = _CancelLatch(cancel_callback)
+
+    async def run_one(index: int) -> Tuple[int, Optional[EvidenceProcessingResult]]:
+        evidence = ai_input.evidences[index]
+        return index, await _arun_governed(setup, semaphore, evidence, is_cancelled)
+
+    # The semaphore wakes waiters in FIFO order, so task creation order is
+    # the start order.
+    stream = _TimelineStream(len(ai_input.evidences), snapshot_every=snapshot_every)
+    tasks = [asyncio.ensure_future(run_one(index)) for index in setup.order]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, result = await next_done
+            if result is None:
+                continue
+            for event in stream.accept(index, result):
+                yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    yield stream.finish(model_version)
+
+class _TimelineStream:
+    def __init__(self, total: int, *, snapshot_every: int) -> None:
+        self.total = total
+        self.snapshot_every = snapshot_every
+        self.slots: List[Optional[EvidenceProcessingResult]] = [None] * total
+        self.finished = 0
+        self.assembler = TimelineIndex()
+        self.has_new_items = False
+
+    def accept(self, index: int, result: EvidenceProcessingResult) -> Iterator[TimelineStreamEvent]:
+        self.slots[index] = result
+        self.finished += 1
+        yield TimelineStreamEvent(
+            kind="evidence",
+            completed=self.finished,
+            total=self.total,
+            evidence_result=result,
+        )
+
+        if result.status == "completed":
+            self.assembler.add(result, position=index)
+            self.has_new_items = True
+        if self.has_new_items and self.finished % self.snapshot_every == 0:
+            self.has_new_items = False
+            yield TimelineStreamEvent(
+                kind="snapshot",
+                completed=self.finished,
+                total=self.total,
+                items=self.assembler.snapshot(),
+            )
+
+    def finish(self, model_version: str) -> TimelineStreamEvent:
+        evidence_results = [result for result in self.slots if result is not None]
+        return TimelineStreamEvent(
+            kind="final",
+            completed=self.finished,
+            total=self.total,
+            output=_build_timeline_output(
+                evidence_results,
+                model_version=model_version,
+                items=self.assembler.snapshot(),
+            ),
+        )
+
+async def abuild_timeline_prototype(
+    ai_input: TimelinePrototypeAiInput,
+    *,
+    llm_client,
+    anchor_matcher: Optional[AnchorMatcher] = None,
+    validator: Optional[StructuringValidatorV0] = None,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    model_version: str = DEFAULT_MODEL_VERSION,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    victim_video_frame_interval_seconds: int = 3,
+    max_concurrency: int = 8,
+    executor: Optional[Executor] = None,
+    schedule: EvidenceSchedule = "upload",
+    cost_model: Optional[EvidenceCostModel] = None,
+    resource_governor: Optional[ResourceGovernor] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+    field_callback: Optional[EvidenceFieldCallback] = None,
 ) -> TimelinePrototypeOutput:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be greater than 0.")
+    setup = _setup_build(
+        ai_input.evidences,
+        llm_client=llm_client,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        stt_engine=stt_engine,
+        ocr_runner=ocr_runner,
+        cache=cache,
+        victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+        deadlines=deadlines,
+        schedule=schedule,
+        cost_model=cost_model,
+        resource_governor=resource_governor,
+        field_callback=field_callback,
+        asynchronous=True,
+        executor=executor,
+    )
+    total_weight = sum(setup.weights)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    is_cancelled = _CancelLatch(cancel_callback)
+    finished_weight = 0
+
+    async def run_one(index: int) -> Optional[EvidenceProcessingResult]:
+        nonlocal finished_weight
+        result = await _arun_governed(setup, semaphore, ai_input.evidences[index], is_cancelled)
+        if result is None:
+            return None
+
+        finished_weight += setup.weights[index]
+        if progress_callback is not None:
+            progress_callback(finished_weight, total_weight)
+        return result
+
+    slots: List[Optional[EvidenceProcessingResult]] = [None] * len(ai_input.evidences)
+    scheduled = await asyncio.gather(*(run_one(index) for index in setup.order))
+    for index, result in zip(setup.order, scheduled):
+        slots[index] = result
+    evidence_results = [result for result in slots if result is not None]
+
+    return _build_timeline_output(evidence_results, model_version=model_version)
+
+def build_timeline_prototype_staged(
+    ai_input: TimelinePrototypeAiInput,
+    *,
+    llm_client,
+    anchor_matcher: Optional[AnchorMatcher] = None,
+    validator: Optional[StructuringValidatorV0] = None,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    model_version: str = DEFAULT_MODEL_VERSION,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_callback: Optional[Callable[[], bool]] = None,
+    victim_video_frame_interval_seconds: int = 3,
+    extract_workers: int = 2,
+    llm_workers: int = 8,
+    postprocess_workers: int = 1,
+    extract_executor: Optional[Executor] = None,
+    stage_stats_callback: Optional[Callable[[List[StageStats]], None]] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+) -> TimelinePrototypeOutput:
+    # extract_executor may be a ProcessPoolExecutor for CPU-bound OCR/STT/PDF
+    # work; ocr_runner and stt_engine must then be picklable.
+    setup = _setup_build(
+        ai_input.evidences,
+        llm_client=llm_client,
+        anchor_matcher=anchor_matcher,
+        validator=validator,
+        stt_engine=stt_engine,
+        ocr_runner=ocr_runner,
+        cache=cache,
+        victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
+        deadlines=deadlines,
+    )
+    pipeline = StagePipeline(
+        [
+            PipelineStage(
+                name="extract",
+                fn=partial(
+                    _run_extract_stage,
+                    stt_engine=stt_engine,
+                    ocr_runner=ocr_runner,
+                    cache=cache,
+                    frame_interval_seconds=victim_video_frame_interval_seconds,
+                    executor=extract_executor,
+                    deduplicator=setup.deduplicator,
+                    deadlines=deadlines,
+                ),
+                workers=extract_workers,
+            ),
+            PipelineStage(
+                name="llm",
+                fn=partial(
+                    _run_llm_stage,
+                    llm_client=llm_client,
+                    cache=cache,
+                    frame_interval_seconds=victim_video_frame_interval_seconds,
+                    deduplicator=setup.deduplicator,
+                ),
+                workers=llm_workers,
+            ),
+            PipelineStage(
+                name="postprocess",
+                fn=partial(
+                    _run_postprocess_stage,
+                    anchor_matcher=setup.anchor_matcher,
+                    validator=setup.validator,
+                ),
+                workers=postprocess_workers,
+            ),
+        ]
+    )
+    evidence_results, stage_stats = pipeline.run(
+        ai_input.evidences,
+        progress_callback=progress_callback,
+        cancel_callback=cancel_callback,
+    )
+    if stage_stats_callback is not None:
+        stage_stats_callback(stage_stats)
+
+    return _build_timeline_output(evidence_results, model_version=model_version)
+
+@dataclass
+class _StagedEvidence:
+    evidence: TimelinePrototypeEvidenceInput
+    source_type: str
+    struct_input: Optional[StructuringInput] = None
+    messages: Optional[list[dict]] = None
+    cache_key: Optional[str] = None
+    output_json: Optional[dict] = None
+    cache_hit: bool = False
+    extract_metrics: List[StageMetrics] = field(default_factory=list)
+    recorder: StageRecorder = field(default_factory=StageRecorder)
+    deadline: EvidenceDeadline = field(default_factory=EvidenceDeadline)
+
+def _run_extract_stage(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    frame_interval_seconds: int = 3,
+    executor: Optional[Executor] = None,
+    deduplicator: Optional[ContentDeduplicator] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+) -> _StagedEvidence | StageExit:
+    # The deadline clock starts here, so time queued between stages counts.
+    deadline = EvidenceDeadline(deadlines)
+    if evidence.type == "VICTIM":
+        return _run_victim_extract_stage(
+            evidence,
+            cache=cache,
+            frame_interval_seconds=frame_interval_seconds,
+            executor=executor,
+            deduplicator=deduplicator,
+            deadline=deadline,
+        )
+
+    try:
+        (struct_input, source_type), extract_metrics = deadline.run(
+            "extract",
+            partial(
+                run_deduplicated,
+                deduplicator,
+                extraction_dedup_key(evidence),
+                partial(
+                    _call_in_executor,
+                    executor,
+                    _measured_extraction(evidence, stt_engine=stt_engine, ocr_runner=ocr_runner),
+                ),
+                stage="extract",
+            ),
+        )
+    except EvidenceTimeoutError as exc:
+        return StageExit(_build_timeout_result(evidence, exc))
+    except EXTRACTION_ERRORS as exc:
+        return StageExit(_build_extraction_error_result(evidence, exc))
+
+    return _StagedEvidence(
+        evidence=evidence,
+        source_type=source_type,
+        struct_input=struct_input,
+        extract_metrics=extract_metrics,
+        deadline=deadline,
+    )
+
+def _run_victim_extract_stage(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    cache: Optional[object] = None,
+    frame_interval_seconds: int = 3,
+    executor: Optional[Executor] = None,
+    deduplicator: Optional[ContentDeduplicator] = None,
+    deadline: Optional[EvidenceDeadline] = None,
+) -> _StagedEvidence | StageExit:
+    if deadline is None:
+        deadline = EvidenceDeadline()
+    skipped_result = _check_victim_evidence_input(evidence)
+    if skipped_result is not None:
+        return StageExit(skipped_result)
+
+    recorder = StageRecorder()
+    try:
+        cache_key = _compute_victim_cache_key(
+            evidence,
+            default_frame_interval_seconds=frame_interval_seconds,
+        )
+        cached_structured_data = _lookup_victim_cache(cache, cache_key, recorder=recorder)
+        if cached_structured_data is not None:
+            return _StagedEvidence(
+                evidence=evidence,
+                source_type="vision",
+                cache_key=cache_key,
+                output_json=cached_structured_data,
+                cache_hit=True,
+                extract_metrics=recorder.metrics,
+                deadline=deadline,
+            )
+
+        dedup_key = victim_dedup_key(evidence, frame_interval_seconds=frame_interval_seconds)
+        messages, extract_metrics = deadline.run(
+            "extract",
+            partial(
+                run_deduplicated,
+                deduplicator,
+                f"extract::{dedup_key}",
+                partial(
+                    _call_in_executor,
+                    executor,
+                    _measured_victim_messages(evidence, frame_interval_seconds=frame_interval_seconds),
+                ),
+                stage="extract",
+            ),
+        )
+        recorder.extend(extract_metrics)
+    except EvidenceTimeoutError as exc:
+        return StageExit(
+            _build_timeout_result(evidence, exc, source_type="vision", stage_metrics=recorder.metrics)
+        )
+    except Exception as exc:
+        return StageExit(_build_victim_error_result(evidence, exc, stage_metrics=recorder.metrics))
+
+    return _StagedEvidence(
+        evidence=evidence,
+        source_type="vision",
+        messages=messages,
+        extract_metrics=recorder.metrics,
+        cache_key=cache_key,
+        deadline=deadline,
+    )
+
+def _run_llm_stage(
+    staged: _StagedEvidence,
+    *,
+    llm_client,
+    cache: Optional[object] = None,
+    frame_interval_seconds: int = 3,
+    deduplicator: Optional[ContentDeduplicator] = None,
+) -> _StagedEvidence | StageExit:
+    evidence = staged.evidence
+    if staged.output_json is not None:
+        return staged
+
+    if evidence.type == "VICTIM":
+        try:
+            staged.output_json, shared_metrics = staged.deadline.run(
+                "llm",
+                partial(
+                    run_deduplicated,
+                    deduplicator,
+                    victim_dedup_key(evidence, frame_interval_seconds=frame_interval_seconds),
+                    lambda: (
+                        _generate_victim_output(llm_client, staged.messages, recorder=staged.recorder),
+                        [],
+                    ),
+                    stage="llm",
+                ),
+            )
+            staged.recorder.extend(shared_metrics)
+        except EvidenceTimeoutError as exc:
+            return StageExit(
+                _build_timeout_result(
+                    evidence,
+                    exc,
+                    source_type="vision",
+                    stage_metrics=staged.extract_metrics + staged.recorder.metrics,
+                )
+            )
+        except Exception as exc:
+            return StageExit(
+                _build_victim_error_result(
+                    evidence,
+                    exc,
+                    stage_metrics=staged.extract_metrics + staged.recorder.metrics,
+                )
+            )
+        staged.messages = None
+        if cache is not None:
+            cache.set(staged.cache_key, staged.output_json)
+        return staged
+
+    try:
+        (staged.output_json, staged.cache_hit, staged.cache_key), shared_metrics = staged.deadline.run(
+            "llm",
+            partial(
+                run_deduplicated,
+                deduplicator,
+                structuring_dedup_key(staged.struct_input),
+                lambda: (
+                    generate_structuring_output(
+                        input=staged.struct_input,
+                        llm_client=llm_client,
+                        evidence_id=evidence.evidence_id,
+                        cache=cache,
+                        recorder=staged.recorder,
+                        budget=STRUCTURING_TOKEN_BUDGET,
+                    ),
+                    [],
+                ),
+                stage="llm",
+            ),
+        )
+        staged.recorder.extend(shared_metrics)
+    except EvidenceTimeoutError as exc:
+        return StageExit(
+            _build_timeout_result(
+                evidence,
+                exc,
+                struct_input=staged.struct_input,
+                source_type=staged.source_type,
+                stage_metrics=staged.extract_metrics + staged.recorder.metrics,
+            )
+        )
+    except Exception as exc:
+        return StageExit(
+            _build_structuring_error_result(
+                evidence,
+                staged.struct_input,
+                staged.source_type,
+                exc,
+                stage_metrics=staged.extract_metrics + staged.recorder.metrics,
+            )
+        )
+    return staged
+
+def _run_postprocess_stage(
+    staged: _StagedEvidence,
+    *,
+    anchor_matcher: AnchorMatcher,
+    validator: StructuringValidatorV0,
+) -> EvidenceProcessingResult:
+    evidence = staged.evidence
+    if evidence.type == "VICTIM":
+        return _build_victim_completed_result(
+            evidence,
+            staged.output_json,
+            stage_metrics=staged.extract_metrics + staged.recorder.metrics,
+        )
+
+    try:
+        structuring_result = build_structuring_result(
+            staged.struct_input,
+            output_json=staged.output_json,
+            cache_hit=staged.cache_hit,
+            cache_key=staged.cache_key,
+            anchor_matcher=anchor_matcher,
+            validator=validator,
+            recorder=staged.recorder,
+        )
+    except Exception as exc:
+        return _build_structuring_error_result(
+            evidence,
+            staged.struct_input,
+            staged.source_type,
+            exc,
+            stage_metrics=staged.extract_metrics + staged.recorder.metrics,
+        )
+
+    return _build_completed_result(
+        evidence,
+        staged.struct_input,
+        staged.source_type,
+        structuring_result,
+        extract_metrics=staged.extract_metrics,
+    )
+
+def _call_in_executor(executor: Optional[Executor], fn: Callable[[], Any]) -> Any:
+    if executor is None:
+        return fn()
+    return executor.submit(fn).result()
+
+def _run_measured(
+    stage: str,
+    fn: Callable[[], Any],
+    **counters: Any,
+) -> Tuple[Any, List[StageMetrics]]:
+    # Measured where fn runs, so CPU time stays accurate inside executors.
+    recorder = StageRecorder()
+    with recorder.stage(stage, **counters):
+        value = fn()
+    return value, recorder.metrics
+
+def _run_measured_with_stage(
+    stage: str,
+    fn: Callable[[dict], Any],
+    **counters: Any,
+) -> Tuple[Any, List[StageMetrics]]:
+    # Like _run_measured, but fn can record its own counters on the stage.
+    recorder = StageRecorder()
+    with recorder.stage(stage, **counters) as stage_counters:
+        value = fn(stage_counters)
+    return value, recorder.metrics
+
+def _measured_extraction(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    stt_engine=None,
+    ocr_runner=None,
+) -> Callable[[], Tuple[Tuple[StructuringInput, str], List[StageMetrics]]]:
+    return partial(
+        _run_measured,
+        "extract",
+        partial(
+            _prepare_structuring_input,
+            evidence,
+            stt_engine=stt_engine,
+            ocr_runner=ocr_runner,
+        ),
+        input_bytes=_evidence_input_bytes(evidence),
+    )
+
+def _measured_victim_messages(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    frame_interval_seconds: int,
+) -> Callable[[], Tuple[list[dict], List[StageMetrics]]]:
+    return partial(
+        _run_measured_with_stage,
+        "extract",
+        partial(
+            _build_victim_messages,
+            evidence,
+            frame_interval_seconds=frame_interval_seconds,
+        ),
+        input_bytes=_evidence_input_bytes(evidence),
+    )
+
+def _evidence_input_bytes(evidence: TimelinePrototypeEvidenceInput) -> int:
+    if evidence.file_bytes is not None:
+        return len(evidence.file_bytes)
+    if evidence.extracted_text:
+        return len(evidence.extracted_text.encode("utf-8"))
+    return 0
+
+def process_single_evidence(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    llm_client,
+    anchor_matcher: Optional[AnchorMatcher] = None,
+    validator: Optional[StructuringValidatorV0] = None,
+    stt_engine=None,
+    ocr_runner=None,
+    cache: Optional[object] = None,
+    victim_video_frame_interval_seconds: int = 3,
+    deduplicator: Optional[ContentDeduplicator] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+    field_callback: Optional[EvidenceFieldCallback] = None,
+) -> EvidenceProcessingResult:
+    deadline = EvidenceDeadline(deadlines)
+    if evidence.type == "VICTIM":
+        return _process_victim_evidence(
+            evidence,
+            llm_client=llm_client,
+            cache=cache,
+            frame_interval_seconds=victim_video_frame_interval_seconds,
+            deduplicator=deduplicator,
+            deadline=deadline,
+        )
+
     if anchor_matcher is None:
         anchor_matcher = AnchorMatcher()
     if validator is None:
         validator = StructuringValidatorV0()
 
-    process_one = partial(
-        process_single_evidence,
-        llm_client=llm_client,
-        anchor_matcher=anchor_matcher,
-        validator=validator,
-        stt_engine=stt_engine,
-        ocr_runner=ocr_runner,
-        cache=cache,
-        victim_video_frame_interval_seconds=victim_video_frame_interval_seconds,
-    )
-    total = len(ai_input.evidences)
-    evidence_results: List[EvidenceProcessingResult] = []
+    try:
+        (struct_input, source_type), extract_metrics = deadline.run(
+            "extract",
+            partial(
+                run_deduplicated,
+                deduplicator,
+                extraction_dedup_key(evidence),
+                _measured_extraction(evidence, stt_engine=stt_engine, ocr_runner=ocr_runner),
+                stage="extract",
+            ),
+        )
+    except EvidenceTimeoutError as exc:
+        return _build_timeout_result(evidence, exc)
+    except EXTRACTION_ERRORS as exc:
+        return _build_extraction_error_result(evidence, exc)
 
-    for i, ev in enumerate(ai_input.evidences):
-        if cancel_callback is not None and cancel_callback():
-            break
-        result = process_one(ev)
-        if result is not None:
-            evidence_results.append(result)
-        if progress_callback is not None:
-            progress_callback(i + 1, total)
-            
-    items = _assemble_timeline_items(evidence_results)
-    return TimelinePrototypeOutput(
-        items=items,
-        model_version=model_version,
-        evidence_results=evidence_results,
+    recorder = StageRecorder()
+    try:
+        structuring_result, shared_metrics = deadline.run(
+            "llm",
+            partial(
+                run_deduplicated,
+                deduplicator,
+                structuring_dedup_key(struct_input),
+                lambda: (
+                    run_structuring_pipeline(
+                        input=struct_input,
+                        llm_client=llm_client,
+                        anchor_matcher=anchor_matcher,
+                        validator=validator,
+                        evidence_id=evidence.evidence_id,
+                        cache=cache,
+                        recorder=recorder,
+                        budget=STRUCTURING_TOKEN_BUDGET,
+                        on_field=_evidence_field_callback(field_callback, evidence),
+                    ),
+                    [],
+                ),
+                stage="llm",
+            ),
+        )
+    except EvidenceTimeoutError as exc:
+        return _build_timeout_result(
+            evidence,
+            exc,
+            struct_input=struct_input,
+            source_type=source_type,
+            stage_metrics=extract_metrics + recorder.metrics,
+        )
+    except Exception as exc:
+        return _build_structuring_error_result(
+            evidence,
+            struct_input,
+            source_type,
+            exc,
+            stage_metrics=extract_metrics + recorder.metrics,
+        )
+
+    if shared_metrics:
+        structuring_result = structuring_result.model_copy(update={"stage_metrics": shared_metrics})
+
+    return _build_completed_result(
+        evidence,
+        struct_input,
+        source_type,
+        structuring_result,
+        extract_metrics=extract_metrics,
     )
 
-def process_single_evidence(
+def _evidence_field_callback(
+    field_callback: Optional[EvidenceFieldCallback],
+    evidence: TimelinePrototypeEvidenceInput,
+) -> Optional[FieldCallback]:
+    if field_callback is None:
+        return None
+    return partial(field_callback, evidence.evidence_id)
+
+async def aprocess_single_evidence(
     evidence: TimelinePrototypeEvidenceInput,
     *,
     llm_client,
@@ -101,13 +1203,21 @@ def process_single_evidence(
     ocr_runner=None,
     cache: Optional[object] = None,
     victim_video_frame_interval_seconds: int = 3,
+    executor: Optional[Executor] = None,
+    deduplicator: Optional[ContentDeduplicator] = None,
+    deadlines: Optional[EvidenceDeadlines] = None,
+    field_callback: Optional[EvidenceFieldCallback] = None,
 ) -> EvidenceProcessingResult:
+    deadline = EvidenceDeadline(deadlines)
     if evidence.type == "VICTIM":
-        return _process_victim_evidence(
+        return await _aprocess_victim_evidence(
             evidence,
             llm_client=llm_client,
             cache=cache,
             frame_interval_seconds=victim_video_frame_interval_seconds,
+            executor=executor,
+            deduplicator=deduplicator,
+            deadline=deadline,
         )
 
     if anchor_matcher is None:
@@ -115,16 +1225,86 @@ def process_single_evidence(
     if validator is None:
         validator = StructuringValidatorV0()
 
-    temp_dir = _create_runtime_temp_dir(evidence) if evidence.file_bytes is not None else None
+    try:
+        (struct_input, source_type), extract_metrics = await deadline.arun(
+            "extract",
+            partial(
+                arun_deduplicated,
+                deduplicator,
+                extraction_dedup_key(evidence),
+                partial(
+                    arun_in_executor,
+                    executor,
+                    _measured_extraction(evidence, stt_engine=stt_engine, ocr_runner=ocr_runner),
+                ),
+                stage="extract",
+            ),
+        )
+    except EvidenceTimeoutError as exc:
+        return _build_timeout_result(evidence, exc)
+    except EXTRACTION_ERRORS as exc:
+        return _build_extraction_error_result(evidence, exc)
+
+    recorder = StageRecorder()
+
+    async def run_structuring():
+        structuring_result = await arun_structuring_pipeline(
+            input=struct_input,
+            llm_client=llm_client,
+            anchor_matcher=anchor_matcher,
+            validator=validator,
+            evidence_id=evidence.evidence_id,
+            cache=cache,
+            recorder=recorder,
+            budget=STRUCTURING_TOKEN_BUDGET,
+            on_field=_evidence_field_callback(field_callback, evidence),
+        )
+        return structuring_result, []
 
     try:
-        struct_input, source_type = _prepare_structuring_input(
+        structuring_result, shared_metrics = await deadline.arun(
+            "llm",
+            partial(
+                arun_deduplicated,
+                deduplicator,
+                structuring_dedup_key(struct_input),
+                run_structuring,
+                stage="llm",
+            ),
+        )
+    except EvidenceTimeoutError as exc:
+        return _build_timeout_result(
             evidence,
-            stt_engine=stt_engine,
-            ocr_runner=ocr_runner,
-            temp_dir=temp_dir,
+            exc,
+            struct_input=struct_input,
+            source_type=source_type,
+            stage_metrics=extract_metrics + recorder.metrics,
+        )
+    except Exception as exc:
+        return _build_structuring_error_result(
+            evidence,
+            struct_input,
+            source_type,
+            exc,
+            stage_metrics=extract_metrics + recorder.metrics,
         )
-    except NotImplementedError as exc:
+
+    if shared_metrics:
+        structuring_result = structuring_result.model_copy(update={"stage_metrics": shared_metrics})
+
+    return _build_completed_result(
+        evidence,
+        struct_input,
+        source_type,
+        structuring_result,
+        extract_metrics=extract_metrics,
+    )
+
+def _build_extraction_error_result(
+    evidence: TimelinePrototypeEvidenceInput,
+    exc: Exception,
+) -> EvidenceProcessingResult:
+    if isinstance(exc, NotImplementedError):
         return EvidenceProcessingResult(
             evidence_id=evidence.evidence_id,
             type=evidence.type,
@@ -132,7 +1312,7 @@ def process_single_evidence(
             error_code=UNSUPPORTED_FORMAT_ERROR,
             error_message=str(exc),
         )
-    except ModuleNotFoundError as exc:
+    if isinstance(exc, ModuleNotFoundError):
         return EvidenceProcessingResult(
             evidence_id=evidence.evidence_id,
             type=evidence.type,
@@ -140,7 +1320,7 @@ def process_single_evidence(
             error_code=MISSING_DEPENDENCY_ERROR,
             error_message=f"Missing dependency: {exc.name}",
         )
-    except (FileNotFoundError, OSError) as exc:
+    if isinstance(exc, OSError):
         return EvidenceProcessingResult(
             evidence_id=evidence.evidence_id,
             type=evidence.type,
@@ -148,35 +1328,68 @@ def process_single_evidence(
             error_code=FILE_READ_ERROR,
             error_message=str(exc),
         )
-    except ValueError as exc:
-        return EvidenceProcessingResult(
-            evidence_id=evidence.evidence_id,
-            type=evidence.type,
-            status="skipped",
-            error_code=MISSING_INPUT_ERROR,
-            error_message=str(exc),
-        )
-    try:
-        try:
-            structuring_result = run_structuring_pipeline(
-                input=struct_input,
-                llm_client=llm_client,
-                anchor_matcher=anchor_matcher,
-                validator=validator,
-                evidence_id=evidence.evidence_id,
-                cache=cache,
-            )
-        except Exception as exc:
-            return EvidenceProcessingResult(
-                evidence_id=evidence.evidence_id,
-                type=evidence.type,
-                status="failed",
-                source_type=source_type,
-                normalized_text=struct_input.full_text,
-                error_code=STRUCTURING_ERROR,
-                error_message=str(exc),
-            )
+    return EvidenceProcessingResult(
+        evidence_id=evidence.evidence_id,
+        type=evidence.type,
+        status="skipped",
+        error_code=MISSING_INPUT_ERROR,
+        error_message=str(exc),
+    )
+
+def _build_structuring_error_result(
+    evidence: TimelinePrototypeEvidenceInput,
+    struct_input: StructuringInput,
+    source_type: str,
+    exc: Exception,
+    *,
+    stage_metrics: Optional[List[StageMetrics]] = None,
+) -> EvidenceProcessingResult:
+    return EvidenceProcessingResult(
+        evidence_id=evidence.evidence_id,
+        type=evidence.type,
+        status="failed",
+        source_type=source_type,
+        normalized_text=struct_input.full_text,
+        error_code=STRUCTURING_ERROR,
+        error_message=str(exc),
+        stage_metrics=stage_metrics or [],
+    )
+
+def _build_timeout_result(
+    evidence: TimelinePrototypeEvidenceInput,
+    exc: EvidenceTimeoutError,
+    *,
+    struct_input: Optional[StructuringInput] = None,
+    source_type: Optional[str] = None,
+    stage_metrics: Optional[List[StageMetrics]] = None,
+) -> EvidenceProcessingResult:
+    # The timed out stage is reported at its deadline, whether or not it had
+    # recorded itself; abandoned work may still append to the recorder later.
+    stage_metrics = [metrics for metrics in stage_metrics or [] if metrics.stage != exc.stage]
+    return EvidenceProcessingResult(
+        evidence_id=evidence.evidence_id,
+        type=evidence.type,
+        status="failed",
+        source_type=source_type,
+        normalized_text=struct_input.full_text if struct_input is not None else None,
+        error_code=EVIDENCE_TIMEOUT_ERROR,
+        error_message=str(exc),
+        stage_metrics=[*stage_metrics, StageMetrics(stage=exc.stage, wall_ms=exc.seconds * 1000)],
+    )
+
+def _build_completed_result(
+    evidence: TimelinePrototypeEvidenceInput,
+    struct_input: StructuringInput,
+    source_type: str,
+    structuring_result: StructuringResult,
+    *,
+    extract_metrics: Optional[List[StageMetrics]] = None,
+) -> EvidenceProcessingResult:
+    recorder = StageRecorder()
+    recorder.extend(extract_metrics or [])
+    recorder.extend(structuring_result.stage_metrics)
 
+    with recorder.stage("tags"):
         normalized_text = struct_input.full_text.strip()
         title = _build_title(evidence, structuring_result.output_json)
         description = _build_description(
@@ -194,31 +1407,25 @@ def process_single_evidence(
         if timestamp is None:
             timestamp = evidence.file_created_at
 
-        return EvidenceProcessingResult(
-            evidence_id=evidence.evidence_id,
-            type=evidence.type,
-            status="completed",
-            source_type=source_type,
-            normalized_text=normalized_text,
-            structured_data=structuring_result.output_json,
-            timestamp=timestamp,
-            title=title,
-            description=description,
-            tags=tags,
-        )
-    finally:
-        if temp_dir is not None:
-            try:
-                shutil.rmtree(temp_dir)
-            except OSError:
-                pass
+    return EvidenceProcessingResult(
+        evidence_id=evidence.evidence_id,
+        type=evidence.type,
+        status="completed",
+        source_type=source_type,
+        normalized_text=normalized_text,
+        structured_data=structuring_result.output_json,
+        timestamp=timestamp,
+        title=title,
+        description=description,
+        tags=tags,
+        stage_metrics=recorder.metrics,
+    )
 
 def _prepare_structuring_input(
     evidence: TimelinePrototypeEvidenceInput,
     *,
     stt_engine=None,
     ocr_runner=None,
-    temp_dir: Optional[Path],
 ) -> Tuple[StructuringInput, str]:
     if evidence.type == "INCIDENT_LOG":
         if evidence.incident_log_form is not None:
@@ -236,24 +1443,23 @@ def _prepare_structuring_input(
     if evidence.extracted_text:
         return _prepare_structuring_input_from_extracted_text(evidence)
 
-    input_path = _materialize_input_file(evidence, temp_dir=temp_dir)
+    with EvidenceFiles(evidence) as files:
+        if evidence.type == "MESSAGE":
+            return _prepare_message_from_file(evidence, files, ocr_runner=ocr_runner)
 
-    if evidence.type == "MESSAGE":
-        return _prepare_message_from_file(evidence, input_path, ocr_runner=ocr_runner)
-
-    if evidence.type == "VOICE":
-        return _prepare_voice_from_file(
-            evidence,
-            input_path,
-            stt_engine=stt_engine,
-            ocr_runner=ocr_runner,
-        )
+        if evidence.type == "VOICE":
+            return _prepare_voice_from_file(
+                evidence,
+                files,
+                stt_engine=stt_engine,
+                ocr_runner=ocr_runner,
+            )
 
-    if evidence.type == "REPORT_RECORD":
-        return _prepare_report_record_from_file(evidence, input_path)
+        if evidence.type == "REPORT_RECORD":
+            return _prepare_report_record_from_file(evidence, files)
 
-    if evidence.type == "INCIDENT_LOG":
-        return _prepare_incident_log_from_file(evidence, input_path)
+        if evidence.type == "INCIDENT_LOG":
+            return _prepare_incident_log_from_file(evidence, files)
 
     raise NotImplementedError(f"{evidence.type} is not supported in prototype-1.")
 
@@ -263,7 +1469,178 @@ def _process_victim_evidence(
     llm_client,
     cache: Optional[object] = None,
     frame_interval_seconds: int = 3,
+    deduplicator: Optional[ContentDeduplicator] = None,
+    deadline: Optional[EvidenceDeadline] = None,
+) -> EvidenceProcessingResult:
+    skipped_result = _check_victim_evidence_input(evidence)
+    if skipped_result is not None:
+        return skipped_result
+
+    if deadline is None:
+        deadline = EvidenceDeadline()
+    recorder = StageRecorder()
+    try:
+        structured_data, shared_metrics = run_deduplicated(
+            deduplicator,
+            victim_dedup_key(evidence, frame_interval_seconds=frame_interval_seconds),
+            lambda: (
+                _generate_victim_structured_data(
+                    evidence,
+                    llm_client=llm_client,
+                    cache=cache,
+                    frame_interval_seconds=frame_interval_seconds,
+                    recorder=recorder,
+                    deadline=deadline,
+                ),
+                [],
+            ),
+            stage="llm",
+        )
+        recorder.extend(shared_metrics)
+    except EvidenceTimeoutError as exc:
+        return _build_timeout_result(evidence, exc, source_type="vision", stage_metrics=recorder.metrics)
+    except Exception as exc:
+        return _build_victim_error_result(evidence, exc, stage_metrics=recorder.metrics)
+
+    return _build_victim_completed_result(evidence, structured_data, stage_metrics=recorder.metrics)
+
+def _generate_victim_structured_data(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    llm_client,
+    cache: Optional[object],
+    frame_interval_seconds: int,
+    recorder: StageRecorder,
+    deadline: EvidenceDeadline,
+) -> dict:
+    cache_key = _compute_victim_cache_key(
+        evidence,
+        default_frame_interval_seconds=frame_interval_seconds,
+    )
+    cached_structured_data = _lookup_victim_cache(cache, cache_key, recorder=recorder)
+    if cached_structured_data is not None:
+        return cached_structured_data
+
+    messages, extract_metrics = deadline.run(
+        "extract",
+        _measured_victim_messages(evidence, frame_interval_seconds=frame_interval_seconds),
+    )
+    recorder.extend(extract_metrics)
+    structured_data = deadline.run(
+        "llm",
+        partial(_generate_victim_output, llm_client, messages, recorder=recorder),
+    )
+    if cache is not None:
+        cache.set(cache_key, structured_data)
+    return structured_data
+
+async def _aprocess_victim_evidence(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    llm_client,
+    cache: Optional[object] = None,
+    frame_interval_seconds: int = 3,
+    executor: Optional[Executor] = None,
+    deduplicator: Optional[ContentDeduplicator] = None,
+    deadline: Optional[EvidenceDeadline] = None,
 ) -> EvidenceProcessingResult:
+    skipped_result = _check_victim_evidence_input(evidence)
+    if skipped_result is not None:
+        return skipped_result
+
+    if deadline is None:
+        deadline = EvidenceDeadline()
+    recorder = StageRecorder()
+
+    async def generate():
+        structured_data = await _agenerate_victim_structured_data(
+            evidence,
+            llm_client=llm_client,
+            cache=cache,
+            frame_interval_seconds=frame_interval_seconds,
+            executor=executor,
+            recorder=recorder,
+            deadline=deadline,
+        )
+        return structured_data, []
+
+    try:
+        structured_data, shared_metrics = await arun_deduplicated(
+            deduplicator,
+            victim_dedup_key(evidence, frame_interval_seconds=frame_interval_seconds),
+            generate,
+            stage="llm",
+        )
+        recorder.extend(shared_metrics)
+    except EvidenceTimeoutError as exc:
+        return _build_timeout_result(evidence, exc, source_type="vision", stage_metrics=recorder.metrics)
+    except Exception as exc:
+        return _build_victim_error_result(evidence, exc, stage_metrics=recorder.metrics)
+
+    return _build_victim_completed_result(evidence, structured_data, stage_metrics=recorder.metrics)
+
+async def _agenerate_victim_structured_data(
+    evidence: TimelinePrototypeEvidenceInput,
+    *,
+    llm_client,
+    cache: Optional[object],
+    frame_interval_seconds: int,
+    executor: Optional[Executor],
+    recorder: StageRecorder,
+    deadline: EvidenceDeadline,
+) -> dict:
+    cache_key = _compute_victim_cache_key(
+        evidence,
+        default_frame_interval_seconds=frame_interval_seconds,
+    )
+    cached_structured_data = _lookup_victim_cache(cache, cache_key, recorder=recorder)
+    if cached_structured_data is not None:
+        return cached_structured_data
+
+    messages, extract_metrics = await deadline.arun(
+        "extract",
+        partial(
+            arun_in_executor,
+            executor,
+            _measured_victim_messages(evidence, frame_interval_seconds=frame_interval_seconds),
+        ),
+    )
+    recorder.extend(extract_metrics)
+    with recorder.stage("llm", measure_cpu=False, cache_hit=False) as stage:
+        response = await deadline.arun("llm", partial(agenerate_json_with, llm_client, messages))
+        record_llm_usage(stage, messages, response)
+    structured_data = response.data
+    if cache is not None:
+        cache.set(cache_key, structured_data)
+    return structured_data
+
+def _lookup_victim_cache(
+    cache: Optional[object],
+    cache_key: str,
+    *,
+    recorder: StageRecorder,
+) -> Optional[dict]:
+    if cache is None:
+        return None
+    with recorder.stage("cache") as stage:
+        cached_structured_data = cache.get(cache_key)
+        stage["cache_hit"] = cached_structured_data is not None
+    return cached_structured_data
+
+def _generate_victim_output(
+    llm_client,
+    messages: list[dict],
+    *,
+    recorder: StageRecorder,
+) -> dict:
+    with recorder.stage("llm", cache_hit=False) as stage:
+        response = generate_json_with(llm_client, messages)
+        record_llm_usage(stage, messages, response)
+    return response.data
+
+def _check_victim_evidence_input(
+    evidence: TimelinePrototypeEvidenceInput,
+) -> Optional[EvidenceProcessingResult]:
     if evidence.file_format not in {"IMAGE", "VIDEO"}:
         return EvidenceProcessingResult(
             evidence_id=evidence.evidence_id,
@@ -282,66 +1659,69 @@ def _process_victim_evidence(
             error_message="file_bytes is required for VICTIM IMAGE evidence.",
         )
 
-    temp_dir = _create_runtime_temp_dir(evidence)
-    try:
-        cache_key = _compute_victim_cache_key(
-            evidence,
-            default_frame_interval_seconds=frame_interval_seconds,
+    return None
+
+def _build_victim_messages(
+    evidence: TimelinePrototypeEvidenceInput,
+    stage: Optional[dict] = None,
+    *,
+    frame_interval_seconds: int,
+    budget: TokenBudget = VICTIM_VIDEO_TOKEN_BUDGET,
+) -> list[dict]:
+    if evidence.file_format == "IMAGE":
+        return build_victim_image_messages(
+            image_bytes=evidence.file_bytes,
+            file_name=evidence.file_name,
+            file_format=evidence.file_format,
         )
-        cached_structured_data = cache.get(cache_key) if cache is not None else None
 
-        if cached_structured_data is not None:
-            structured_data = cached_structured_data
-        elif evidence.file_format == "IMAGE":
-            messages = build_victim_image_messages(
-                image_bytes=evidence.file_bytes,
-                file_name=evidence.file_name,
-                file_format=evidence.file_format,
-            )
-            structured_data = json.loads(llm_client.generate(messages))
-            if cache is not None:
-                cache.set(cache_key, structured_data)
-        else:
-            input_path = _materialize_input_file(evidence, temp_dir=temp_dir)
-            frames_dir = temp_dir / "frames"
-            resolved_frame_interval_seconds = _resolve_victim_video_frame_interval_seconds(
-                input_path,
-                default_interval_seconds=frame_interval_seconds,
-            )
-            messages = None
-            if cache_key is None:
-                raise ValueError("cache_key must be available for VICTIM VIDEO.")
-            frames = extract_frames_from_video(
-                input_path,
-                output_dir=frames_dir,
-                interval_seconds=resolved_frame_interval_seconds,
-            )
-            messages = build_victim_video_messages(
-                frames=frames,
-                file_name=evidence.file_name,
-            )
-            structured_data = json.loads(llm_client.generate(messages))
-            if cache is not None:
-                cache.set(cache_key, structured_data)
-    except Exception as exc:
-        return EvidenceProcessingResult(
-            evidence_id=evidence.evidence_id,
-            type=evidence.type,
-            status="failed",
-            source_type="vision",
-            error_code=STRUCTURING_ERROR,
-            error_message=str(exc),
+    with EvidenceFiles(evidence) as files:
+        input_path = files.device_path()
+        resolved_frame_interval_seconds = _resolve_victim_video_frame_interval_seconds(
+            input_path,
+            default_interval_seconds=frame_interval_seconds,
         )
-    finally:
-        try:
-            shutil.rmtree(temp_dir)
-        except OSError:
-            pass
+        frames = extract_frames_from_video(
+            input_path,
+            output_dir=files.work_dir() / "frames",
+            interval_seconds=resolved_frame_interval_seconds,
+        )
+        messages, report = fit_video_frames(frames, budget, file_name=evidence.file_name)
+        report.record(stage)
+        return messages
 
-    description = _clean_victim_description(
-        _build_description(evidence, "", structured_data)
+def _build_victim_error_result(
+    evidence: TimelinePrototypeEvidenceInput,
+    exc: Exception,
+    *,
+    stage_metrics: Optional[List[StageMetrics]] = None,
+) -> EvidenceProcessingResult:
+    return EvidenceProcessingResult(
+        evidence_id=evidence.evidence_id,
+        type=evidence.type,
+        status="failed",
+        source_type="vision",
+        error_code=STRUCTURING_ERROR,
+        error_message=str(exc),
+        stage_metrics=stage_metrics or [],
     )
-    normalized_text = description or (evidence.file_name or str(evidence.evidence_id))
+
+def _build_victim_completed_result(
+    evidence: TimelinePrototypeEvidenceInput,
+    structured_data: dict,
+    *,
+    stage_metrics: Optional[List[StageMetrics]] = None,
+) -> EvidenceProcessingResult:
+    recorder = StageRecorder()
+    recorder.extend(stage_metrics or [])
+
+    with recorder.stage("tags"):
+        description = _clean_victim_description(
+            _build_description(evidence, "", structured_data)
+        )
+        normalized_text = description or (evidence.file_name or str(evidence.evidence_id))
+        title = _build_title(evidence, structured_data)
+        tags = _build_tags(structured_data)
 
     return EvidenceProcessingResult(
         evidence_id=evidence.evidence_id,
@@ -351,9 +1731,10 @@ def _process_victim_evidence(
         normalized_text=normalized_text,
         structured_data=structured_data,
         timestamp=evidence.file_created_at,
-        title=_build_title(evidence, structured_data),
+        title=title,
         description=description,
-        tags=_build_tags(structured_data),
+        tags=tags,
+        stage_metrics=recorder.metrics,
     )
 
 def _prepare_structuring_input_from_extracted_text(
@@ -382,7 +1763,7 @@ def _prepare_structuring_input_from_extracted_text(
 
 def _prepare_message_from_file(
     evidence: TimelinePrototypeEvidenceInput,
-    input_path: str,
+    files: EvidenceFiles,
     *,
     ocr_runner=None,
 ) -> Tuple[StructuringInput, str]:
@@ -391,12 +1772,12 @@ def _prepare_message_from_file(
 
     from ansimon_ai.ocr.from_ocr import build_structuring_input_from_ocr
 
-    ocr_result = _run_ocr(input_path, ocr_runner=ocr_runner)
+    ocr_result = _run_ocr(files, ocr_runner=ocr_runner)
     return build_structuring_input_from_ocr(ocr_result), "ocr"
 
 def _prepare_voice_from_file(
     evidence: TimelinePrototypeEvidenceInput,
-    input_path: str,
+    files: EvidenceFiles,
     *,
     stt_engine=None,
     ocr_runner=None,
@@ -404,22 +1785,22 @@ def _prepare_voice_from_file(
     if evidence.file_format == "IMAGE":
         from ansimon_ai.ocr.from_ocr import build_structuring_input_from_ocr
 
-        ocr_result = _run_ocr(input_path, ocr_runner=ocr_runner)
+        ocr_result = _run_ocr(files, ocr_runner=ocr_runner)
         return build_structuring_input_from_ocr(ocr_result), "ocr"
 
     if evidence.file_format == "AUDIO":
-        stt_result = _run_stt(input_path, stt_engine=stt_engine)
+        stt_result = _run_stt(files, stt_engine=stt_engine)
         return build_structuring_input_from_stt(stt_result), "stt"
 
     raise NotImplementedError("VOICE supports AUDIO or IMAGE only in prototype-1.")
 
 def _prepare_report_record_from_file(
     evidence: TimelinePrototypeEvidenceInput,
-    input_path: str,
+    files: EvidenceFiles,
 ) -> Tuple[StructuringInput, str]:
     return _prepare_document_evidence_from_file(
         evidence,
-        input_path,
+        files,
         unsupported_hwp_message="HWP report records are not supported yet.",
         unsupported_default_message=(
             "REPORT_RECORD supports extracted_text for all formats, and direct file "
@@ -429,11 +1810,11 @@ def _prepare_report_record_from_file(
 
 def _prepare_incident_log_from_file(
     evidence: TimelinePrototypeEvidenceInput,
-    input_path: str,
+    files: EvidenceFiles,
 ) -> Tuple[StructuringInput, str]:
     return _prepare_document_evidence_from_file(
         evidence,
-        input_path,
+        files,
         unsupported_hwp_message="HWP incident logs are not supported yet.",
         unsupported_default_message=(
             "INCIDENT_LOG supports incident_log_form or direct file handling for PDF, "
@@ -443,7 +1824,7 @@ def _prepare_incident_log_from_file(
 
 def _prepare_document_evidence_from_file(
     evidence: TimelinePrototypeEvidenceInput,
-    input_path: str,
+    files: EvidenceFiles,
     *,
     unsupported_hwp_message: str,
     unsupported_default_message: str,
@@ -452,17 +1833,17 @@ def _prepare_document_evidence_from_file(
         from ansimon_ai.pdf.document_structuring import build_structuring_input_from_document
         from ansimon_ai.pdf.extract_text_auto import extract_text_auto
 
-        texts = extract_text_auto(input_path)
-        return build_structuring_input_from_document(texts), "document"
+        texts = extract_text_auto(files.data)
+        return build_structuring_input_from_document(texts, coalesce=DOCUMENT_COALESCE), "document"
 
     if evidence.file_format == "TXT":
-        text = Path(input_path).read_text(encoding="utf-8")
+        text = files.data.decode("utf-8")
         return _build_document_structuring_input(text), "document"
 
     if evidence.file_format == "DOCX":
         from ansimon_ai.pdf.extract_text_docx import extract_text_from_docx
 
-        text = extract_text_from_docx(input_path)
+        text = extract_text_from_docx(files.data)
         if not text.strip():
             raise ValueError("DOCX text extraction returned empty text.")
         return _build_document_structuring_input(text), "document"
@@ -478,7 +1859,7 @@ def _build_document_structuring_input(text: str) -> StructuringInput:
     lines = [line for line in text.splitlines() if line.strip()]
     if not lines:
         lines = [text]
-    return build_structuring_input_from_document(lines)
+    return build_structuring_input_from_document(lines, coalesce=DOCUMENT_COALESCE)
 
 def _resolve_victim_video_frame_interval_seconds(
     input_path: str,
@@ -509,61 +1890,43 @@ def _compute_victim_cache_key(
         "file_format": evidence.file_format,
         "file_hash": file_hash,
         "frame_interval_seconds": default_frame_interval_seconds,
-        "prompt_version": "victim_prompt_v0",
+        "prompt_version": VICTIM_PROMPT_VERSION,
     }
     serialized = json.dumps(payload, ensure_ascii=False, sort_keys=True)
     return f"victim::{hashlib.sha256(serialized.encode('utf-8')).hexdigest()}"
 
-def _run_ocr(image_path: str, *, ocr_runner=None):
+def _run_ocr(files: EvidenceFiles, *, ocr_runner=None):
     if ocr_runner is not None:
-        return ocr_runner(image_path)
+        return ocr_runner(files.path())
 
     from ansimon_ai.ocr.from_ocr import ocr_image_to_result
 
-    return ocr_image_to_result(image_path)
+    return ocr_image_to_result(files.data)
 
-def _run_stt(audio_path: str, *, stt_engine=None):
+def _run_stt(files: EvidenceFiles, *, stt_engine=None):
     if stt_engine is not None:
-        return stt_engine.transcribe(audio_path)
-
-    from ansimon_ai.stt.whisper_stt import WhisperSTT
-
-    return WhisperSTT().transcribe(audio_path)
-
-def _materialize_input_file(evidence: TimelinePrototypeEvidenceInput, *, temp_dir: Path) -> str:
-    if evidence.file_bytes is None:
-        raise ValueError("file_bytes or extracted_text is required for this evidence.")
-
-    file_name = _resolve_temp_file_name(evidence)
-    file_path = temp_dir / file_name
-    file_path.write_bytes(evidence.file_bytes)
-    return str(file_path)
+        return stt_engine.transcribe(files.path())
 
-def _resolve_temp_file_name(evidence: TimelinePrototypeEvidenceInput) -> str:
-    if evidence.file_name:
-        return Path(evidence.file_name).name
+    engine = _default_stt_engine()
+    # Whisper's decoder hooks a kv-cache onto the shared model, so
+    # concurrent transcribe() calls would corrupt each other's output.
+    with _DEFAULT_STT_TRANSCRIBE_LOCK:
+        return engine.transcribe(files.device_path())
 
-    suffix = _default_suffix_for_format(evidence.file_format)
-    return f"{evidence.evidence_id}{suffix}"
+_DEFAULT_STT_LOCK = threading.Lock()
+_DEFAULT_STT_TRANSCRIBE_LOCK = threading.Lock()
+_default_stt = None
 
-def _default_suffix_for_format(file_format: Optional[str]) -> str:
-    mapping = {
-        "IMAGE": ".jpg",
-        "AUDIO": ".wav",
-        "VIDEO": ".mp4",
-        "PDF": ".pdf",
-        "HWP": ".hwp",
-        "DOCX": ".docx",
-        "TXT": ".txt",
-    }
-    return mapping.get(file_format or "", ".bin")
+def _default_stt_engine():
+    # Loading Whisper (and the diarizer) dominates a short clip, so the
+    # default engine is created once per process and shared by every build.
+    global _default_stt
+    with _DEFAULT_STT_LOCK:
+        if _default_stt is None:
+            from ansimon_ai.stt.whisper_stt import WhisperSTT
 
-def _create_runtime_temp_dir(evidence: TimelinePrototypeEvidenceInput) -> Path:
-    temp_dir = Path("data") / "_timeline_runtime_tmp" / str(evidence.evidence_id)
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir, ignore_errors=True)
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    return temp_dir
+            _default_stt = WhisperSTT()
+        return _default_stt
 
 def _incident_log_to_text(evidence: TimelinePrototypeEvidenceInput) -> str:
     form = evidence.incident_log_form
@@ -658,16 +2021,10 @@ def _clean_victim_description(description: str) -> str:
     return " ".join(kept).strip()
 
 def _is_incidental_hand_sentence(sentence: str) -> bool:
-    if not _contains_any(sentence, ("손가락", "손")):
+    hits = tag_rule_hits(sentence)
+    if "hand_reference" not in hits or "hand_injury" in hits:
         return False
-
-    if _contains_any(sentence, ("멍", "변색", "상처", "출혈", "부기", "붓", "찰과상")):
-        return False
-
-    return _contains_any(
-        sentence,
-        ("가리키", "짚고", "짚은", "지목", "포함", "보입니다", "나와 있습니다"),
-    )
+    return "hand_incidental" in hits
 
 def _extract_timeline_summary(structured_data: Optional[dict]) -> dict:
     if not isinstance(structured_data, dict):
@@ -739,129 +2096,20 @@ def _should_drop_weak_sexual_insult_tag(
     if not combined_text:
         return False
 
-    has_sexual_context = _contains_any(
-        combined_text,
-        (
-            "성적",
-            "성희롱",
-            "성추행",
-            "성폭력",
-            "음란",
-            "야한",
-            "몸매",
-            "가슴",
-            "엉덩이",
-            "벗어",
-            "만져",
-            "키스",
-            "자자",
-            "잘래",
-            "성관계",
-            "섹스",
-            "야동",
-        ),
-    )
-    has_direct_insult = _contains_any(
-        combined_text,
-        (
-            "미친",
-            "병신",
-            "새끼",
-            "걸레",
-            "창녀",
-            "변태",
-            "더럽",
-            "꺼져",
-            "모욕",
-        ),
-    )
-    if has_sexual_context:
+    hits = tag_rule_hits(combined_text)
+    if "sexual_context" in hits:
         return False
-    if has_direct_insult:
+    if "direct_insult" in hits:
         return _is_third_party_or_comparison_insult(combined_text)
-
-    weak_grievance_context = _contains_any(
-        combined_text,
-        (
-            "무시당",
-            "기분 나쁘",
-            "불만",
-            "대우",
-            "다른 사람",
-            "사이가 다르",
-            "관계",
-            "서운",
-            "비하",
-        ),
-    )
-    return weak_grievance_context
+    return "weak_grievance" in hits
 
 def _is_third_party_or_comparison_insult(text: str) -> bool:
-    third_party_context = _contains_any(
-        text,
-        (
-            "특정인을 비하",
-            "특정인 비하",
-            "제3자",
-            "다른 사람",
-            "선배",
-            "걔",
-            "쟤",
-            "그 사람",
-        ),
-    )
-    comparison_grievance_context = _contains_any(
-        text,
-        (
-            "무시당",
-            "기분 나쁘",
-            "기분 더럽",
-            "불만",
-            "대우",
-            "사이가 다르",
-            "관계",
-            "서운",
-            "비교",
-        ),
-    )
-    if third_party_context and comparison_grievance_context:
+    hits = tag_rule_hits(text)
+    if "third_party" in hits and "comparison_grievance" in hits:
         return True
-
-    if _contains_any(
-        text,
-        (
-            "피해자를",
-            "피해자한테",
-            "너는",
-            "너를",
-            "너한테",
-            "너 같은",
-            "당신",
-        ),
-    ):
+    if "victim_directed" in hits:
         return False
-
-    return _contains_any(
-        text,
-        (
-            "무시당",
-            "기분 나쁘",
-            "기분 더럽",
-            "불만",
-            "대우",
-            "다른 사람",
-            "사이가 다르",
-            "관계",
-            "서운",
-            "비하",
-            "특정인",
-            "제3자",
-            "선배",
-            "걔",
-            "쟤",
-            "그 사람",
-        ),
-    )
+    return "indirect_insult" in hits
 
 def _has_refusal_evidence(structured_data: dict, normalized_text: str) -> bool:
     refusal_signal = structured_data.get("refusal_signal")
@@ -874,26 +2122,7 @@ def _has_refusal_evidence(structured_data: dict, normalized_text: str) -> bool:
         for value in (summary.get("title"), summary.get("description"))
         if isinstance(value, str)
     )
-    return _contains_any(
-        combined_text,
-        (
-            "그만해",
-            "그만 하",
-            "그만",
-            "멈춰 달",
-            "멈춰달",
-            "멈춰",
-            "중단 요청",
-            "중단 의사",
-            "중단 요구",
-            "연락 중단",
-            "연락을 끊",
-            "연락하지 말",
-            "하지 말",
-            "하지마",
-            "거절",
-        ),
-    )
+    return "refusal" in tag_rule_hits(combined_text)
 
 def _build_tag_context_text(structured_data: dict, normalized_text: str) -> str:
     summary = _extract_timeline_summary(structured_data)
@@ -935,33 +2164,11 @@ def _should_drop_defensive_stt_threat_tag(
     if not combined_text:
         return False
 
-    has_block_bypass_context = _contains_any(
-        combined_text,
-        (
-            "차단",
-            "다른 번호",
-            "모르는 번호",
-            "낯선 번호",
-            "번호로 연락",
-            "번호로 전화",
-        ),
-    )
-    has_defensive_reporting = _contains_any(
-        combined_text,
-        (
-            "신고",
-            "고소",
-            "경찰",
-            "법적",
-            "끝까지 간다",
-            "끝까지 갈",
-            "끝까지 가",
-        ),
-    )
-    if not has_block_bypass_context or not has_defensive_reporting:
+    hits = tag_rule_hits(combined_text)
+    if "block_bypass" not in hits or "defensive_reporting" not in hits:
         return False
 
-    return not _contains_direct_threat_expression(combined_text)
+    return "direct_threat" not in hits
 
 def _extract_structured_list_values(structured_data: dict, key: str) -> List[str]:
     field = structured_data.get(key)
@@ -975,26 +2182,6 @@ def _extract_structured_list_values(structured_data: dict, key: str) -> List[str
         return [value]
     return []
 
-def _contains_any(text: str, terms: tuple[str, ...]) -> bool:
-    return any(term in text for term in terms)
-
-def _contains_direct_threat_expression(text: str) -> bool:
-    direct_threat_terms = (
-        "죽인다",
-        "죽일",
-        "죽여",
-        "해치",
-        "뒤지게",
-        "때려",
-        "맞고싶",
-        "찾아갈",
-        "가만 안",
-        "가만두지",
-        "불이익",
-        "보복",
-    )
-    return _contains_any(text, direct_threat_terms)
-
 def _extract_primary_timestamp(struct_input: StructuringInput):
     first_timestamp = None
     for segment in struct_input.segments:
@@ -1015,42 +2202,4 @@ def _extract_primary_timestamp(struct_input: StructuringInput):
 def _assemble_timeline_items(
     evidence_results: List[EvidenceProcessingResult],
 ) -> List[TimelineDateItem]:
-    completed = [result for result in evidence_results if result.status == "completed"]
-    if not completed:
-        return []
-
-    flat_evidences = [
-        {
-            "evidence_id": result.evidence_id,
-            "evidence_type": result.type,
-            "timestamp": result.timestamp,
-            "title": result.title or str(result.evidence_id),
-            "description": result.description or "",
-            "tags": list(result.tags),
-        }
-        for result in completed
-    ]
-
-    buckets = bucket_evidences_by_date_time(flat_evidences)
-    by_date: dict[str, List[TimelineEvent]] = {}
-
-    for date_str, time_str in _sorted_bucket_keys(buckets):
-        grouped = build_timeline_event_evidences(buckets[(date_str, time_str)])
-        event = TimelineEvent(
-            time=time_str,
-            evidences=[TimelineEvidenceItem(**item) for item in grouped],
-        )
-        by_date.setdefault(date_str, []).append(event)
-
-    return [TimelineDateItem(date=date, events=events) for date, events in by_date.items()]
-
-def _sorted_bucket_keys(buckets):
-    return sorted(
-        buckets.keys(),
-        key=lambda item: (_date_sort_key(item[0]), item[1]),
-    )
-
-def _date_sort_key(date_str: str):
-    if date_str == "UNKNOWN":
-        return (1, date_str)
-    return (0, date_str)
+    return assemble_timeline_items(evidence_results)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Literal, Optional, Set, Tuple
+
+from .types import TimelinePrototypeEvidenceInput
+
+ResourceClass = Literal["light", "raster", "audio", "video"]
+
+MB = 1024 * 1024
+GB = 1024 * MB
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Concurrency and memory limits per resource class.
+
+    ``base_bytes`` and ``payload_multiplier`` give the expected peak memory of
+    one evidence: decoded audio, rasterized pages and extracted frames are
+    several times larger than the uploaded file.
+    """
+
+    class_limits: Dict[str, int] = field(
+        default_factory=lambda: {"light": 16, "raster": 4, "audio": 2, "video": 1}
+    )
+    base_bytes: Dict[str, int] = field(
+        default_factory=lambda: {
+            "light": 16 * MB,
+            "raster": 256 * MB,
+            "audio": 512 * MB,
+            "video": 512 * MB,
+        }
+    )
+    payload_multiplier: Dict[str, float] = field(
+        default_factory=lambda: {"light": 4.0, "raster": 20.0, "audio": 16.0, "video": 8.0}
+    )
+    memory_budget_bytes: int = 4 * GB
+    rss_limit_bytes: Optional[int] = None
+
+def classify_evidence_resource(evidence: TimelinePrototypeEvidenceInput) -> ResourceClass:
+    if evidence.type == "INCIDENT_LOG" and evidence.incident_log_form is not None:
+        return "light"
+    if evidence.extracted_text:
+        return "light"
+    if evidence.file_format == "VIDEO":
+        return "video" if evidence.type == "VICTIM" else "audio"
+    if evidence.file_format == "AUDIO":
+        return "audio"
+    if evidence.file_format in {"PDF", "IMAGE"}:
+        return "raster"
+    return "light"
+
+def estimate_evidence_memory(
+    evidence: TimelinePrototypeEvidenceInput,
+    limits: ResourceLimits,
+) -> int:
+    resource_class = classify_evidence_resource(evidence)
+    payload_bytes = len(evidence.file_bytes) if evidence.file_bytes is not None else 0
+    return int(
+        limits.base_bytes.get(resource_class, 0)
+        + limits.payload_multiplier.get(resource_class, 1.0) * payload_bytes
+    )
+
+def current_rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+class ResourceGovernor:
+    """Admits evidences only while their resource class and memory budget allow.
+
+    One governor can be shared by several builds running at the same time.
+    An evidence larger than the whole budget is still admitted once nothing
+    else is in flight, so it cannot wait forever.
+    """
+
+    def __init__(self, limits: Optional[ResourceLimits] = None) -> None:
+        self.limits = limits or ResourceLimits()
+        self._condition = threading.Condition()
+        self._class_in_flight: Dict[str, int] = {}
+        self._bytes_in_flight = 0
+        self._in_flight = 0
+        # Async waiters may sit on different event loops than the releasing
+        # thread, so each one gets its own event set through its loop.
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def bytes_in_flight(self) -> int:
+        with self._condition:
+            return self._bytes_in_flight
+
+    def try_acquire(self, evidence: TimelinePrototypeEvidenceInput) -> bool:
+        resource_class = classify_evidence_resource(evidence)
+        need = estimate_evidence_memory(evidence, self.limits)
+        with self._condition:
+            if not self._can_admit(resource_class, need):
+                return False
+            self._class_in_flight[resource_class] = self._class_in_flight.get(resource_class, 0) + 1
+            self._bytes_in_flight += need
+            self._in_flight += 1
+            return True
+
+    def release(self, evidence: TimelinePrototypeEvidenceInput) -> None:
+        resource_class = classify_evidence_resource(evidence)
+        need = estimate_evidence_memory(evidence, self.limits)
+        with self._condition:
+            self._class_in_flight[resource_class] -= 1
+            self._bytes_in_flight -= need
+            self._in_flight -= 1
+            self._condition.notify_all()
+            async_waiters = list(self._async_waiters)
+        for loop, event in async_waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop already closed; nothing is left to wake.
+                pass
+
+    def wait_for_release(self, timeout: float) -> None:
+        with self._condition:
+            self._condition.wait(timeout)
+
+    def wait_and_acquire(
+        self,
+        evidence: TimelinePrototypeEvidenceInput,
+        *,
+        poll_seconds: float = 0.5,
+    ) -> None:
+        while not self.try_acquire(evidence):
+            # RSS can drop without a release, so waits are bounded.
+            self.wait_for_release(poll_seconds)
+
+    @contextmanager
+    def acquire(
+        self,
+        evidence: TimelinePrototypeEvidenceInput,
+        *,
+        poll_seconds: float = 0.5,
+    ) -> Iterator[None]:
+        self.wait_and_acquire(evidence, poll_seconds=poll_seconds)
+        try:
+            yield
+        finally:
+            self.release(evidence)
+
+    async def await_and_acquire(
+        self,
+        evidence: TimelinePrototypeEvidenceInput,
+        *,
+        poll_seconds: float = 0.5,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        # Without an RSS limit only a release frees capacity, so waits are unbounded.
+        timeout = poll_seconds if self.limits.rss_limit_bytes is not None else None
+        while True:
+            waiter = (loop, asyncio.Event())
+            # Registered before trying, so a release in between still wakes us.
+            with self._condition:
+                self._async_waiters.add(waiter)
+            try:
+                if self.try_acquire(evidence):
+                    return
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                with self._condition:
+                    self._async_waiters.discard(waiter)
+
+    @asynccontextmanager
+    async def aacquire(
+        self,
+        evidence: TimelinePrototypeEvidenceInput,
+        *,
+        poll_seconds: float = 0.5,
+    ) -> AsyncIterator[None]:
+        await self.await_and_acquire(evidence, poll_seconds=poll_seconds)
+        try:
+            yield
+        finally:
+            self.release(evidence)
+
+    def _can_admit(self, resource_class: str, need: int) -> bool:
+        if self._in_flight == 0:
+            return True
+
+        class_limit = self.limits.class_limits.get(resource_class)
+        if class_limit is not None and self._class_in_flight.get(resource_class, 0) >= class_limit:
+            return False
+        if self._bytes_in_flight + need > self.limits.memory_budget_bytes:
+            return False
+        if self.limits.rss_limit_bytes is not None:
+            rss = current_rss_bytes()
+            if rss is not None and rss + need > self.limits.rss_limit_bytes:
+                return False
+        return True
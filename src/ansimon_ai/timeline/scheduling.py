@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Literal, Optional, Sequence
+
+from .types import EvidenceProcessingResult, TimelinePrototypeEvidenceInput
+
+EvidenceSchedule = Literal["upload", "longest_first", "fast_first"]
+
+BYTES_PER_MB = 1024 * 1024
+
+# Rough wall-clock costs per cost route: a fixed part (extraction setup and the
+# LLM call) plus a part that grows with the payload (OCR pages, STT minutes,
+# video frames).
+DEFAULT_BASE_MS: Dict[str, float] = {
+    "FORM": 1500.0,
+    "TEXT": 1500.0,
+    "TXT": 1500.0,
+    "DOCX": 2000.0,
+    "HWP": 2000.0,
+    "PDF": 2500.0,
+    "IMAGE": 4000.0,
+    "AUDIO": 4000.0,
+    "VIDEO": 6000.0,
+}
+DEFAULT_MS_PER_MB: Dict[str, float] = {
+    "TXT": 100.0,
+    "DOCX": 500.0,
+    "HWP": 500.0,
+    "PDF": 4000.0,
+    "IMAGE": 1500.0,
+    "AUDIO": 20000.0,
+    "VIDEO": 15000.0,
+}
+UNKNOWN_BASE_MS = 500.0
+
+@dataclass
+class EvidenceCostModel:
+    """Estimates evidence processing cost in milliseconds.
+
+    Estimates come from the cost route (file format, or FORM/TEXT for
+    pre-extracted input) and the payload size. ``learn`` scales a route by the
+    stage timings observed in earlier runs.
+    """
+
+    base_ms: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_BASE_MS))
+    ms_per_mb: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MS_PER_MB))
+    route_scale: Dict[str, float] = field(default_factory=dict)
+    learning_rate: float = 0.3
+
+    def estimate(self, evidence: TimelinePrototypeEvidenceInput) -> float:
+        route = evidence_cost_route(evidence)
+        return self._static_estimate(evidence, route) * self.route_scale.get(route, 1.0)
+
+    def learn(
+        self,
+        evidences: Iterable[TimelinePrototypeEvidenceInput],
+        evidence_results: Iterable[EvidenceProcessingResult],
+    ) -> None:
+        by_id = {evidence.evidence_id: evidence for evidence in evidences}
+        for result in evidence_results:
+            evidence = by_id.get(result.evidence_id)
+            if evidence is None or not result.stage_metrics:
+                continue
+            if any(metrics.cache_hit for metrics in result.stage_metrics):
+                continue
+
+            route = evidence_cost_route(evidence)
+            observed_ms = sum(metrics.wall_ms for metrics in result.stage_metrics)
+            ratio = observed_ms / self._static_estimate(evidence, route)
+            previous = self.route_scale.get(route)
+            self.route_scale[route] = (
+                ratio
+                if previous is None
+                else previous + self.learning_rate * (ratio - previous)
+            )
+
+    def _static_estimate(self, evidence: TimelinePrototypeEvidenceInput, route: str) -> float:
+        size_mb = len(evidence.file_bytes) / BYTES_PER_MB if evidence.file_bytes is not None else 0.0
+        return (
+            self.base_ms.get(route, UNKNOWN_BASE_MS)
+            + self.ms_per_mb.get(route, 0.0) * size_mb
+        )
+
+def evidence_cost_route(evidence: TimelinePrototypeEvidenceInput) -> str:
+    if evidence.type == "INCIDENT_LOG" and evidence.incident_log_form is not None:
+        return "FORM"
+    if evidence.extracted_text:
+        return "TEXT"
+    return evidence.file_format or "UNKNOWN"
+
+def schedule_evidences(
+    evidences: Sequence[TimelinePrototypeEvidenceInput],
+    *,
+    schedule: EvidenceSchedule = "upload",
+    costs: Optional[Sequence[float]] = None,
+) -> List[int]:
+    """Returns evidence indices in the order they should be started."""
+    indices = list(range(len(evidences)))
+    if schedule == "upload":
+        return indices
+    if costs is None:
+        model = EvidenceCostModel()
+        costs = [model.estimate(evidence) for evidence in evidences]
+    if schedule == "longest_first":
+        # Longest processing time first keeps one expensive evidence from
+        # landing alone at the end of the run.
+        return sorted(indices, key=lambda index: -costs[index])
+    if schedule == "fast_first":
+        return sorted(indices, key=lambda index: costs[index])
+    raise ValueError(f"unknown evidence schedule: {schedule}")
+
+def progress_weights(costs: Sequence[float]) -> List[int]:
+    return [max(1, round(cost)) for cost in costs]
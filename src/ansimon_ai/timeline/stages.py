@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+@dataclass(frozen=True)
+class PipelineStage:
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+
+@dataclass(frozen=True)
+class StageExit:
+    """Returned by a stage to finish an item early with ``value`` as its result."""
+
+    value: Any
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int
+    processed: int = 0
+    busy_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0
+    max_queue_depth: int = 0
+    wall_seconds: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        capacity = self.wall_seconds * self.workers
+        if capacity <= 0:
+            return 0.0
+        return min(self.busy_seconds / capacity, 1.0)
+
+_STOP = object()
+_UNSET = object()
+
+class StagePipeline:
+    """Runs items through ordered stages, each with its own worker threads.
+
+    Stages are connected by queues, so item N+1 can be in an earlier stage
+    while item N is still in a later one. Results keep the input order.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[PipelineStage],
+        *,
+        max_in_flight: Optional[int] = None,
+    ) -> None:
+        if not stages:
+            raise ValueError("StagePipeline requires at least one stage.")
+        for stage in stages:
+            if stage.workers < 1:
+                raise ValueError(f"Stage '{stage.name}' requires at least one worker.")
+
+        self.stages = list(stages)
+        self.max_in_flight = max_in_flight or sum(stage.workers for stage in stages)
+        if self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be greater than 0.")
+
+    def run(
+        self,
+        items: Iterable[Any],
+        *,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_callback: Optional[Callable[[], bool]] = None,
+    ) -> Tuple[List[Any], List[StageStats]]:
+        items = list(items)
+        total = len(items)
+        stats = [StageStats(name=stage.name, workers=stage.workers) for stage in self.stages]
+        queues: List[queue.Queue] = [queue.Queue() for _ in self.stages]
+        slots: List[Any] = [_UNSET] * total
+        errors: List[BaseException] = []
+        lock = threading.Lock()
+        all_done = threading.Condition(lock)
+        admission = threading.Semaphore(self.max_in_flight)
+        counters = {"admitted": 0, "finished": 0}
+        last_stage = len(self.stages) - 1
+
+        def enqueue(stage_index: int, index: int, payload: Any) -> None:
+            stage_queue = queues[stage_index]
+            stage_queue.put((index, payload, time.perf_counter()))
+            with lock:
+                stage_stats = stats[stage_index]
+                stage_stats.max_queue_depth = max(stage_stats.max_queue_depth, stage_queue.qsize())
+
+        def finish(index: int, value: Any) -> None:
+            with lock:
+                slots[index] = value
+                counters["finished"] += 1
+                finished = counters["finished"]
+                all_done.notify_all()
+            try:
+                if progress_callback is not None and value is not _UNSET:
+                    progress_callback(finished, total)
+            except BaseException as exc:
+                # Raised on the caller's thread like a stage error; letting it
+                # escape would kill this worker and strand the items behind it.
+                with lock:
+                    errors.append(exc)
+            finally:
+                admission.release()
+
+        def work(stage_index: int) -> None:
+            stage = self.stages[stage_index]
+            stage_stats = stats[stage_index]
+            stage_queue = queues[stage_index]
+            while True:
+                entry = stage_queue.get()
+                if entry is _STOP:
+                    return
+
+                index, payload, enqueued_at = entry
+                if errors:
+                    finish(index, _UNSET)
+                    continue
+
+                started_at = time.perf_counter()
+                try:
+                    value = stage.fn(payload)
+                except BaseException as exc:
+                    with lock:
+                        errors.append(exc)
+                    finish(index, _UNSET)
+                    continue
+                finally:
+                    ended_at = time.perf_counter()
+                    with lock:
+                        stage_stats.processed += 1
+                        stage_stats.busy_seconds += ended_at - started_at
+                        stage_stats.queue_wait_seconds += started_at - enqueued_at
+
+                if isinstance(value, StageExit):
+                    finish(index, value.value)
+                elif stage_index == last_stage:
+                    finish(index, value)
+                else:
+                    enqueue(stage_index + 1, index, value)
+
+        threads = [
+            threading.Thread(
+                target=work,
+                args=(stage_index,),
+                name=f"stage-{stage.name}-{worker_index}",
+                daemon=True,
+            )
+            for stage_index, stage in enumerate(self.stages)
+            for worker_index in range(stage.workers)
+        ]
+        started_at = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        try:
+            for index, item in enumerate(items):
+                admission.acquire()
+                if errors or (cancel_callback is not None and cancel_callback()):
+                    admission.release()
+                    break
+                with lock:
+                    counters["admitted"] += 1
+                enqueue(0, index, item)
+
+            with lock:
+                while counters["finished"] < counters["admitted"]:
+                    all_done.wait()
+        finally:
+            for stage_index, stage in enumerate(self.stages):
+                for _ in range(stage.workers):
+                    queues[stage_index].put(_STOP)
+            for thread in threads:
+                thread.join()
+
+        wall_seconds = time.perf_counter() - started_at
+        for stage_stats in stats:
+            stage_stats.wall_seconds = wall_seconds
+
+        if errors:
+            raise errors[0]
+
+        return [value for value in slots if value is not _UNSET], stats
@@ -0,0 +1,121 @@
+from functools import lru_cache
+from typing import FrozenSet
+
+from ansimon_ai.structuring.lexicon import TermLexicon
+
+TAG_RULE_TERMS = {
+    "hand_reference": ("손가락", "손"),
+    "hand_injury": ("멍", "변색", "상처", "출혈", "부기", "붓", "찰과상"),
+    "hand_incidental": ("가리키", "짚고", "짚은", "지목", "포함", "보입니다", "나와 있습니다"),
+    "sexual_context": (
+        "성적",
+        "성희롱",
+        "성추행",
+        "성폭력",
+        "음란",
+        "야한",
+        "몸매",
+        "가슴",
+        "엉덩이",
+        "벗어",
+        "만져",
+        "키스",
+        "자자",
+        "잘래",
+        "성관계",
+        "섹스",
+        "야동",
+    ),
+    "direct_insult": ("미친", "병신", "새끼", "걸레", "창녀", "변태", "더럽", "꺼져", "모욕"),
+    "weak_grievance": (
+        "무시당",
+        "기분 나쁘",
+        "불만",
+        "대우",
+        "다른 사람",
+        "사이가 다르",
+        "관계",
+        "서운",
+        "비하",
+    ),
+    "third_party": (
+        "특정인을 비하",
+        "특정인 비하",
+        "제3자",
+        "다른 사람",
+        "선배",
+        "걔",
+        "쟤",
+        "그 사람",
+    ),
+    "comparison_grievance": (
+        "무시당",
+        "기분 나쁘",
+        "기분 더럽",
+        "불만",
+        "대우",
+        "사이가 다르",
+        "관계",
+        "서운",
+        "비교",
+    ),
+    "victim_directed": ("피해자를", "피해자한테", "너는", "너를", "너한테", "너 같은", "당신"),
+    "indirect_insult": (
+        "무시당",
+        "기분 나쁘",
+        "기분 더럽",
+        "불만",
+        "대우",
+        "다른 사람",
+        "사이가 다르",
+        "관계",
+        "서운",
+        "비하",
+        "특정인",
+        "제3자",
+        "선배",
+        "걔",
+        "쟤",
+        "그 사람",
+    ),
+    "refusal": (
+        "그만해",
+        "그만 하",
+        "그만",
+        "멈춰 달",
+        "멈춰달",
+        "멈춰",
+        "중단 요청",
+        "중단 의사",
+        "중단 요구",
+        "연락 중단",
+        "연락을 끊",
+        "연락하지 말",
+        "하지 말",
+        "하지마",
+        "거절",
+    ),
+    "block_bypass": ("차단", "다른 번호", "모르는 번호", "낯선 번호", "번호로 연락", "번호로 전화"),
+    "defensive_reporting": ("신고", "고소", "경찰", "법적", "끝까지 간다", "끝까지 갈", "끝까지 가"),
+    "direct_threat": (
+        "죽인다",
+        "죽일",
+        "죽여",
+        "해치",
+        "뒤지게",
+        "때려",
+        "맞고싶",
+        "찾아갈",
+        "가만 안",
+        "가만두지",
+        "불이익",
+        "보복",
+    ),
+}
+
+TAG_RULE_LEXICON = TermLexicon(TAG_RULE_TERMS)
+
+@lru_cache(maxsize=32)
+def tag_rule_hits(text: str) -> FrozenSet[str]:
+    # The tag rules look at the same combined text several times per evidence.
+    return TAG_RULE_LEXICON.find(text)
@@ -4,6 +4,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from ansimon_ai.structuring.types import StageMetrics, StageMetricsSummary
+
 EvidenceType = Literal[
     "MESSAGE",
     "VOICE",
@@ -66,6 +68,7 @@ class EvidenceProcessingResult(BaseModel):
     tags: List[TimelineTagType] = Field(default_factory=list)
     error_code: Optional[str] = None
     error_message: Optional[str] = None
+    stage_metrics: List[StageMetrics] = Field(default_factory=list)
 
 class TimelineEvidenceItem(BaseModel):
     timeline_evidence_id: UUID
@@ -88,4 +91,13 @@ class TimelineDateItem(BaseModel):
 class TimelinePrototypeOutput(BaseModel):
     items: List[TimelineDateItem]
     model_version: str
-    evidence_results: List[EvidenceProcessingResult] = Field(default_factory=list)
\ No newline at end of file
+    evidence_results: List[EvidenceProcessingResult] = Field(default_factory=list)
+    stage_summary: List[StageMetricsSummary] = Field(default_factory=list)
+
+class TimelineStreamEvent(BaseModel):
+    kind: Literal["evidence", "snapshot", "final"]
+    completed: int
+    total: int
+    evidence_result: Optional[EvidenceProcessingResult] = None
+    items: Optional[List[TimelineDateItem]] = None
+    output: Optional[TimelinePrototypeOutput] = None
@@ -1,10 +1,14 @@
-import json
+from collections.abc import Iterator
+from typing import Any, Callable, Optional, Tuple
 
-from ansimon_ai.llm.base import LLMClient
+from ansimon_ai.llm.base import LLMClient, generate_json_with
+from ansimon_ai.llm.streaming import iter_json_fields_with
+from ansimon_ai.prompting.budget import BudgetReport, TokenBudget, fit_writing_messages
 from ansimon_ai.prompting.build_messages import (
     build_complaint_document_messages,
     build_damage_facts_statement_messages,
 )
+from ansimon_ai.structuring.metrics import StageRecorder, record_llm_usage
 from schemas.complaint_writing import (
     ComplaintDocumentOutput,
     ComplaintWritingAiInput,
@@ -15,16 +19,87 @@ def generate_complaint_document(
     ai_input: ComplaintWritingAiInput,
     *,
     llm_client: LLMClient,
+    recorder: Optional[StageRecorder] = None,
+    budget: Optional[TokenBudget] = None,
 ) -> ComplaintDocumentOutput:
-    messages = build_complaint_document_messages(ai_input)
-    raw_output = llm_client.generate(messages)
-    return ComplaintDocumentOutput.model_validate(json.loads(raw_output))
+    messages, report = _build_messages(ai_input, build_complaint_document_messages, budget)
+    data = _generate_json(llm_client, messages, recorder=recorder, report=report)
+    return ComplaintDocumentOutput.model_validate(data)
 
 def generate_damage_facts_statement(
     ai_input: ComplaintWritingAiInput,
     *,
     llm_client: LLMClient,
+    recorder: Optional[StageRecorder] = None,
+    budget: Optional[TokenBudget] = None,
 ) -> DamageFactsStatementOutput:
-    messages = build_damage_facts_statement_messages(ai_input)
-    raw_output = llm_client.generate(messages)
-    return DamageFactsStatementOutput.model_validate(json.loads(raw_output))
\ No newline at end of file
+    messages, report = _build_messages(ai_input, build_damage_facts_statement_messages, budget)
+    data = _generate_json(llm_client, messages, recorder=recorder, report=report)
+    return DamageFactsStatementOutput.model_validate(data)
+
+def stream_complaint_document_sections(
+    ai_input: ComplaintWritingAiInput,
+    *,
+    llm_client: LLMClient,
+    recorder: Optional[StageRecorder] = None,
+    budget: Optional[TokenBudget] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """Yields (section, value) as each section completes, then validates the document."""
+    messages, report = _build_messages(ai_input, build_complaint_document_messages, budget)
+    data = yield from _stream_json(llm_client, messages, recorder=recorder, report=report)
+    ComplaintDocumentOutput.model_validate(data)
+
+def stream_damage_facts_statement_sections(
+    ai_input: ComplaintWritingAiInput,
+    *,
+    llm_client: LLMClient,
+    recorder: Optional[StageRecorder] = None,
+    budget: Optional[TokenBudget] = None,
+) -> Iterator[Tuple[str, Any]]:
+    messages, report = _build_messages(ai_input, build_damage_facts_statement_messages, budget)
+    data = yield from _stream_json(llm_client, messages, recorder=recorder, report=report)
+    DamageFactsStatementOutput.model_validate(data)
+
+def _build_messages(
+    ai_input: ComplaintWritingAiInput,
+    build: Callable[[ComplaintWritingAiInput], list[dict]],
+    budget: Optional[TokenBudget],
+) -> Tuple[list[dict], Optional[BudgetReport]]:
+    if budget is None:
+        return build(ai_input), None
+    return fit_writing_messages(ai_input, budget, build=build)
+
+def _generate_json(
+    llm_client: LLMClient,
+    messages: list[dict],
+    *,
+    recorder: Optional[StageRecorder],
+    report: Optional[BudgetReport],
+) -> dict:
+    if recorder is None:
+        return generate_json_with(llm_client, messages).data
+
+    with recorder.stage("writing", cache_hit=False) as stage:
+        if report is not None:
+            report.record(stage)
+        response = generate_json_with(llm_client, messages)
+        record_llm_usage(stage, messages, response)
+    return response.data
+
+def _stream_json(
+    llm_client: LLMClient,
+    messages: list[dict],
+    *,
+    recorder: Optional[StageRecorder],
+    report: Optional[BudgetReport],
+):
+    if recorder is None:
+        response = yield from iter_json_fields_with(llm_client, messages)
+        return response.data
+
+    with recorder.stage("writing", cache_hit=False) as stage:
+        if report is not None:
+            report.record(stage)
+        response = yield from iter_json_fields_with(llm_client, messages)
+        record_llm_usage(stage, messages, response)
+    return response.data
@@ -0,0 +1,45 @@
+import json
+
+from ansimon_ai.eval.runner_v0 import run_eval_case_v0
+from ansimon_ai.eval.types_v0 import EvalCaseV0
+from ansimon_ai.llm.base import LLMResponse
+from ansimon_ai.llm.mock import MockLLMClient
+
+class UsageReportingLLMClient(MockLLMClient):
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        text = self.generate(messages)
+        return LLMResponse(
+            text=text,
+            data=json.loads(text),
+            prompt_tokens=800,
+            completion_tokens=150,
+            cached_prompt_tokens=0,
+            model="gpt-5-mini",
+        )
+
+def _case() -> EvalCaseV0:
+    return EvalCaseV0.model_validate(
+        {
+            "case_id": "usage",
+            "input": {"kind": "text", "text": "거의 매일 연락이 왔다"},
+            "expected": {
+                "requirement_state": {"state": "EVALUATABLE"},
+                "event_io": {"policy": "allow"},
+            },
+        }
+    )
+
+def test_run_eval_case_v0_fills_token_usage():
+    result = run_eval_case_v0(case=_case(), llm_client=UsageReportingLLMClient())
+
+    usage = result.usage_metrics
+    assert (usage.prompt_tokens, usage.completion_tokens, usage.total_tokens) == (800, 150, 950)
+    assert usage.cached_prompt_tokens == 0
+    assert usage.cached_prompt_ratio == 0.0
+    assert usage.estimated_cost == (800 * 0.25 + 150 * 2.0) / 1_000_000
+
+def test_run_eval_case_v0_leaves_usage_empty_without_provider_usage():
+    result = run_eval_case_v0(case=_case(), llm_client=MockLLMClient())
+
+    assert result.usage_metrics.prompt_tokens is None
+    assert result.usage_metrics.estimated_cost is None
@@ -0,0 +1,59 @@
+import asyncio
+import json
+
+from ansimon_ai.llm import (
+    CachingLLMClient,
+    JsonFileLLMCache,
+    LLMResponse,
+    MockLLMClient,
+    llm_cache_key,
+)
+
+class CountingLLMClient:
+    model = "gpt-5-mini"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        self.calls += 1
+        text = MockLLMClient().generate(messages)
+        return LLMResponse(text=text, data=json.loads(text), prompt_tokens=100, completion_tokens=20)
+
+def _messages(text: str) -> list[dict]:
+    return [{"role": "user", "content": text}]
+
+def test_llm_cache_key_depends_on_model_messages_and_format():
+    key = llm_cache_key(_messages("a"), model="m", response_format={"type": "json_object"})
+
+    assert key == llm_cache_key(_messages("a"), model="m", response_format={"type": "json_object"})
+    assert key != llm_cache_key(_messages("b"), model="m", response_format={"type": "json_object"})
+    assert key != llm_cache_key(_messages("a"), model="other", response_format={"type": "json_object"})
+    assert key != llm_cache_key(_messages("a"), model="m", response_format=None)
+
+def test_caching_client_reuses_responses_and_evicts_least_recent():
+    inner = CountingLLMClient()
+    client = CachingLLMClient(inner, max_entries=2)
+
+    first = client.generate_json(_messages("a"))
+    again = client.generate_json(_messages("a"))
+    assert inner.calls == 1
+    assert first.prompt_tokens == 100 and not first.cache_hit
+    assert again.cache_hit and again.prompt_tokens is None and again.data == first.data
+
+    client.generate(_messages("b"))
+    client.generate(_messages("a"))
+    client.generate(_messages("c"))
+    client.generate(_messages("b"))
+    assert inner.calls == 4
+    assert (client.hits, client.misses) == (2, 4)
+
+def test_caching_client_persistent_tier_survives_new_clients(tmp_path):
+    backend = JsonFileLLMCache(tmp_path)
+    inner = CountingLLMClient()
+
+    CachingLLMClient(inner, backend).generate(_messages("a"))
+    response = asyncio.run(CachingLLMClient(inner, backend).agenerate_json(_messages("a")))
+
+    assert inner.calls == 1
+    assert response.cache_hit
@@ -0,0 +1,64 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from ansimon_ai.llm import (
+    CassetteMissError,
+    LLMResponse,
+    MockLLMClient,
+    RecordingLLMClient,
+    ReplayLLMClient,
+)
+
+class CountingLLMClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        self.calls += 1
+        time.sleep(0.02)
+        text = json.dumps({"call": self.calls})
+        return LLMResponse(text=text, data=json.loads(text), prompt_tokens=10, completion_tokens=2)
+
+def _messages(text: str) -> list[dict]:
+    return [{"role": "user", "content": text}]
+
+def test_recorded_responses_replay_in_order_with_usage(tmp_path):
+    path = tmp_path / "llm.jsonl"
+    recorder = RecordingLLMClient(CountingLLMClient(), path)
+    recorder.generate(_messages("a"))
+    recorder.generate(_messages("a"))
+    recorder.generate(_messages("b"))
+
+    replay = ReplayLLMClient(path)
+
+    assert replay.generate_json(_messages("a")).data == {"call": 1}
+    assert replay.generate_json(_messages("a")).data == {"call": 2}
+    assert replay.generate_json(_messages("a")).data == {"call": 1}
+    response = asyncio.run(replay.agenerate_json(_messages("b")))
+    assert (response.data, response.prompt_tokens, response.completion_tokens) == ({"call": 3}, 10, 2)
+    assert '"content"' not in path.read_text(encoding="utf-8")
+
+def test_replay_misses_raise_or_use_the_fallback(tmp_path):
+    path = tmp_path / "llm.jsonl"
+    RecordingLLMClient(CountingLLMClient(), path).generate(_messages("a"))
+
+    with pytest.raises(CassetteMissError):
+        ReplayLLMClient(path).generate(_messages("other"))
+    fallback = ReplayLLMClient(path, fallback=MockLLMClient())
+    assert "timeline_summary" in fallback.generate_json(_messages("other")).data
+
+def test_replay_injects_recorded_latency(tmp_path):
+    path = tmp_path / "llm.jsonl"
+    RecordingLLMClient(CountingLLMClient(), path).generate(_messages("a"))
+
+    started_at = time.perf_counter()
+    ReplayLLMClient(path).generate(_messages("a"))
+    assert time.perf_counter() - started_at < 0.015
+
+    for latency in ("recorded", "sampled"):
+        started_at = time.perf_counter()
+        ReplayLLMClient(path, latency=latency, seed=1).generate(_messages("a"))
+        assert time.perf_counter() - started_at >= 0.015
@@ -0,0 +1,80 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from ansimon_ai.llm import HedgedLLMClient, LatencyTracker, LLMClient
+
+class SequencedLLMClient(LLMClient):
+    """Answers call n after delays[n] seconds with {"call": n}."""
+
+    def __init__(self, delays: list[float]) -> None:
+        self.delays = delays
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _next_call(self) -> int:
+        with self._lock:
+            call = self.calls
+            self.calls += 1
+        return call
+
+    def generate(self, messages: list[dict]) -> str:
+        call = self._next_call()
+        time.sleep(self.delays[call])
+        return json.dumps({"call": call})
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        call = self._next_call()
+        await asyncio.sleep(self.delays[call])
+        return json.dumps({"call": call})
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window=10)
+    assert tracker.percentile(0.95) is None
+    for value in range(20):
+        tracker.record(float(value))
+
+    assert len(tracker) == 10
+    assert tracker.percentile(0.5) == 15.0
+    assert tracker.percentile(0.99) == 19.0
+
+def test_hedged_client_returns_the_faster_duplicate():
+    inner = SequencedLLMClient([1.0, 0.01])
+    client = HedgedLLMClient(inner, hedge_after_seconds=0.05)
+
+    started_at = time.perf_counter()
+    assert client.generate_json([]).data == {"call": 1}
+    assert time.perf_counter() - started_at < 0.5
+    assert client.hedged_requests == 1
+    client.close()
+
+def test_hedged_client_does_not_hedge_fast_requests_or_without_delay():
+    inner = SequencedLLMClient([0.0, 0.0])
+    assert HedgedLLMClient(inner, hedge_after_seconds=1.0).generate([]) == '{"call": 0}'
+    assert HedgedLLMClient(inner).generate([]) == '{"call": 1}'
+    assert inner.calls == 2
+
+def test_hedged_client_uses_observed_percentile_once_warm():
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.record(0.02)
+    client = HedgedLLMClient(SequencedLLMClient([]), tracker=tracker, min_samples=20)
+
+    assert client.hedge_delay() == pytest.approx(0.02)
+
+def test_async_hedged_client_cancels_the_slower_request():
+    inner = SequencedLLMClient([1.0, 0.01])
+    client = HedgedLLMClient(inner, hedge_after_seconds=0.05)
+
+    async def run():
+        started_at = time.perf_counter()
+        output = (await client.agenerate_json([])).data
+        return output, time.perf_counter() - started_at
+
+    output, elapsed = asyncio.run(run())
+    assert output == {"call": 1}
+    assert elapsed < 0.5
+    assert client.hedged_requests == 1
@@ -0,0 +1,44 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from ansimon_ai.llm import LLMResponse, agenerate_json_with, generate_json_with
+from ansimon_ai.llm.openai_client import _parse_json_response
+
+class TextOnlyLLMClient:
+    def generate(self, messages: list[dict]) -> str:
+        return '{"value": 1}'
+
+class ParsedLLMClient(TextOnlyLLMClient):
+    def __init__(self) -> None:
+        self.json_calls = 0
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        self.json_calls += 1
+        return LLMResponse(text='{"value": 2}', data={"value": 2})
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        return self.generate_json(messages)
+
+def _response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+def test_generate_json_with_parses_text_only_clients():
+    response = generate_json_with(TextOnlyLLMClient(), [])
+    assert response == LLMResponse(text='{"value": 1}', data={"value": 1})
+    assert asyncio.run(agenerate_json_with(TextOnlyLLMClient(), [])).data == {"value": 1}
+
+def test_generate_json_with_reuses_the_client_parse():
+    client = ParsedLLMClient()
+    assert generate_json_with(client, []).data == {"value": 2}
+    assert asyncio.run(agenerate_json_with(client, [])).data == {"value": 2}
+    assert client.json_calls == 2
+
+def test_parse_json_response_returns_text_and_data():
+    assert _parse_json_response(_response('{"a": [1]}')) == LLMResponse(text='{"a": [1]}', data={"a": [1]})
+    with pytest.raises(ValueError, match="empty content"):
+        _parse_json_response(_response(""))
+    with pytest.raises(json.JSONDecodeError):
+        _parse_json_response(_response("not json"))
@@ -0,0 +1,185 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from ansimon_ai.llm.base import LLMResponse
+from ansimon_ai.llm.caching import CachingLLMClient
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.llm.openai_client import AsyncOpenAILLMClient, OpenAILLMClient
+from ansimon_ai.llm.streaming import (
+    IncrementalJSONObjectParser,
+    StreamUsage,
+    astream_json_with,
+    stream_json_with,
+    stream_with,
+)
+
+DOCUMENT = {
+    "title": "a, \"quoted\" } title",
+    "tags": ["repeat", "threat"],
+    "parties": {"actor": "x", "nested": {"list": [1, {"k": "]"}]}},
+    "count": 3,
+    "flag": False,
+    "empty": None,
+}
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_parser_emits_each_top_level_field_once(size: int) -> None:
+    text = json.dumps(DOCUMENT, ensure_ascii=False, indent=2)
+    parser = IncrementalJSONObjectParser()
+
+    fields = []
+    for chunk in _chunks(text, size):
+        fields.extend(parser.feed(chunk))
+
+    assert fields == list(DOCUMENT.items())
+    assert parser.close() == DOCUMENT
+
+def test_parser_emits_fields_before_the_document_ends() -> None:
+    parser = IncrementalJSONObjectParser()
+
+    assert parser.feed('{"tags": ["a"') == []
+    assert parser.feed('], "timeline_summary": {"title": "t"}') == [("tags", ["a"])]
+    assert parser.feed(", ") == [("timeline_summary", {"title": "t"})]
+
+def test_parser_close_rejects_truncated_document() -> None:
+    parser = IncrementalJSONObjectParser()
+    parser.feed('{"tags": ["a"], "title": "unfinished')
+
+    with pytest.raises(json.JSONDecodeError):
+        parser.close()
+
+def test_stream_with_falls_back_to_a_single_chunk() -> None:
+    class SyncOnlyLLMClient:
+        def generate(self, messages):
+            return '{"a": 1}'
+
+    assert list(stream_with(SyncOnlyLLMClient(), [])) == ['{"a": 1}']
+
+def test_stream_json_with_reports_fields_in_order() -> None:
+    client = MockLLMClient()
+    seen: list[str] = []
+
+    response = stream_json_with(client, [], lambda key, value: seen.append(key))
+
+    assert len(list(client.stream([]))) > 1
+    assert seen == list(response.data)
+    assert response.data == json.loads(client.generate([]))
+
+def test_astream_json_with_matches_sync_stream() -> None:
+    seen: list[str] = []
+
+    response = asyncio.run(
+        astream_json_with(MockLLMClient(), [], lambda key, value: seen.append(key))
+    )
+
+    assert seen == list(response.data)
+    assert response.data == json.loads(MockLLMClient().generate([]))
+
+def _sdk_chunks(text: str) -> list:
+    chunks = [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))], usage=None)
+        for part in _chunks(text, 4)
+    ]
+    usage = SimpleNamespace(
+        prompt_tokens=120,
+        completion_tokens=30,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=64),
+    )
+    chunks.append(SimpleNamespace(choices=[], usage=usage, model="gpt-test"))
+    return chunks
+
+class FakeCompletions:
+    def __init__(self, chunks: list) -> None:
+        self.chunks = chunks
+        self.kwargs: dict = {}
+
+    def create(self, **kwargs):
+        self.kwargs = kwargs
+        return iter(self.chunks)
+
+class FakeAsyncCompletions(FakeCompletions):
+    async def create(self, **kwargs):
+        self.kwargs = kwargs
+
+        async def chunks():
+            for chunk in self.chunks:
+                yield chunk
+
+        return chunks()
+
+def _openai_client(client_cls, completions):
+    # Built without __init__, so the openai package is not needed.
+    client = object.__new__(client_cls)
+    client.model = "gpt-test"
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    client._semaphore = None
+    return client
+
+def test_stream_json_with_returns_usage_of_openai_streams() -> None:
+    completions = FakeCompletions(_sdk_chunks('{"title": "t", "count": 3}'))
+    client = _openai_client(OpenAILLMClient, completions)
+    seen = []
+
+    response = stream_json_with(client, [], lambda key, value: seen.append(key))
+
+    assert completions.kwargs["stream_options"] == {"include_usage": True}
+    assert seen == ["title", "count"]
+    assert response.data == {"title": "t", "count": 3}
+    assert (response.prompt_tokens, response.completion_tokens, response.cached_prompt_tokens) == (120, 30, 64)
+    assert response.model == "gpt-test"
+
+def test_astream_json_with_returns_usage_of_openai_streams() -> None:
+    completions = FakeAsyncCompletions(_sdk_chunks('{"title": "t"}'))
+    client = _openai_client(AsyncOpenAILLMClient, completions)
+
+    response = asyncio.run(astream_json_with(client, [], lambda key, value: None))
+
+    assert completions.kwargs["stream_options"] == {"include_usage": True}
+    assert response.total_tokens == 150
+
+def test_stream_with_keeps_usage_out_of_the_text() -> None:
+    class UsageStreamingClient:
+        def stream(self, messages: list[dict]):
+            yield '{"a": 1}'
+            yield StreamUsage(prompt_tokens=5, completion_tokens=2)
+
+    usage: list[StreamUsage] = []
+
+    assert list(stream_with(UsageStreamingClient(), [], usage_sink=usage.append)) == ['{"a": 1}']
+    assert usage == [StreamUsage(prompt_tokens=5, completion_tokens=2)]
+
+class UsageReportingClient:
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        data = {"title": "t", "count": 3}
+        return LLMResponse(text=json.dumps(data), data=data, prompt_tokens=7, completion_tokens=2)
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        return self.generate_json(messages)
+
+def test_stream_json_with_falls_back_through_wrappers_with_usage_and_cache_hits() -> None:
+    client = CachingLLMClient(UsageReportingClient())
+    seen: list[str] = []
+
+    first = stream_json_with(client, [], lambda key, value: seen.append(key))
+    second = stream_json_with(client, [], lambda key, value: seen.append(key))
+
+    assert seen == ["title", "count", "title", "count"]
+    assert first.total_tokens == 9
+    assert not first.cache_hit
+    assert second.cache_hit
+
+def test_astream_json_with_falls_back_through_wrappers_with_usage() -> None:
+    seen: list[str] = []
+
+    response = asyncio.run(
+        astream_json_with(CachingLLMClient(UsageReportingClient()), [], lambda key, value: seen.append(key))
+    )
+
+    assert seen == ["title", "count"]
+    assert response.total_tokens == 9
@@ -0,0 +1,157 @@
+import asyncio
+import math
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ansimon_ai.llm import (
+    InMemoryRateLimitStore,
+    LLMClient,
+    LLMResponse,
+    RateLimitedLLMClient,
+    RateLimiter,
+    SQLiteRateLimitStore,
+    estimate_message_tokens,
+)
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after=None) -> None:
+        super().__init__("rate limited")
+        headers = {"retry-after": retry_after} if retry_after is not None else {}
+        self.response = SimpleNamespace(headers=headers)
+
+class FlakyLLMClient(LLMClient):
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def generate(self, messages: list[dict]) -> str:
+        raise AssertionError("generate_json is used")
+
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RateLimitError(retry_after="0")
+        return LLMResponse(text="{}", data={}, prompt_tokens=30, completion_tokens=10)
+
+    async def agenerate_json(self, messages: list[dict]) -> LLMResponse:
+        return self.generate_json(messages)
+
+def test_rate_limiter_paces_requests_per_minute():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=60, clock=clock)
+
+    assert [limiter.reserve(0) for _ in range(60)] == [0.0] * 60
+    assert limiter.reserve(0) == pytest.approx(1.0)
+    assert limiter.reserve(0) == pytest.approx(2.0)
+    clock.now += 2.0
+    assert limiter.reserve(0) == pytest.approx(1.0)
+
+def test_rate_limiter_tracks_tokens_and_corrections():
+    clock = FakeClock()
+    limiter = RateLimiter(tokens_per_minute=600, clock=clock)
+
+    assert limiter.reserve(500) == 0.0
+    assert limiter.reserve(200) == pytest.approx(10.0)
+    limiter.adjust(-200)
+    assert limiter.reserve(100) == 0.0
+
+def test_rate_limiter_backoff_blocks_every_caller():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=1000, clock=clock)
+
+    limiter.backoff(5.0)
+    assert limiter.reserve(0) == pytest.approx(5.0)
+    clock.now += 5.0
+    assert limiter.reserve(0) == 0.0
+
+def test_sqlite_store_shares_buckets_between_limiters(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "limits.sqlite3"
+    first = RateLimiter(requests_per_minute=2, store=SQLiteRateLimitStore(path), clock=clock)
+    second = RateLimiter(requests_per_minute=2, store=SQLiteRateLimitStore(path), clock=clock)
+
+    assert first.reserve(0) == 0.0
+    assert second.reserve(0) == 0.0
+    assert first.reserve(0) == pytest.approx(30.0)
+
+    unlimited = RateLimiter(store=SQLiteRateLimitStore(tmp_path / "open.sqlite3"), clock=clock)
+    assert unlimited.reserve(10**9) == 0.0
+    assert unlimited.reserve(10**9) == 0.0
+    assert math.isinf(unlimited.store.transact("default", lambda state: (state, state.tokens)))
+
+def test_rate_limited_client_retries_429_and_corrects_usage():
+    clock = FakeClock()
+    limiter = RateLimiter(tokens_per_minute=10**6, clock=clock)
+    inner = FlakyLLMClient(failures=2)
+    client = RateLimitedLLMClient(inner, limiter, expected_output_tokens=100)
+
+    assert client.generate_json([{"role": "user", "content": "x" * 40}]).data == {}
+    assert inner.calls == 3
+    # Only the successful call's real usage stays charged.
+    level = limiter.store.transact("default", lambda state: (state, state.tokens))
+    assert level == pytest.approx(10**6 - 40)
+
+def test_rate_limited_client_gives_up_after_max_retries():
+    client = RateLimitedLLMClient(FlakyLLMClient(failures=5), RateLimiter(), max_retries=1)
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(client.agenerate_json([]))
+
+def test_rate_limited_client_rejects_wrapped_clients_with_sdk_retries():
+    inner = FlakyLLMClient(failures=0)
+    inner.client = SimpleNamespace(max_retries=2)
+    wrapper = SimpleNamespace(inner=inner)
+
+    with pytest.raises(ValueError, match="max_retries=0"):
+        RateLimitedLLMClient(wrapper, RateLimiter())
+    assert inner.client.max_retries == 2
+
+    inner.client = SimpleNamespace(max_retries=0)
+    RateLimitedLLMClient(wrapper, RateLimiter())
+
+def test_rate_limited_client_updates_the_limiter_off_the_event_loop():
+    store_threads = []
+
+    class RecordingStore(InMemoryRateLimitStore):
+        def transact(self, key, fn):
+            store_threads.append(threading.get_ident())
+            return super().transact(key, fn)
+
+    client = RateLimitedLLMClient(
+        FlakyLLMClient(failures=1),
+        RateLimiter(store=RecordingStore()),
+    )
+
+    async def call() -> int:
+        await client.agenerate_json([])
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(call())
+
+    # reserve, back-off refund and block, reserve again, usage correction.
+    assert len(store_threads) == 5
+    assert loop_thread not in store_threads
+
+def test_estimate_message_tokens_counts_text_and_images():
+    messages = [
+        {"role": "system", "content": "a" * 10},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "b" * 20},
+                {"type": "image_url", "image_url": {"url": "data:"}},
+            ],
+        },
+    ]
+    assert estimate_message_tokens(messages, image_tokens=100) == 15 + 100 + 8
@@ -0,0 +1,23 @@
+import pytest
+
+from ansimon_ai.llm.usage import ModelPricing, estimate_llm_cost, find_model_pricing
+
+def test_find_model_pricing_prefers_the_longest_matching_model():
+    assert find_model_pricing("gpt-5-mini-2025-08-07") == find_model_pricing("gpt-5-mini")
+    assert find_model_pricing("gpt-5-mini") != find_model_pricing("gpt-5")
+    assert find_model_pricing("gpt-5x") is None
+    assert find_model_pricing(None) is None
+
+def test_estimate_llm_cost_discounts_cached_prompt_tokens():
+    pricing = {"model": ModelPricing(input=1.0, cached_input=0.1, output=4.0)}
+
+    cost = estimate_llm_cost(
+        "model",
+        prompt_tokens=1_000_000,
+        completion_tokens=500_000,
+        cached_prompt_tokens=200_000,
+        pricing=pricing,
+    )
+
+    assert cost == pytest.approx(0.8 + 0.02 + 2.0)
+    assert estimate_llm_cost("other", prompt_tokens=1, completion_tokens=1, pricing=pricing) is None
@@ -1,6 +1,8 @@
+from io import BytesIO
+
 from PIL import Image
 
-from ansimon_ai.ocr.clova_ocr import _parse_clova_ocr_response
+from ansimon_ai.ocr.clova_ocr import _parse_clova_ocr_response, _read_image_input
 from ansimon_ai.ocr.layout import assign_speaker_sides
 from ansimon_ai.ocr.from_ocr import ocr_image_to_result
 from ansimon_ai.ocr.types import OCRResult, OCRSegment, OCRVertex
@@ -90,6 +92,17 @@ def test_ocr_image_to_result_accepts_pil_image(monkeypatch):
 
     assert ocr_image_to_result(image, engine="clova", lang="kor") is expected
 
+def test_read_image_input_keeps_original_bytes():
+    buffer = BytesIO()
+    Image.new("RGB", (8, 8), "white").save(buffer, format="JPEG")
+    image_bytes = buffer.getvalue()
+
+    payload, image_format, name = _read_image_input(image_bytes)
+
+    assert payload is image_bytes
+    assert image_format == "jpg"
+    assert name == "image.jpg"
+
 def test_ocr_segment_coordinate_properties():
     segment = OCRSegment(
         text="안녕하세요",
@@ -95,4 +95,21 @@ def test_extract_text_from_docx_combines_text_table_and_image_ocr(monkeypatch):
         engine="clova",
     )
 
-    assert text == "first paragraph\ncell A | cell B\nimage ocr text"
\ No newline at end of file
+    assert text == "first paragraph\ncell A | cell B\nimage ocr text"
+def test_extract_text_from_docx_images_accepts_bytes(monkeypatch):
+    docx_path = _write_docx_with_images()
+
+    monkeypatch.setattr(
+        extract_text_docx_module,
+        "ocr_image_to_result",
+        lambda image_input, *, engine=None, lang=None: OCRResult(
+            full_text="bytes ocr text",
+            segments=[OCRSegment(text="bytes ocr text")],
+            language="ko",
+            engine="mock",
+        ),
+    )
+
+    texts = extract_text_docx_module._extract_text_from_docx_images(docx_path.read_bytes())
+
+    assert texts == ["bytes ocr text"]
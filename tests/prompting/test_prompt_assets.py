@@ -0,0 +1,72 @@
+from uuid import uuid4
+
+from ansimon_ai.prompting.assets import PROMPT_ASSETS, PromptAssetRegistry
+from ansimon_ai.prompting.build_messages import (
+    build_damage_facts_statement_messages,
+    build_structuring_messages,
+    load_system_prompt,
+)
+from ansimon_ai.stt.types import STTResult, STTSegment
+from ansimon_ai.structuring.from_stt import build_structuring_input_from_stt
+from ansimon_ai.structuring.types import StructuringInput
+from schemas.complaint_writing import ComplaintWritingAiInput
+
+def _stt_input(text: str, speaker: str) -> StructuringInput:
+    return build_structuring_input_from_stt(
+        STTResult(
+            full_text=text,
+            segments=[STTSegment(start=0.0, end=2.0, text=text, speaker=speaker)],
+            language="ko",
+            engine="whisper-base",
+        )
+    )
+
+def _shared_prefix_length(left: str, right: str) -> int:
+    length = 0
+    for a, b in zip(left, right):
+        if a != b:
+            break
+        length += 1
+    return length
+
+def test_prompt_asset_registry_reads_each_prompt_once(tmp_path):
+    prompt_path = tmp_path / "prompt_v3.txt"
+    prompt_path.write_text("first", encoding="utf-8")
+    registry = PromptAssetRegistry(tmp_path)
+    registry.register("demo", "prompt_v3.txt", version="v3")
+
+    asset = registry.get("demo")
+    prompt_path.write_text("second", encoding="utf-8")
+
+    assert registry.get("demo") is asset
+    assert asset.text == "first"
+    assert asset.fingerprint.startswith("demo@v3:")
+    assert registry.fingerprints() == {"demo": asset.fingerprint}
+
+def test_load_system_prompt_comes_from_the_registry():
+    assert load_system_prompt() is PROMPT_ASSETS.get("structuring").text
+    assert set(PROMPT_ASSETS.fingerprints()) == {
+        "complaint_document",
+        "damage_facts_statement",
+        "structuring",
+    }
+
+def test_stt_messages_share_the_static_notes_as_a_prefix():
+    first = build_structuring_messages(_stt_input("그만 연락해.", "SPEAKER_00"))
+    second = build_structuring_messages(_stt_input("다른 번호로 전화했어.", "SPEAKER_01"))
+
+    assert first[0] == second[0]
+    first_user = first[1]["content"]
+    second_user = second[1]["content"]
+    shared = first_user[:_shared_prefix_length(first_user, second_user)]
+    assert "SPEAKER ROLE CONSISTENCY NOTE" in shared
+    assert "one detected speaker only" in shared
+
+def test_writing_messages_put_the_instruction_before_the_input():
+    first = build_damage_facts_statement_messages(ComplaintWritingAiInput(complaint_id=uuid4(), items=[]))
+    second = build_damage_facts_statement_messages(ComplaintWritingAiInput(complaint_id=uuid4(), items=[]))
+
+    shared_length = _shared_prefix_length(first[1]["content"], second[1]["content"])
+    assert first[1]["content"][:shared_length].startswith(
+        "Write the damage facts statement strictly from the provided input."
+    )
@@ -0,0 +1,48 @@
+import json
+
+from ansimon_ai.pdf.document_structuring import build_structuring_input_from_document
+from ansimon_ai.prompting.build_messages import build_structuring_messages
+from ansimon_ai.prompting.segments import (
+    COMPACT_SEGMENTS_HEADER,
+    decode_compact_segments,
+    encode_segments,
+)
+from ansimon_ai.stt.types import STTResult, STTSegment
+from ansimon_ai.structuring.from_stt import build_structuring_input_from_stt
+
+def test_compact_encoding_points_into_full_text_and_drops_defaults():
+    struct_input = build_structuring_input_from_document(["그만 연락해", "다른 번호", "그만 연락해"])
+
+    encoded = encode_segments(struct_input, "compact")
+    lines = [json.loads(line) for line in encoded[len(COMPACT_SEGMENTS_HEADER):].splitlines()]
+
+    assert lines == [{"span": [0, 6]}, {"span": [7, 12]}, {"span": [13, 19]}]
+    assert decode_compact_segments(struct_input.full_text, encoded) == struct_input.segments
+
+def test_compact_encoding_keeps_times_speakers_and_unmatched_text():
+    struct_input = build_structuring_input_from_stt(
+        STTResult(
+            full_text="SPEAKER_00: 지금 어디야",
+            segments=[
+                STTSegment(start=0.5, end=2.0, text="지금 어디야", speaker="SPEAKER_00"),
+                STTSegment(start=2.0, end=3.0, text="안 받으면 찾아갈 거야"),
+            ],
+            language="ko",
+            engine="whisper-base",
+        )
+    )
+
+    encoded = encode_segments(struct_input, "compact")
+
+    assert '"text":"안 받으면 찾아갈 거야"' in encoded
+    assert decode_compact_segments(struct_input.full_text, encoded) == struct_input.segments
+
+def test_build_structuring_messages_selects_encoding():
+    struct_input = build_structuring_input_from_document(["첫 줄", "둘째 줄"])
+
+    pretty = build_structuring_messages(struct_input)[1]["content"]
+    compact = build_structuring_messages(struct_input, segment_encoding="compact")[1]["content"]
+
+    assert COMPACT_SEGMENTS_HEADER in compact
+    assert "### SEGMENTS (json)" in pretty
+    assert len(compact) < len(pretty)
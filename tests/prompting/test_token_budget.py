@@ -0,0 +1,122 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.pdf.document_structuring import build_structuring_input_from_document
+from ansimon_ai.prompting.budget import (
+    TokenBudget,
+    TokenBudgetExceededError,
+    fit_structuring_messages,
+    fit_video_frames,
+    fit_writing_messages,
+)
+from ansimon_ai.prompting.build_messages import (
+    build_complaint_document_messages,
+    build_victim_video_messages,
+)
+from ansimon_ai.structuring.call import call_structuring_ai
+from ansimon_ai.video import ExtractedVideoFrame
+from schemas.complaint_writing import (
+    ComplaintWritingAiInput,
+    ComplaintWritingStructuredContext,
+)
+
+def _document_input(line_count: int):
+    lines = [f"{index}번째 메시지: 오늘도 집 앞에서 기다리고 있었다" for index in range(line_count)]
+    return build_structuring_input_from_document(lines + ["", lines[0]])
+
+def test_fit_structuring_messages_leaves_small_inputs_untouched():
+    struct_input = _document_input(3)
+
+    _, report = fit_structuring_messages(struct_input, TokenBudget(max_prompt_tokens=100_000))
+
+    assert report.within_budget
+    assert report.trimmed == {}
+    assert report.estimated_tokens == report.original_tokens
+
+def test_fit_structuring_messages_drops_redundant_segments_first():
+    struct_input = _document_input(40)
+    full_budget = TokenBudget(max_prompt_tokens=100_000)
+    _, full_report = fit_structuring_messages(struct_input, full_budget, segment_encoding="compact")
+
+    budget = TokenBudget(max_prompt_tokens=full_report.estimated_tokens - 5)
+    messages, report = fit_structuring_messages(struct_input, budget, segment_encoding="compact")
+
+    assert report.trimmed == {"segments": 1}
+    assert report.estimated_tokens <= budget.max_prompt_tokens
+    assert report.original_tokens == full_report.estimated_tokens
+    # The empty line goes before any real message, and INPUT TEXT stays whole.
+    assert struct_input.full_text in messages[1]["content"]
+
+def test_fit_structuring_messages_raises_when_full_text_alone_is_over_budget():
+    struct_input = _document_input(40)
+
+    with pytest.raises(TokenBudgetExceededError) as excinfo:
+        fit_structuring_messages(struct_input, TokenBudget(max_prompt_tokens=500))
+
+    assert excinfo.value.report.trimmed["segments"] == len(struct_input.segments)
+
+def test_call_structuring_ai_records_budget_on_stage():
+    struct_input = _document_input(40)
+    _, full_report = fit_structuring_messages(struct_input, TokenBudget(max_prompt_tokens=100_000))
+    stage: dict = {}
+
+    call_structuring_ai(
+        struct_input,
+        MockLLMClient(),
+        stage=stage,
+        budget=TokenBudget(max_prompt_tokens=full_report.estimated_tokens - 5),
+    )
+
+    # The default json segments switch to compact before anything is dropped.
+    assert stage["trimmed"] == {"segment_encoding": 1}
+    assert stage["estimated_prompt_tokens"] < full_report.estimated_tokens
+
+def test_fit_video_frames_keeps_evenly_spaced_frames(tmp_path):
+    frames = []
+    for index in range(10):
+        path = tmp_path / f"frame{index}.jpg"
+        path.write_bytes(b"frame")
+        frames.append(ExtractedVideoFrame(path=path, frame_index=index, frame_timestamp_seconds=index * 3))
+    base_tokens = TokenBudget(max_prompt_tokens=0).estimate(
+        build_victim_video_messages(frames=[], file_name="victim.mp4")
+    )
+    budget = TokenBudget(max_prompt_tokens=base_tokens + 4 * 860)
+
+    messages, report = fit_video_frames(frames, budget, file_name="victim.mp4")
+
+    captions = [
+        part["text"]
+        for message in messages
+        if isinstance(message["content"], list)
+        for part in message["content"]
+        if part.get("type") == "text" and part["text"].startswith("Scene at")
+    ]
+    assert report.trimmed == {"frames": 6}
+    assert report.estimated_tokens <= budget.max_prompt_tokens
+    assert captions == [f"Scene at {seconds} seconds" for seconds in (0, 9, 18, 27)]
+
+def test_fit_writing_messages_drops_trailing_structured_contexts():
+    contexts = [
+        ComplaintWritingStructuredContext(
+            evidence_id=uuid4(),
+            period=f"2026-02-{day:02d}",
+            action_types=["반복 연락", "주거지 방문"],
+            impact_on_victim=["불안감", "수면 장애"],
+        )
+        for day in range(1, 11)
+    ]
+    ai_input = ComplaintWritingAiInput(complaint_id=uuid4(), items=[], structured_contexts=contexts)
+    full_tokens = TokenBudget(max_prompt_tokens=100_000).estimate(build_complaint_document_messages(ai_input))
+    budget = TokenBudget(max_prompt_tokens=full_tokens - 100)
+
+    messages, report = fit_writing_messages(ai_input, budget)
+
+    dropped = report.trimmed["structured_contexts"]
+    assert 0 < dropped < len(contexts)
+    assert report.estimated_tokens <= budget.max_prompt_tokens
+    user_text = json.dumps(messages, ensure_ascii=False)
+    assert contexts[0].period in user_text
+    assert contexts[-1].period not in user_text
@@ -1,6 +1,8 @@
+import asyncio
+
 from ansimon_ai.stt.mock import MockSTT
 from ansimon_ai.structuring.from_stt import build_structuring_input_from_stt
-from ansimon_ai.structuring.call import call_structuring_ai
+from ansimon_ai.structuring.call import acall_structuring_ai, call_structuring_ai
 from ansimon_ai.llm.mock import MockLLMClient
 
 def test_call_structuring_ai_smoke():
@@ -30,4 +32,31 @@ def test_call_structuring_ai_smoke():
         "timeline_summary",
     }
 
-    assert set(result.keys()) == expected_keys
\ No newline at end of file
+    assert set(result.keys()) == expected_keys
+def test_acall_structuring_ai_accepts_async_and_sync_clients():
+    stt_result = MockSTT().transcribe("dummy.mp3")
+    struct_input = build_structuring_input_from_stt(stt_result)
+
+    class SyncOnlyLLMClient:
+        def generate(self, messages):
+            return MockLLMClient().generate(messages)
+
+    async_result = asyncio.run(acall_structuring_ai(struct_input, MockLLMClient()))
+    sync_result = asyncio.run(acall_structuring_ai(struct_input, SyncOnlyLLMClient()))
+
+    assert async_result == sync_result
+    assert "timeline_summary" in async_result
+
+def test_call_structuring_ai_streams_fields_to_callback():
+    stt_result = MockSTT().transcribe("dummy.mp3")
+    struct_input = build_structuring_input_from_stt(stt_result)
+    fields = {}
+
+    result = call_structuring_ai(
+        struct_input,
+        MockLLMClient(),
+        on_field=lambda key, value: fields.setdefault(key, value),
+    )
+
+    assert fields == result
+    assert fields["timeline_summary"]["value"]["title"] == "반복 연락 정황"
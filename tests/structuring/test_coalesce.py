@@ -0,0 +1,73 @@
+from ansimon_ai.pdf.document_structuring import build_structuring_input_from_document
+from ansimon_ai.stt.types import STTResult, STTSegment
+from ansimon_ai.structuring.coalesce import (
+    DOCUMENT_COALESCE,
+    STT_COALESCE,
+    CoalesceConfig,
+    SourceSegment,
+    coalesce_segments,
+)
+from ansimon_ai.structuring.from_stt import build_structuring_input_from_stt
+
+def test_coalesce_without_config_keeps_one_segment_per_source():
+    lines = ["첫 줄", "2025.03.01 오후 3:10 둘째 줄"]
+
+    coalesced = coalesce_segments([SourceSegment(text=line) for line in lines])
+
+    assert [segment.text for segment in coalesced.segments] == lines
+    assert coalesced.segments[0].timestamp is None
+    assert coalesced.segments[1].timestamp.hour == 15
+
+def test_document_coalescing_splits_on_dates_and_size():
+    lines = ["2025.03.01 첫 방문", "문 앞에서 기다림", "2025.03.02 재방문", "x" * 799, "끝"]
+
+    struct_input = build_structuring_input_from_document(lines, coalesce=DOCUMENT_COALESCE)
+
+    assert [segment.text for segment in struct_input.segments] == [
+        "2025.03.01 첫 방문\n문 앞에서 기다림",
+        "2025.03.02 재방문",
+        "x" * 799,
+        "끝",
+    ]
+    assert struct_input.segments[1].timestamp.day == 2
+    for segment in struct_input.segments:
+        assert segment.text in struct_input.full_text
+
+def test_stt_coalescing_respects_speakers_and_silence():
+    stt = STTResult(
+        full_text="지금 어디야 왜 안 받아 그만해 다시 걸게",
+        segments=[
+            STTSegment(start=0.0, end=1.0, text="지금 어디야", speaker="SPEAKER_01"),
+            STTSegment(start=1.2, end=2.0, text="왜 안 받아", speaker="SPEAKER_01"),
+            STTSegment(start=2.1, end=3.0, text="그만해", speaker="SPEAKER_00"),
+            STTSegment(start=9.0, end=10.0, text="다시 걸게", speaker="SPEAKER_00"),
+        ],
+        language="ko",
+        engine="whisper-base",
+    )
+
+    struct_input = build_structuring_input_from_stt(stt, coalesce=STT_COALESCE)
+
+    assert [(s.text, s.start, s.end, s.speaker) for s in struct_input.segments] == [
+        ("지금 어디야 왜 안 받아", 0.0, 2.0, "SPEAKER_01"),
+        ("그만해", 2.1, 3.0, "SPEAKER_00"),
+        ("다시 걸게", 9.0, 10.0, "SPEAKER_00"),
+    ]
+
+def test_segment_map_resolves_anchors_to_source_spans():
+    sources = [
+        SourceSegment(text="지금 어디야", start=0.0, end=1.0),
+        SourceSegment(text="왜 안 받아", start=1.2, end=2.0),
+        SourceSegment(text="찾아갈 거야", start=2.5, end=4.0),
+    ]
+    full_text = "지금 어디야 왜 안 받아 찾아갈 거야"
+    coalesced = coalesce_segments(sources, config=CoalesceConfig(separator=" "))
+
+    segment_map = coalesced.segment_map(full_text)
+    anchor_start = full_text.index("안 받아")
+    anchor_end = full_text.index("거야") + 2
+
+    assert len(coalesced.segments) == 1
+    assert [span.source_index for span in segment_map.sources_for_anchor(anchor_start, anchor_end)] == [1, 2]
+    assert segment_map.time_range_for_anchor(anchor_start, anchor_end) == (1.2, 4.0)
+    assert len(segment_map.sources_for_segment(0)) == 3
@@ -0,0 +1,45 @@
+import random
+
+from ansimon_ai.structuring.lexicon import TermLexicon
+from ansimon_ai.structuring.tag_patterns import TAG_LEXICON, TAG_PATTERNS
+from ansimon_ai.timeline.tag_terms import TAG_RULE_LEXICON, TAG_RULE_TERMS
+
+def _naive_groups(groups: dict, text: str) -> frozenset[str]:
+    return frozenset(
+        group for group, terms in groups.items() if any(term in text for term in terms)
+    )
+
+def test_term_lexicon_reports_overlapping_and_nested_terms():
+    lexicon = TermLexicon(
+        {
+            "long": ["야한 사진"],
+            "short": ["야한"],
+            "suffix": ["사진 보내"],
+            "unused": ["협박"],
+        }
+    )
+
+    assert lexicon.find("야한 사진 보내줘") == frozenset({"long", "short", "suffix"})
+    assert lexicon.find("야한 얘기") == frozenset({"short"})
+    assert lexicon.contains("사진 보내줘", "suffix")
+    assert lexicon.find("") == frozenset()
+
+def test_term_lexicon_handles_empty_groups_and_terms():
+    lexicon = TermLexicon({"empty": [], "blank": [""]})
+
+    assert lexicon.find("아무 내용") == frozenset()
+
+def test_term_lexicon_matches_naive_scan_for_repo_lexicons():
+    rng = random.Random(7)
+    for lexicon, groups in ((TAG_LEXICON, TAG_PATTERNS), (TAG_RULE_LEXICON, TAG_RULE_TERMS)):
+        vocabulary = [term for terms in groups.values() for term in terms] + [
+            "오늘",
+            "회사",
+            " ",
+            "그",
+            "만",
+            "해",
+        ]
+        for _ in range(200):
+            text = "".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 12)))
+            assert lexicon.find(text) == _naive_groups(groups, text)
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import threading
+
+from ansimon_ai.pdf.document_structuring import build_structuring_input_from_document
+from ansimon_ai.structuring.anchor.matcher import AnchorMatcher
+from ansimon_ai.structuring.run import arun_structuring_pipeline, run_structuring_pipeline
+from ansimon_ai.structuring.windowing import (
+    WindowingConfig,
+    merge_window_outputs,
+    should_window,
+    split_into_windows,
+)
+from tests.structuring._mocks import MemoryCache, MockValidator
+
+CONFIG = WindowingConfig(
+    threshold_chars=400,
+    max_window_chars=300,
+    min_window_chars=120,
+    overlap_chars=40,
+    max_concurrency=3,
+)
+
+def _lines(count: int = 60) -> list[str]:
+    return [f"{index}번째 기록: 상대방이 집 앞에서 기다렸다." for index in range(count)]
+
+class CountingLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, messages):
+        with self._lock:
+            self.calls += 1
+        text = messages[1]["content"]
+        first_line = text.split("### INPUT TEXT (anchor base)\n\n", 1)[1].split("\n", 1)[0]
+        return json.dumps(
+            {
+                "tags": {
+                    "value": [first_line.split("번째", 1)[0]],
+                    "confidence": "medium",
+                    "evidence_span": first_line,
+                    "evidence_anchor": None,
+                },
+            },
+            ensure_ascii=False,
+        )
+
+def test_split_into_windows_covers_segments_with_overlap_and_offsets():
+    struct_input = build_structuring_input_from_document(_lines())
+
+    windows = split_into_windows(struct_input, CONFIG)
+
+    assert should_window(struct_input, CONFIG)
+    assert len(windows) > 2
+    seen = []
+    for window in windows:
+        assert len(window.input.full_text) <= CONFIG.max_window_chars + CONFIG.overlap_chars
+        offset = window.char_offset
+        assert struct_input.full_text[offset:offset + len(window.input.full_text)] == window.input.full_text
+        seen.extend(segment.text for segment in window.input.segments)
+    assert set(seen) == {segment.text for segment in struct_input.segments}
+    assert len(seen) > len(struct_input.segments)
+
+def test_split_into_windows_keeps_untouched_windows_after_an_edit():
+    lines = _lines()
+    edited = list(lines)
+    edited[30] = "30번째 기록: 수정된 내용이 조금 더 길어졌다."
+
+    before = split_into_windows(build_structuring_input_from_document(lines), CONFIG)
+    after = split_into_windows(build_structuring_input_from_document(edited), CONFIG)
+
+    previous_texts = {window.input.full_text for window in before}
+    rerun = [window for window in after if window.input.full_text not in previous_texts]
+    assert 0 < len(rerun) <= 2
+
+def test_merge_window_outputs_unions_lists_and_prefers_confident_values():
+    anchor = {"modality": "text", "start_char": 2, "end_char": 5}
+    outputs = [
+        {
+            "tags": {"value": ["unknown"], "confidence": "low", "evidence_span": None, "evidence_anchor": None},
+            "period": {"value": "unknown", "confidence": "low", "evidence_span": None, "evidence_anchor": None},
+            "channel": {"value": ["kakao"], "confidence": "medium", "evidence_span": "a", "evidence_anchor": None},
+        },
+        {
+            "tags": {"value": ["repeat"], "confidence": "high", "evidence_span": "b", "evidence_anchor": anchor},
+            "period": {"value": "3월", "confidence": "medium", "evidence_span": "3월", "evidence_anchor": anchor},
+            "channel": {"value": ["sms", "kakao"], "confidence": "low", "evidence_span": "c", "evidence_anchor": None},
+        },
+    ]
+
+    merged = merge_window_outputs(outputs)
+
+    assert merged["tags"]["value"] == ["repeat"]
+    assert merged["tags"]["evidence_span"] == "b"
+    assert merged["period"]["value"] == "3월"
+    assert merged["channel"]["value"] == ["kakao", "sms"]
+    assert merged["channel"]["confidence"] == "medium"
+    assert outputs[0]["channel"]["value"] == ["kakao"]
+
+def test_windowed_pipeline_caches_per_window():
+    cache = MemoryCache()
+    lines = _lines()
+    llm = CountingLLM()
+
+    result = run_structuring_pipeline(
+        input=build_structuring_input_from_document(lines),
+        llm_client=llm,
+        anchor_matcher=AnchorMatcher(),
+        validator=MockValidator(),
+        cache=cache,
+        windowing=CONFIG,
+    )
+    first_calls = llm.calls
+
+    edited = list(lines)
+    edited[30] = "30번째 기록: 수정된 내용이 조금 더 길어졌다."
+    run_structuring_pipeline(
+        input=build_structuring_input_from_document(edited),
+        llm_client=llm,
+        anchor_matcher=AnchorMatcher(),
+        validator=MockValidator(),
+        cache=cache,
+        windowing=CONFIG,
+    )
+
+    assert first_calls == len(split_into_windows(build_structuring_input_from_document(lines), CONFIG))
+    assert 0 < llm.calls - first_calls <= 2
+    assert result.output_json["tags"]["value"][0] == "0"
+    assert [item.stage for item in result.stage_metrics].count("llm_window") == first_calls
+
+def test_windowed_pipeline_runs_async():
+    llm = CountingLLM()
+
+    result = asyncio.run(
+        arun_structuring_pipeline(
+            input=build_structuring_input_from_document(_lines()),
+            llm_client=llm,
+            anchor_matcher=AnchorMatcher(),
+            validator=MockValidator(),
+            windowing=CONFIG,
+        )
+    )
+
+    assert llm.calls > 2
+    assert len(result.output_json["tags"]["value"]) == llm.calls
+
+def test_windowed_pipeline_anchors_spans_in_the_full_input():
+    class LaterWindowsLLM(CountingLLM):
+        def generate(self, messages):
+            output = json.loads(super().generate(messages))
+            # Two-digit lines occur once in the input, so their spans anchor.
+            if len(output["tags"]["value"][0]) == 2:
+                output["tags"]["confidence"] = "high"
+                # A window-relative anchor, as the model sees only the window.
+                output["tags"]["evidence_anchor"] = {"modality": "text", "start_char": 0, "end_char": 5}
+            return json.dumps(output, ensure_ascii=False)
+
+    struct_input = build_structuring_input_from_document(_lines())
+    result = run_structuring_pipeline(
+        input=struct_input,
+        llm_client=LaterWindowsLLM(),
+        anchor_matcher=AnchorMatcher(),
+        validator=MockValidator(),
+        windowing=CONFIG,
+    )
+
+    tags = result.output_json["tags"]
+    anchor = tags["evidence_anchor"]
+    assert tags["confidence"] == "high"
+    assert anchor["start_char"] > 0
+    assert struct_input.full_text[anchor["start_char"]:anchor["end_char"]] == tags["evidence_span"]
+
+def test_structuring_pipeline_does_not_window_unless_configured():
+    llm = CountingLLM()
+    struct_input = build_structuring_input_from_document(_lines(1000))
+
+    run_structuring_pipeline(
+        input=struct_input,
+        llm_client=llm,
+        anchor_matcher=AnchorMatcher(),
+        validator=MockValidator(),
+    )
+
+    assert should_window(struct_input, WindowingConfig())
+    assert llm.calls == 1
@@ -0,0 +1,82 @@
+import threading
+from uuid import uuid4
+
+import pytest
+
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.timeline import (
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    build_timeline_prototype,
+    build_timelines_batch,
+)
+
+TIMING_FIELDS = {"stage_summary": True, "evidence_results": {"__all__": {"stage_metrics"}}}
+
+def _build_payload(texts: list[str]) -> TimelinePrototypeAiInput:
+    return TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="REPORT_RECORD",
+                file_format="TXT",
+                extracted_text=text,
+            )
+            for text in texts
+        ],
+    )
+
+class RecordingLLMClient:
+    def __init__(self) -> None:
+        self.contents: list[str] = []
+        self._lock = threading.Lock()
+        self._inner = MockLLMClient()
+
+    def generate(self, messages: list[dict]) -> str:
+        with self._lock:
+            self.contents.append(messages[1]["content"])
+        return self._inner.generate(messages)
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_build_timelines_batch_matches_per_complaint_builds(max_workers: int):
+    inputs = [
+        _build_payload(["2026-03-19 first a", "2026-03-20 first b", "2026-03-21 first c"]),
+        _build_payload(["2026-04-01 second a"]),
+        _build_payload([]),
+    ]
+
+    outputs = build_timelines_batch(inputs, llm_client=MockLLMClient(), max_workers=max_workers)
+
+    assert len(outputs) == len(inputs)
+    for ai_input, output in zip(inputs, outputs):
+        expected = build_timeline_prototype(ai_input, llm_client=MockLLMClient())
+        assert output.model_dump(exclude=TIMING_FIELDS) == expected.model_dump(exclude=TIMING_FIELDS)
+
+def test_build_timelines_batch_interleaves_complaints_fairly():
+    inputs = [
+        _build_payload([f"2026-03-1{day} alpha {day}" for day in range(3)]),
+        _build_payload([f"2026-03-2{day} beta {day}" for day in range(2)]),
+    ]
+    llm_client = RecordingLLMClient()
+    progress: list[tuple[int, int]] = []
+
+    build_timelines_batch(
+        inputs,
+        llm_client=llm_client,
+        max_workers=1,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    owners = ["alpha" if "alpha" in content else "beta" for content in llm_client.contents]
+    assert owners == ["alpha", "beta", "alpha", "beta", "alpha"]
+    assert len(progress) == 5
+    assert progress[-1][0] == progress[-1][1]
+
+def test_build_timelines_batch_keeps_dedup_per_complaint():
+    llm_client = RecordingLLMClient()
+    inputs = [_build_payload(["2026-03-19 same text"]), _build_payload(["2026-03-19 same text"])]
+
+    build_timelines_batch(inputs, llm_client=llm_client, max_workers=2)
+
+    assert len(llm_client.contents) == 2
@@ -0,0 +1,161 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.ocr.types import OCRResult, OCRSegment
+from ansimon_ai.timeline import (
+    ResourceGovernor,
+    EvidenceDeadlines,
+    EvidenceTimeoutError,
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    abuild_timeline_prototype,
+    build_timeline_prototype,
+)
+from ansimon_ai.timeline.deadlines import EvidenceDeadline, run_with_deadline
+
+class SlowLLMClient(MockLLMClient):
+    def __init__(self, slow_marker: str, delay: float) -> None:
+        self.slow_marker = slow_marker
+        self.delay = delay
+
+    def generate(self, messages: list[dict]) -> str:
+        if any(self.slow_marker in str(message.get("content")) for message in messages):
+            time.sleep(self.delay)
+        return super().generate(messages)
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        if any(self.slow_marker in str(message.get("content")) for message in messages):
+            await asyncio.sleep(self.delay)
+        return super().generate(messages)
+
+def _text_evidence(text: str) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="REPORT_RECORD",
+        file_format="TXT",
+        extracted_text=text,
+    )
+
+def test_run_with_deadline_raises_timeout_but_keeps_own_errors():
+    with pytest.raises(EvidenceTimeoutError) as exc_info:
+        run_with_deadline(lambda: time.sleep(0.5), 0.05, stage="llm")
+    assert exc_info.value.stage == "llm"
+
+    def fail():
+        raise TimeoutError("socket timeout")
+
+    with pytest.raises(TimeoutError, match="socket timeout"):
+        run_with_deadline(fail, 1.0, stage="llm")
+    assert run_with_deadline(lambda: 3, 1.0, stage="llm") == 3
+
+def test_evidence_deadline_budget_is_the_tighter_limit():
+    assert EvidenceDeadline().budget("llm") is None
+
+    deadline = EvidenceDeadline(EvidenceDeadlines(evidence_seconds=10.0, stage_seconds={"llm": 2.0}))
+    assert deadline.budget("llm") == 2.0
+    assert 9.0 < deadline.budget("extract") <= 10.0
+
+def test_build_timeline_prototype_reports_slow_llm_evidence_as_timed_out():
+    evidences = [
+        _text_evidence("2026-03-19 반복 연락 지연응답"),
+        _text_evidence("2026-03-20 반복 연락"),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    started_at = time.perf_counter()
+    result = build_timeline_prototype(
+        payload,
+        llm_client=SlowLLMClient("지연응답", delay=1.0),
+        deadlines=EvidenceDeadlines(stage_seconds={"llm": 0.1}),
+    )
+
+    assert time.perf_counter() - started_at < 0.9
+    slow, fast = result.evidence_results
+    assert slow.status == "failed"
+    assert slow.error_code == "EVIDENCE_TIMEOUT"
+    assert slow.normalized_text is not None
+    assert [metrics.stage for metrics in slow.stage_metrics][-1] == "llm"
+    assert fast.status == "completed"
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_timed_out_evidence_keeps_its_governor_slot_until_the_work_returns(max_workers: int):
+    governor = ResourceGovernor()
+    payload = TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[_text_evidence("2026-03-19 반복 연락 지연응답")],
+    )
+
+    result = build_timeline_prototype(
+        payload,
+        llm_client=SlowLLMClient("지연응답", delay=0.4),
+        deadlines=EvidenceDeadlines(stage_seconds={"llm": 0.05}),
+        max_workers=max_workers,
+        resource_governor=governor,
+    )
+
+    assert result.evidence_results[0].error_code == "EVIDENCE_TIMEOUT"
+    assert governor.bytes_in_flight > 0
+    deadline = time.monotonic() + 2.0
+    while governor.bytes_in_flight and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert governor.bytes_in_flight == 0
+
+def test_async_timed_out_extraction_keeps_its_governor_slot_until_the_thread_returns():
+    governor = ResourceGovernor()
+    text = "2026-03-19 반복 연락"
+
+    def slow_ocr_runner(_image_path: str) -> OCRResult:
+        time.sleep(0.4)
+        return OCRResult(full_text=text, segments=[OCRSegment(text=text)], language="ko", engine="fake-ocr")
+
+    payload = TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="MESSAGE",
+                file_format="IMAGE",
+                file_name="message.png",
+                file_bytes=b"fake-image",
+            ),
+        ],
+    )
+
+    async def build_and_check_governor():
+        result = await abuild_timeline_prototype(
+            payload,
+            llm_client=MockLLMClient(),
+            ocr_runner=slow_ocr_runner,
+            deadlines=EvidenceDeadlines(stage_seconds={"extract": 0.05}),
+            resource_governor=governor,
+        )
+        # Checked before asyncio.run joins the default executor's threads.
+        assert result.evidence_results[0].error_code == "EVIDENCE_TIMEOUT"
+        assert governor.bytes_in_flight > 0
+        deadline = time.monotonic() + 2.0
+        while governor.bytes_in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.02)
+        assert governor.bytes_in_flight == 0
+
+    asyncio.run(build_and_check_governor())
+
+def test_abuild_timeline_prototype_applies_evidence_deadline():
+    evidences = [
+        _text_evidence("2026-03-19 반복 연락 지연응답"),
+        _text_evidence("2026-03-20 반복 연락"),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    result = asyncio.run(
+        abuild_timeline_prototype(
+            payload,
+            llm_client=SlowLLMClient("지연응답", delay=5.0),
+            deadlines=EvidenceDeadlines(evidence_seconds=0.2),
+        )
+    )
+
+    assert [item.error_code for item in result.evidence_results] == ["EVIDENCE_TIMEOUT", None]
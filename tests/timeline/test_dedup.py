@@ -0,0 +1,224 @@
+import asyncio
+import json
+import threading
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.ocr.types import OCRResult, OCRSegment
+from ansimon_ai.timeline import (
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    abuild_timeline_prototype,
+    build_timeline_prototype,
+    build_timeline_prototype_staged,
+)
+from ansimon_ai.timeline.dedup import ContentDeduplicator, extraction_dedup_key
+
+class CountingLLMClient:
+    def __init__(self) -> None:
+        self.call_count = 0
+        self._lock = threading.Lock()
+        self._inner = MockLLMClient()
+
+    def generate(self, messages: list[dict]) -> str:
+        with self._lock:
+            self.call_count += 1
+        return self._inner.generate(messages)
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        return self.generate(messages)
+
+class CountingOCRRunner:
+    def __init__(self, full_text: str = "2026-03-17 18:30 repeated threatening message") -> None:
+        self.call_count = 0
+        self.full_text = full_text
+        self._lock = threading.Lock()
+
+    def __call__(self, image_path: str) -> OCRResult:
+        with self._lock:
+            self.call_count += 1
+        full_text = self.full_text
+        return OCRResult(
+            full_text=full_text,
+            segments=[OCRSegment(text=full_text)],
+            language="ko",
+            engine="fake-ocr",
+        )
+
+def _build_screenshot(
+    evidence_type: str,
+    *,
+    file_name: str,
+    file_created_at: datetime | None = None,
+) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type=evidence_type,
+        file_format="IMAGE",
+        file_name=file_name,
+        file_created_at=file_created_at,
+        file_bytes=b"same-screenshot",
+    )
+
+def test_build_timeline_prototype_processes_duplicate_content_once():
+    llm_client = CountingLLMClient()
+    ocr_runner = CountingOCRRunner()
+    evidences = [
+        _build_screenshot("MESSAGE", file_name="first.png"),
+        _build_screenshot("MESSAGE", file_name="second.png"),
+        _build_screenshot("VOICE", file_name="third.png"),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    result = build_timeline_prototype(payload, llm_client=llm_client, ocr_runner=ocr_runner)
+
+    assert ocr_runner.call_count == 1
+    assert llm_client.call_count == 1
+    assert [item.evidence_id for item in result.evidence_results] == [
+        evidence.evidence_id for evidence in evidences
+    ]
+    assert [item.status for item in result.evidence_results] == ["completed"] * 3
+    assert [item.type for item in result.evidence_results] == ["MESSAGE", "MESSAGE", "VOICE"]
+
+def test_build_timeline_prototype_marks_shared_stages_as_cache_hits():
+    evidences = [
+        _build_screenshot("MESSAGE", file_name="first.png"),
+        _build_screenshot("MESSAGE", file_name="second.png"),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    result = build_timeline_prototype(
+        payload,
+        llm_client=CountingLLMClient(),
+        ocr_runner=CountingOCRRunner(),
+    )
+
+    first, second = result.evidence_results
+    assert [item.stage for item in first.stage_metrics] == [
+        "extract",
+        "llm",
+        "anchor",
+        "validation",
+        "tags",
+    ]
+    assert [(item.stage, item.cache_hit) for item in second.stage_metrics] == [
+        ("extract", True),
+        ("llm", True),
+        ("tags", None),
+    ]
+
+def test_build_timeline_prototype_rederives_per_evidence_timestamp():
+    evidences = [
+        _build_screenshot(
+            "MESSAGE",
+            file_name="first.png",
+            file_created_at=datetime(2026, 3, 17, 18, 30),
+        ),
+        _build_screenshot(
+            "MESSAGE",
+            file_name="second.png",
+            file_created_at=datetime(2026, 3, 18, 9, 0),
+        ),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    result = build_timeline_prototype(
+        payload,
+        llm_client=CountingLLMClient(),
+        ocr_runner=CountingOCRRunner("repeated threatening message"),
+    )
+
+    first, second = result.evidence_results
+    assert first.structured_data == second.structured_data
+    assert first.timestamp != second.timestamp
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_build_timeline_prototype_dedups_concurrent_duplicates(max_workers: int):
+    llm_client = CountingLLMClient()
+    evidences = [
+        TimelinePrototypeEvidenceInput(
+            evidence_id=uuid4(),
+            type="REPORT_RECORD",
+            file_format="TXT",
+            extracted_text="2026-03-19 repeated contact was documented",
+        )
+        for _ in range(6)
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    result = build_timeline_prototype(payload, llm_client=llm_client, max_workers=max_workers)
+
+    assert llm_client.call_count == 1
+    assert len({json.dumps(item.structured_data, sort_keys=True) for item in result.evidence_results}) == 1
+
+def test_abuild_and_staged_timeline_prototype_dedup_duplicates():
+    evidences = [
+        _build_screenshot("MESSAGE", file_name="first.png"),
+        _build_screenshot("MESSAGE", file_name="second.png"),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    async_client = CountingLLMClient()
+    asyncio.run(
+        abuild_timeline_prototype(payload, llm_client=async_client, ocr_runner=CountingOCRRunner())
+    )
+    staged_client = CountingLLMClient()
+    build_timeline_prototype_staged(
+        payload,
+        llm_client=staged_client,
+        ocr_runner=CountingOCRRunner(),
+    )
+
+    assert async_client.call_count == 1
+    assert staged_client.call_count == 1
+
+def test_build_timeline_prototype_dedups_duplicate_victim_media():
+    evidences = [
+        TimelinePrototypeEvidenceInput(
+            evidence_id=uuid4(),
+            type="VICTIM",
+            file_format="IMAGE",
+            file_name=f"victim-{index}.jpg",
+            file_bytes=b"same-victim-image",
+        )
+        for index in range(2)
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    class VictimLLMClient(CountingLLMClient):
+        def generate(self, messages: list[dict]) -> str:
+            super().generate(messages)
+            return json.dumps({"title": {"value": "장면"}, "summary": {"value": "요약"}})
+
+    llm_client = VictimLLMClient()
+    result = build_timeline_prototype(payload, llm_client=llm_client)
+
+    assert llm_client.call_count == 1
+    assert [item.status for item in result.evidence_results] == ["completed", "completed"]
+
+def test_content_deduplicator_reruns_work_when_owner_fails():
+    deduplicator = ContentDeduplicator()
+    calls = []
+
+    def failing():
+        calls.append("fail")
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        deduplicator.run("key", failing)
+
+    value, shared = deduplicator.run("key", lambda: calls.append("ok") or "value")
+
+    assert (value, shared) == ("value", False)
+    assert calls == ["fail", "ok"]
+
+def test_extraction_dedup_key_groups_message_and_voice_images():
+    message = _build_screenshot("MESSAGE", file_name="a.png")
+    voice = _build_screenshot("VOICE", file_name="b.png")
+    victim = _build_screenshot("VICTIM", file_name="c.png")
+
+    assert extraction_dedup_key(message) == extraction_dedup_key(voice)
+    assert extraction_dedup_key(message) != extraction_dedup_key(victim)
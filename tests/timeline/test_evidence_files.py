@@ -0,0 +1,46 @@
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from ansimon_ai.timeline import TimelinePrototypeEvidenceInput
+from ansimon_ai.timeline.evidence_files import EvidenceFiles
+
+TEST_TMP_DIR = Path("data/_timeline_test_tmp")
+
+def _build_evidence(**kwargs) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="VOICE",
+        file_format="AUDIO",
+        **kwargs,
+    )
+
+def test_evidence_files_serves_bytes_without_touching_disk():
+    evidence = _build_evidence(file_name="voice.m4a", file_bytes=b"audio-bytes")
+    base_dir = TEST_TMP_DIR / f"{uuid4()}-files"
+
+    with EvidenceFiles(evidence, base_dir=base_dir) as files:
+        assert files.data == b"audio-bytes"
+        assert files.stream().read() == b"audio-bytes"
+        device_path = files.device_path()
+        assert Path(device_path).read_bytes() == b"audio-bytes"
+
+    assert not (base_dir / str(evidence.evidence_id)).exists()
+
+def test_evidence_files_materializes_named_file_on_demand():
+    evidence = _build_evidence(file_name="nested/voice.m4a", file_bytes=b"audio-bytes")
+    base_dir = TEST_TMP_DIR / f"{uuid4()}-files"
+
+    with EvidenceFiles(evidence, base_dir=base_dir) as files:
+        path = files.path()
+        assert path == files.path()
+        assert Path(path).name == "voice.m4a"
+        assert Path(path).read_bytes() == b"audio-bytes"
+
+    assert not Path(path).exists()
+
+def test_evidence_files_requires_file_bytes():
+    with EvidenceFiles(_build_evidence()) as files:
+        with pytest.raises(ValueError):
+            files.data
@@ -0,0 +1,228 @@
+from uuid import uuid4
+
+import pytest
+
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.timeline import (
+    EvidenceDeadlines,
+    EvidenceResultStore,
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    TimelineIndex,
+    TimelinePrototypeOutput,
+    build_timeline_prototype,
+    compute_evidence_content_hash,
+    update_timeline,
+)
+
+class CountingMockLLMClient(MockLLMClient):
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    def generate(self, messages: list[dict]) -> str:
+        self.call_count += 1
+        return super().generate(messages)
+
+def _report_record(text: str, evidence_id=None) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=evidence_id or uuid4(),
+        type="REPORT_RECORD",
+        file_format="TXT",
+        extracted_text=text,
+    )
+
+def test_update_timeline_processes_only_added_evidence():
+    complaint_id = uuid4()
+    first = _report_record("2026-03-19 repeated threatening messages")
+    second = _report_record("2026-03-18 consultation record")
+    previous = build_timeline_prototype(
+        TimelinePrototypeAiInput(complaint_id=complaint_id, evidences=[first, second]),
+        llm_client=MockLLMClient(),
+    )
+    added = _report_record("2026-03-20 actor appeared near workplace")
+    llm_client = CountingMockLLMClient()
+
+    updated = update_timeline(
+        previous,
+        [added],
+        complaint_id=complaint_id,
+        llm_client=llm_client,
+    )
+
+    assert llm_client.call_count == 1
+    assert [item.evidence_id for item in updated.evidence_results] == [
+        first.evidence_id,
+        second.evidence_id,
+        added.evidence_id,
+    ]
+    assert [item.date for item in updated.items] == ["2026-03-18", "2026-03-19", "2026-03-20"]
+    assert updated.model_version == previous.model_version
+
+def test_update_timeline_replaces_changed_and_drops_removed_evidence():
+    complaint_id = uuid4()
+    kept = _report_record("2026-03-19 repeated threatening messages")
+    edited = _report_record("2026-03-18 consultation record")
+    removed = _report_record("2026-03-17 old record")
+    previous = build_timeline_prototype(
+        TimelinePrototypeAiInput(complaint_id=complaint_id, evidences=[kept, edited, removed]),
+        llm_client=MockLLMClient(),
+    )
+
+    updated = update_timeline(
+        previous,
+        [_report_record("2026-03-21 corrected record", evidence_id=edited.evidence_id)],
+        [removed.evidence_id],
+        complaint_id=complaint_id,
+        llm_client=MockLLMClient(),
+    )
+
+    assert [item.evidence_id for item in updated.evidence_results] == [
+        kept.evidence_id,
+        edited.evidence_id,
+    ]
+    assert [item.date for item in updated.items] == ["2026-03-19", "2026-03-21"]
+
+def test_update_timeline_reuses_stored_results_for_unchanged_content(tmp_path):
+    complaint_id = uuid4()
+    store = EvidenceResultStore(base_dir=tmp_path)
+    evidences = [
+        _report_record("2026-03-19 repeated threatening messages"),
+        _report_record("2026-03-20 actor appeared near workplace"),
+    ]
+    empty = TimelinePrototypeOutput(items=[], model_version="prototype-v1")
+    llm_client = CountingMockLLMClient()
+
+    first = update_timeline(
+        empty,
+        evidences,
+        complaint_id=complaint_id,
+        llm_client=llm_client,
+        store=store,
+    )
+    second = update_timeline(
+        empty,
+        [evidences[0], _report_record("2026-03-22 new text", evidence_id=evidences[1].evidence_id)],
+        complaint_id=complaint_id,
+        llm_client=llm_client,
+        store=EvidenceResultStore(base_dir=tmp_path),
+    )
+
+    assert llm_client.call_count == 3
+    assert (tmp_path / f"{complaint_id}.json").exists()
+    reused = second.evidence_results[0]
+    assert reused.model_dump(exclude={"stage_metrics"}) == first.evidence_results[0].model_dump(
+        exclude={"stage_metrics"}
+    )
+    assert reused.stage_metrics
+    assert all(metrics.cache_hit and metrics.wall_ms == 0.0 for metrics in reused.stage_metrics)
+    llm_summary = next(summary for summary in second.stage_summary if summary.stage == "llm")
+    assert llm_summary.count == 2
+    assert llm_summary.cache_hits == 1
+    assert [item.date for item in second.items] == ["2026-03-19", "2026-03-22"]
+
+def test_update_timeline_does_not_store_failed_results(tmp_path):
+    class FailingLLMClient:
+        def generate(self, messages: list[dict]) -> str:
+            raise RuntimeError("llm unavailable")
+
+    complaint_id = uuid4()
+    store = EvidenceResultStore(base_dir=tmp_path)
+    evidence = _report_record("2026-03-19 repeated threatening messages")
+    empty = TimelinePrototypeOutput(items=[], model_version="prototype-v1")
+
+    failed = update_timeline(
+        empty,
+        [evidence],
+        complaint_id=complaint_id,
+        llm_client=FailingLLMClient(),
+        store=store,
+    )
+
+    assert failed.evidence_results[0].status == "failed"
+    assert store.load(complaint_id) == {}
+
+def test_update_timeline_forwards_cancel_and_deadlines():
+    complaint_id = uuid4()
+    empty = TimelinePrototypeOutput(items=[], model_version="prototype-v1")
+    evidence = _report_record("2026-03-19 repeated threatening messages")
+    llm_client = CountingMockLLMClient()
+
+    cancelled = update_timeline(
+        empty,
+        [evidence],
+        complaint_id=complaint_id,
+        llm_client=llm_client,
+        cancel_callback=lambda: True,
+    )
+    timed_out = update_timeline(
+        empty,
+        [evidence],
+        complaint_id=complaint_id,
+        llm_client=llm_client,
+        deadlines=EvidenceDeadlines(evidence_seconds=0.0),
+    )
+
+    assert cancelled.evidence_results == []
+    assert llm_client.call_count == 0
+    assert timed_out.evidence_results[0].error_code == "EVIDENCE_TIMEOUT"
+
+def test_evidence_result_store_keeps_previous_file_when_a_save_fails(tmp_path, monkeypatch):
+    complaint_id = uuid4()
+    store = EvidenceResultStore(base_dir=tmp_path)
+    evidence = _report_record("2026-03-19 repeated threatening messages")
+    empty = TimelinePrototypeOutput(items=[], model_version="prototype-v1")
+    update_timeline(empty, [evidence], complaint_id=complaint_id, llm_client=MockLLMClient(), store=store)
+    saved = store.load(complaint_id)
+
+    def crash(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("ansimon_ai.timeline.incremental.os.replace", crash)
+    with pytest.raises(OSError):
+        store.save(complaint_id, {})
+
+    assert store.load(complaint_id) == saved
+    assert len(saved) == 1
+
+def test_compute_evidence_content_hash_tracks_content_not_identity():
+    evidence = _report_record("2026-03-19 repeated threatening messages")
+    same_content = _report_record("2026-03-19 repeated threatening messages")
+    edited = _report_record("2026-03-19 repeated threatening messages!", evidence_id=evidence.evidence_id)
+
+    assert compute_evidence_content_hash(evidence) == compute_evidence_content_hash(same_content)
+    assert compute_evidence_content_hash(evidence) != compute_evidence_content_hash(edited)
+    assert compute_evidence_content_hash(evidence) != compute_evidence_content_hash(
+        evidence,
+        victim_video_frame_interval_seconds=5,
+    )
+
+def test_update_timeline_updates_a_live_index_in_place():
+    complaint_id = uuid4()
+    kept = _report_record("2026-03-19 repeated threatening messages")
+    removed = _report_record("2026-03-18 consultation record")
+    previous = build_timeline_prototype(
+        TimelinePrototypeAiInput(complaint_id=complaint_id, evidences=[kept, removed]),
+        llm_client=MockLLMClient(),
+    )
+    index = TimelineIndex.from_results(previous.evidence_results)
+    added = _report_record("2026-03-20 actor appeared near workplace")
+
+    updated = update_timeline(
+        previous,
+        [added],
+        [removed.evidence_id],
+        complaint_id=complaint_id,
+        llm_client=MockLLMClient(),
+        index=index,
+    )
+    rebuilt = update_timeline(
+        previous,
+        [added.model_copy()],
+        [removed.evidence_id],
+        complaint_id=complaint_id,
+        llm_client=MockLLMClient(),
+    )
+
+    assert [item.date for item in updated.items] == ["2026-03-19", "2026-03-20"]
+    assert updated.items == rebuilt.items
+    assert len(index) == 2
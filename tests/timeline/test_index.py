@@ -0,0 +1,76 @@
+import random
+from datetime import datetime
+from uuid import uuid4
+
+from ansimon_ai.timeline import (
+    EvidenceProcessingResult,
+    TimelineDateItem,
+    TimelineEvent,
+    TimelineEvidenceItem,
+    TimelineIndex,
+    bucket_evidences_by_date_time,
+    build_timeline_event_evidences,
+)
+from ansimon_ai.timeline.assembly import _date_sort_key, _to_flat_evidence
+
+def _result(day: int, hour: int, *, title: str, tags: list[str] | None = None, evidence_type="REPORT_RECORD"):
+    return EvidenceProcessingResult(
+        evidence_id=uuid4(),
+        type=evidence_type,
+        status="completed",
+        timestamp=datetime(2026, 3, day, hour, 0) if day else None,
+        title=title,
+        description=f"{title} description",
+        tags=tags or [],
+    )
+
+def _bucket_and_sort(results: list[EvidenceProcessingResult]) -> list[TimelineDateItem]:
+    # Reference implementation: bucket everything, sort the keys, regroup.
+    flat = [_to_flat_evidence(result) for result in results if result.status == "completed"]
+    buckets = bucket_evidences_by_date_time(flat)
+    by_date: dict[str, list[TimelineEvent]] = {}
+    for key in sorted(buckets, key=lambda item: (_date_sort_key(item[0]), item[1])):
+        grouped = build_timeline_event_evidences(buckets[key])
+        by_date.setdefault(key[0], []).append(
+            TimelineEvent(time=key[1], evidences=[TimelineEvidenceItem(**item) for item in grouped])
+        )
+    return [TimelineDateItem(date=date, events=events) for date, events in by_date.items()]
+
+def test_timeline_index_matches_bucket_and_sort_assembly_under_random_edits():
+    rng = random.Random(13)
+    live: list[EvidenceProcessingResult] = []
+    index = TimelineIndex()
+
+    for step in range(300):
+        if live and rng.random() < 0.3:
+            removed = live.pop(rng.randrange(len(live)))
+            assert index.remove(removed.evidence_id)
+        else:
+            result = _result(
+                rng.choice([0, 1, 2, 3]),
+                rng.choice([9, 10]),
+                title=rng.choice(["alpha", "beta", "gamma"]),
+                tags=rng.sample(["threat", "repeat", "refusal"], rng.randint(0, 2)),
+                evidence_type=rng.choice(["REPORT_RECORD", "MESSAGE"]),
+            )
+            live.append(result)
+            index.add(result)
+        if step % 25 == 0:
+            assert index.snapshot() == _bucket_and_sort(live)
+
+    assert len(index) == len(live)
+    assert index.snapshot() == _bucket_and_sort(live)
+
+def test_timeline_index_replaces_evidence_in_place_and_drops_failures():
+    first = _result(1, 9, title="first")
+    second = _result(2, 9, title="second")
+    index = TimelineIndex.from_results([first, second])
+
+    moved = first.model_copy(update={"timestamp": datetime(2026, 3, 3, 9, 0), "title": "moved"})
+    index.add(moved)
+    assert [item.date for item in index.snapshot()] == ["2026-03-02", "2026-03-03"]
+
+    index.add(second.model_copy(update={"status": "failed"}))
+    assert second.evidence_id not in index
+    assert [item.date for item in index.snapshot()] == ["2026-03-03"]
+    assert not index.remove(uuid4())
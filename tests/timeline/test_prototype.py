@@ -1,5 +1,8 @@
 from pathlib import Path
+import asyncio
 import json
+import threading
+import time
 from datetime import datetime
 from uuid import uuid4
 
@@ -9,11 +12,14 @@ from ansimon_ai.llm.mock import MockLLMClient
 from ansimon_ai.ocr.types import OCRResult, OCRSegment
 from ansimon_ai.stt.mock import MockSTT
 from ansimon_ai.timeline import (
+    EvidenceCostModel,
     IncidentLogFormInput,
     TimelinePrototypeAiInput,
     TimelinePrototypeEvidenceInput,
+    abuild_timeline_prototype,
     build_timeline_event_evidences,
     build_timeline_prototype,
+    build_timeline_prototype_staged,
 )
 from ansimon_ai.timeline.prototype import _build_tags, _clean_victim_description
 
@@ -356,6 +362,35 @@ def test_build_timeline_prototype_processes_message_image_with_injected_ocr():
     assert evidence_result.normalized_text is not None
     assert result.items[0].date == "2026-03-17"
 
+def test_build_timeline_prototype_passes_image_bytes_to_default_ocr(monkeypatch):
+    captured: dict[str, object] = {}
+
+    def fake_ocr_image_to_result(image_input) -> OCRResult:
+        captured["image_input"] = image_input
+        return OCRResult(
+            full_text="2026-03-17 18:30 repeated threatening message",
+            segments=[OCRSegment(text="2026-03-17 18:30 repeated threatening message")],
+            language="ko",
+            engine="fake-ocr",
+        )
+
+    monkeypatch.setattr("ansimon_ai.ocr.from_ocr.ocr_image_to_result", fake_ocr_image_to_result)
+
+    evidence = TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="MESSAGE",
+        file_format="IMAGE",
+        file_name="message.png",
+        file_bytes=b"fake-image",
+    )
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=[evidence])
+
+    result = build_timeline_prototype(payload, llm_client=MockLLMClient())
+
+    assert result.evidence_results[0].status == "completed"
+    assert captured["image_input"] == b"fake-image"
+    assert not (Path("data/_timeline_runtime_tmp") / str(evidence.evidence_id)).exists()
+
 def test_build_timeline_prototype_combines_date_and_time_from_message_full_text():
     image_path = _write_test_file(f"{uuid4()}-message-multi-line.png", b"fake-image")
 
@@ -1414,14 +1449,14 @@ def test_build_timeline_prototype_reuses_cached_results_by_type(
             type="MESSAGE",
             file_format="IMAGE",
             file_name="message.png",
-            file_bytes=b"fake-image",
+            file_bytes=f"fake-image {text}".encode("utf-8"),
         ),
         "voice_audio": lambda text: TimelinePrototypeEvidenceInput(
             evidence_id=uuid4(),
             type="VOICE",
             file_format="AUDIO",
             file_name="voice.m4a",
-            file_bytes=b"fake-audio",
+            file_bytes=f"fake-audio {text}".encode("utf-8"),
         ),
     }
 
@@ -1606,4 +1641,348 @@ def test_build_timeline_prototype_reuses_cached_results_for_victim_video(monkeyp
     added_requests_on_second_run = llm_client.call_count - first_request_count
 
     assert first_request_count == 1
-    assert added_requests_on_second_run == 1
\ No newline at end of file
+    assert added_requests_on_second_run == 1
+class SlowFirstLLMClient:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def generate(self, messages: list[dict]) -> str:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if "first slow evidence" in messages[1]["content"]:
+                time.sleep(0.05)
+            return CountingLLMClient().generate(messages)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+def _build_report_record_payload(texts: list[str]) -> TimelinePrototypeAiInput:
+    return TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="REPORT_RECORD",
+                file_format="TXT",
+                extracted_text=text,
+            )
+            for text in texts
+        ],
+    )
+
+def test_build_timeline_prototype_concurrent_mode_keeps_input_order():
+    payload = _build_report_record_payload(
+        [
+            "2026-03-19 first slow evidence",
+            "2026-03-20 second evidence",
+            "2026-03-21 third evidence",
+        ]
+    )
+    llm_client = SlowFirstLLMClient()
+    progress: list[tuple[int, int]] = []
+
+    result = build_timeline_prototype(
+        payload,
+        llm_client=llm_client,
+        max_workers=3,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert [item.evidence_id for item in result.evidence_results] == [
+        evidence.evidence_id for evidence in payload.evidences
+    ]
+    assert all(item.status == "completed" for item in result.evidence_results)
+    assert [item.date for item in result.items] == ["2026-03-19", "2026-03-20", "2026-03-21"]
+    assert llm_client.max_in_flight > 1
+    weight = round(EvidenceCostModel().estimate(payload.evidences[0]))
+    assert progress == [(weight, 3 * weight), (2 * weight, 3 * weight), (3 * weight, 3 * weight)]
+
+def test_build_timeline_prototype_concurrent_mode_drains_in_flight_work_on_cancel():
+    payload = _build_report_record_payload(
+        [f"2026-03-{day:02d} evidence {day}" for day in range(1, 7)]
+    )
+    progress: list[int] = []
+
+    result = build_timeline_prototype(
+        payload,
+        llm_client=MockLLMClient(),
+        max_workers=2,
+        progress_callback=lambda done, total: progress.append(done),
+        cancel_callback=lambda: len(progress) >= 2,
+    )
+
+    assert 2 <= len(result.evidence_results) < len(payload.evidences)
+    assert [item.evidence_id for item in result.evidence_results] == [
+        evidence.evidence_id for evidence in payload.evidences[: len(result.evidence_results)]
+    ]
+    assert all(item.status == "completed" for item in result.evidence_results)
+
+def test_build_timeline_prototype_concurrent_mode_isolates_failed_evidence():
+    class FailingLLMClient:
+        def generate(self, messages: list[dict]) -> str:
+            if "broken evidence" in messages[1]["content"]:
+                raise RuntimeError("llm unavailable")
+            return CountingLLMClient().generate(messages)
+
+    payload = _build_report_record_payload(
+        ["2026-03-19 broken evidence", "2026-03-20 healthy evidence"]
+    )
+
+    result = build_timeline_prototype(payload, llm_client=FailingLLMClient(), max_workers=2)
+
+    failed, completed = result.evidence_results
+    assert failed.status == "failed"
+    assert failed.error_code == "STRUCTURING_ERROR"
+    assert completed.status == "completed"
+    assert len(result.items) == 1
+
+def test_build_timeline_prototype_rejects_non_positive_max_workers():
+    payload = _build_report_record_payload(["2026-03-19 evidence"])
+
+    with pytest.raises(ValueError):
+        build_timeline_prototype(payload, llm_client=MockLLMClient(), max_workers=0)
+
+class AsyncBarrierLLMClient:
+    def __init__(self, expected_calls: int) -> None:
+        self.expected_calls = expected_calls
+        self.started = 0
+        self._all_started: asyncio.Event | None = None
+
+    async def agenerate(self, messages: list[dict]) -> str:
+        if self._all_started is None:
+            self._all_started = asyncio.Event()
+        self.started += 1
+        if self.started == self.expected_calls:
+            self._all_started.set()
+        await asyncio.wait_for(self._all_started.wait(), timeout=1)
+        return CountingLLMClient().generate(messages)
+
+def test_abuild_timeline_prototype_overlaps_llm_calls_and_keeps_order():
+    payload = _build_report_record_payload(
+        ["2026-03-19 first evidence", "2026-03-20 second evidence", "2026-03-21 third evidence"]
+    )
+    llm_client = AsyncBarrierLLMClient(expected_calls=3)
+    progress: list[tuple[int, int]] = []
+
+    result = asyncio.run(
+        abuild_timeline_prototype(
+            payload,
+            llm_client=llm_client,
+            max_concurrency=3,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+    )
+
+    assert [item.evidence_id for item in result.evidence_results] == [
+        evidence.evidence_id for evidence in payload.evidences
+    ]
+    assert all(item.status == "completed" for item in result.evidence_results)
+    assert [item.date for item in result.items] == ["2026-03-19", "2026-03-20", "2026-03-21"]
+    assert progress[-1][0] == progress[-1][1]
+    assert len(progress) == 3
+
+def test_abuild_timeline_prototype_offloads_extraction_to_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    ocr_threads: list[str] = []
+
+    def fake_ocr_runner(_image_path: str) -> OCRResult:
+        ocr_threads.append(threading.current_thread().name)
+        return OCRResult(
+            full_text="2026-03-17 18:30 repeated threatening message",
+            segments=[OCRSegment(text="2026-03-17 18:30 repeated threatening message")],
+            language="ko",
+            engine="fake-ocr",
+        )
+
+    payload = TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="MESSAGE",
+                file_format="IMAGE",
+                file_name="message.png",
+                file_bytes=b"fake-image",
+            ),
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="REPORT_RECORD",
+                file_format="HWP",
+                file_name="sample.hwp",
+                file_bytes=b"fake-hwp",
+            ),
+        ],
+    )
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="extract") as executor:
+        result = asyncio.run(
+            abuild_timeline_prototype(
+                payload,
+                llm_client=MockLLMClient(),
+                ocr_runner=fake_ocr_runner,
+                executor=executor,
+            )
+        )
+
+    message_result, hwp_result = result.evidence_results
+    assert message_result.status == "completed"
+    assert message_result.source_type == "ocr"
+    assert ocr_threads and ocr_threads[0].startswith("extract")
+    assert hwp_result.status == "skipped"
+    assert hwp_result.error_code == "UNSUPPORTED_FILE_FORMAT"
+    assert result.items[0].date == "2026-03-17"
+
+def test_abuild_timeline_prototype_processes_victim_image_with_sync_client():
+    payload = TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="VICTIM",
+                file_format="IMAGE",
+                file_name="victim.jpg",
+                file_bytes=b"fake-image-bytes",
+                file_created_at=datetime(2026, 3, 26, 10, 5),
+            ),
+        ],
+    )
+
+    result = asyncio.run(abuild_timeline_prototype(payload, llm_client=VictimImageLLMClient()))
+
+    evidence_result = result.evidence_results[0]
+    assert evidence_result.status == "completed"
+    assert evidence_result.source_type == "vision"
+    assert evidence_result.tags == ["physical"]
+
+def test_build_timeline_prototype_staged_matches_sequential_output():
+    fake_ocr_runner = _static_ocr_runner("2026-03-17 18:30 repeated threatening message")
+    payload = TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="MESSAGE",
+                file_format="IMAGE",
+                file_name="message.png",
+                file_bytes=b"fake-image",
+            ),
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="REPORT_RECORD",
+                file_format="HWP",
+                file_name="sample.hwp",
+                file_bytes=b"fake-hwp",
+            ),
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="VICTIM",
+                file_format="IMAGE",
+                file_name="victim.jpg",
+                file_bytes=b"fake-image-bytes",
+                file_created_at=datetime(2026, 3, 26, 10, 5),
+            ),
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="REPORT_RECORD",
+                file_format="TXT",
+                extracted_text="2026-03-18 consultation record",
+            ),
+        ],
+    )
+
+    class RoutingLLMClient:
+        def generate(self, messages: list[dict]) -> str:
+            if isinstance(messages[1]["content"], list):
+                return VictimImageLLMClient().generate(messages)
+            return MockLLMClient().generate(messages)
+
+    sequential = build_timeline_prototype(
+        payload,
+        llm_client=RoutingLLMClient(),
+        ocr_runner=fake_ocr_runner,
+    )
+    stage_stats = []
+    staged = build_timeline_prototype_staged(
+        payload,
+        llm_client=RoutingLLMClient(),
+        ocr_runner=fake_ocr_runner,
+        stage_stats_callback=stage_stats.extend,
+    )
+
+    timing_fields = {"stage_summary": True, "evidence_results": {"__all__": {"stage_metrics"}}}
+    assert staged.model_dump(exclude=timing_fields) == sequential.model_dump(exclude=timing_fields)
+    assert [
+        [metrics.stage for metrics in result.stage_metrics] for result in staged.evidence_results
+    ] == [
+        [metrics.stage for metrics in result.stage_metrics] for result in sequential.evidence_results
+    ]
+    assert [stage.name for stage in stage_stats] == ["extract", "llm", "postprocess"]
+    assert stage_stats[0].processed == 4
+    assert stage_stats[1].processed == 3
+    assert stage_stats[2].processed == 3
+
+def test_build_timeline_prototype_staged_runs_extraction_in_process_pool():
+    from concurrent.futures import ProcessPoolExecutor
+
+    payload = TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="INCIDENT_LOG",
+                file_format="TXT",
+                file_name=f"incident-log-{day}.txt",
+                file_bytes=f"2026-03-{day:02d}\nactor appeared near workplace".encode("utf-8"),
+            )
+            for day in (14, 15)
+        ],
+    )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = build_timeline_prototype_staged(
+            payload,
+            llm_client=MockLLMClient(),
+            extract_executor=executor,
+        )
+
+    assert [item.status for item in result.evidence_results] == ["completed", "completed"]
+    assert [item.date for item in result.items] == ["2026-03-14", "2026-03-15"]
+
+def _static_ocr_runner(text: str):
+    def run(_image_path: str) -> OCRResult:
+        return OCRResult(
+            full_text=text,
+            segments=[OCRSegment(text=text)],
+            language="ko",
+            engine="fake-ocr",
+        )
+
+    return run
+
+def test_build_timeline_prototype_reports_structured_fields_per_evidence():
+    evidences = [
+        TimelinePrototypeEvidenceInput(
+            evidence_id=uuid4(),
+            type="REPORT_RECORD",
+            file_format="TXT",
+            extracted_text=text,
+        )
+        for text in ("2026-03-19 repeated threatening messages", "2026-03-20 actor appeared near workplace")
+    ]
+    fields: list[tuple] = []
+
+    result = build_timeline_prototype(
+        TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences),
+        llm_client=MockLLMClient(),
+        field_callback=lambda evidence_id, key, value: fields.append((evidence_id, key)),
+    )
+
+    for evidence in evidences:
+        reported = [key for evidence_id, key in fields if evidence_id == evidence.evidence_id]
+        assert "timeline_summary" in reported
+    assert all(item.status == "completed" for item in result.evidence_results)
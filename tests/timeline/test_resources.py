@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.stt.mock import MockSTT
+from ansimon_ai.timeline import (
+    ResourceGovernor,
+    ResourceLimits,
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    abuild_timeline_prototype,
+    build_timeline_prototype,
+    classify_evidence_resource,
+)
+
+MB = 1024 * 1024
+
+def _evidence(evidence_type: str, file_format: str, size: int = 1024) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type=evidence_type,
+        file_format=file_format,
+        file_name=f"{uuid4()}.bin",
+        # Unique payloads, so the run-scoped dedup does not collapse them.
+        file_bytes=(uuid4().bytes * (size // 16 + 1))[:size],
+    )
+
+def _text_evidence(text: str) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="REPORT_RECORD",
+        file_format="TXT",
+        extracted_text=text,
+    )
+
+class TrackingSTT(MockSTT):
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio_path: str):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        return super().transcribe("2026-03-19 반복 연락")
+
+def test_classify_evidence_resource_by_type_and_format():
+    assert classify_evidence_resource(_text_evidence("text")) == "light"
+    assert classify_evidence_resource(_evidence("VICTIM", "VIDEO")) == "video"
+    assert classify_evidence_resource(_evidence("VOICE", "VIDEO")) == "audio"
+    assert classify_evidence_resource(_evidence("VOICE", "AUDIO")) == "audio"
+    assert classify_evidence_resource(_evidence("REPORT_RECORD", "PDF")) == "raster"
+    assert classify_evidence_resource(_evidence("MESSAGE", "IMAGE")) == "raster"
+    assert classify_evidence_resource(_evidence("REPORT_RECORD", "DOCX")) == "light"
+
+def test_resource_governor_enforces_class_limits():
+    governor = ResourceGovernor(ResourceLimits(class_limits={"video": 1}))
+    first = _evidence("VICTIM", "VIDEO")
+    second = _evidence("VICTIM", "VIDEO")
+
+    assert governor.try_acquire(first)
+    assert not governor.try_acquire(second)
+    assert governor.try_acquire(_text_evidence("text"))
+
+    governor.release(first)
+    assert governor.try_acquire(second)
+
+def test_resource_governor_enforces_memory_budget_but_admits_oversized_alone():
+    limits = ResourceLimits(memory_budget_bytes=600 * MB)
+    governor = ResourceGovernor(limits)
+    audio = _evidence("VOICE", "AUDIO")
+    oversized = _evidence("VICTIM", "VIDEO", size=200 * MB)
+
+    assert governor.try_acquire(audio)
+    assert not governor.try_acquire(_evidence("VOICE", "AUDIO"))
+    assert not governor.try_acquire(oversized)
+
+    governor.release(audio)
+    assert governor.bytes_in_flight == 0
+    assert governor.try_acquire(oversized)
+
+def test_resource_governor_aacquire_wakes_on_release_from_another_thread():
+    governor = ResourceGovernor(ResourceLimits(class_limits={"video": 1}))
+    first = _evidence("VICTIM", "VIDEO")
+    second = _evidence("VICTIM", "VIDEO")
+    assert governor.try_acquire(first)
+    released_at: list[float] = []
+
+    def release_later() -> None:
+        time.sleep(0.05)
+        released_at.append(time.perf_counter())
+        governor.release(first)
+
+    async def admit_second() -> float:
+        async with governor.aacquire(second, poll_seconds=10):
+            return time.perf_counter()
+
+    releaser = threading.Thread(target=release_later)
+    releaser.start()
+    admitted_at = asyncio.run(admit_second())
+    releaser.join()
+
+    assert released_at[0] <= admitted_at < released_at[0] + 1
+    assert governor.bytes_in_flight == 0
+
+def test_build_timeline_prototype_serializes_the_shared_default_stt_engine(monkeypatch):
+    class OverlapDetectingSTT(MockSTT):
+        def __init__(self) -> None:
+            self.calls = 0
+            self.overlapped = False
+            self._in_flight = threading.Semaphore(1)
+
+        def transcribe(self, audio_path: str):
+            if not self._in_flight.acquire(blocking=False):
+                self.overlapped = True
+            else:
+                # Stay inside long enough for a concurrent call to show up.
+                time.sleep(0.05)
+                self._in_flight.release()
+            self.calls += 1
+            return super().transcribe("2026-03-19 반복 연락")
+
+    stt_engine = OverlapDetectingSTT()
+    monkeypatch.setattr("ansimon_ai.timeline.prototype._default_stt", stt_engine)
+    payload = TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[_evidence("VOICE", "AUDIO") for _ in range(2)],
+    )
+
+    result = build_timeline_prototype(
+        payload,
+        llm_client=MockLLMClient(),
+        max_workers=2,
+        resource_governor=ResourceGovernor(ResourceLimits(class_limits={"audio": 2})),
+    )
+
+    assert stt_engine.calls == 2
+    assert not stt_engine.overlapped
+    assert all(item.status == "completed" for item in result.evidence_results)
+
+def test_build_timeline_prototype_limits_heavy_class_but_not_light_work():
+    stt_engine = TrackingSTT()
+    evidences = [
+        *(_evidence("VOICE", "AUDIO") for _ in range(3)),
+        *(_text_evidence(f"2026-03-2{day} evidence") for day in range(3)),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    result = build_timeline_prototype(
+        payload,
+        llm_client=MockLLMClient(),
+        stt_engine=stt_engine,
+        max_workers=4,
+        resource_governor=ResourceGovernor(ResourceLimits(class_limits={"audio": 1})),
+    )
+
+    assert stt_engine.max_in_flight == 1
+    assert [item.evidence_id for item in result.evidence_results] == [
+        evidence.evidence_id for evidence in evidences
+    ]
+    assert all(item.status == "completed" for item in result.evidence_results)
+
+def test_abuild_timeline_prototype_limits_heavy_class():
+    stt_engine = TrackingSTT()
+    evidences = [_evidence("VOICE", "AUDIO") for _ in range(3)]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    result = asyncio.run(
+        abuild_timeline_prototype(
+            payload,
+            llm_client=MockLLMClient(),
+            stt_engine=stt_engine,
+            max_concurrency=3,
+            resource_governor=ResourceGovernor(ResourceLimits(class_limits={"audio": 1})),
+        )
+    )
+
+    assert stt_engine.max_in_flight == 1
+    assert all(item.status == "completed" for item in result.evidence_results)
@@ -0,0 +1,119 @@
+import threading
+from uuid import uuid4
+
+import pytest
+
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.structuring.types import StageMetrics
+from ansimon_ai.timeline import (
+    EvidenceCostModel,
+    EvidenceProcessingResult,
+    IncidentLogFormInput,
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    build_timeline_prototype,
+    schedule_evidences,
+)
+
+def _text_evidence(text: str) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="REPORT_RECORD",
+        file_format="TXT",
+        extracted_text=text,
+    )
+
+def _audio_evidence(size: int) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="VOICE",
+        file_format="AUDIO",
+        file_name="call.m4a",
+        file_bytes=b"\x00" * size,
+    )
+
+def _form_evidence() -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="INCIDENT_LOG",
+        incident_log_form=IncidentLogFormInput(
+            title="일지",
+            date="2026-03-19",
+            time="21:10",
+            place="home",
+            situation="반복 연락",
+        ),
+    )
+
+def test_evidence_cost_model_grows_with_payload_size_and_format():
+    model = EvidenceCostModel()
+
+    small_audio = model.estimate(_audio_evidence(1024))
+    large_audio = model.estimate(_audio_evidence(4 * 1024 * 1024))
+
+    assert model.estimate(_form_evidence()) < small_audio < large_audio
+    assert model.estimate(_text_evidence("text")) < small_audio
+
+def test_schedule_evidences_orders_by_estimated_cost():
+    evidences = [_text_evidence("a"), _audio_evidence(4 * 1024 * 1024), _form_evidence()]
+
+    assert schedule_evidences(evidences) == [0, 1, 2]
+    assert schedule_evidences(evidences, schedule="longest_first")[0] == 1
+    assert schedule_evidences(evidences, schedule="fast_first")[-1] == 1
+    with pytest.raises(ValueError):
+        schedule_evidences(evidences, schedule="random")
+
+def test_evidence_cost_model_learns_route_scale_from_stage_metrics():
+    model = EvidenceCostModel()
+    evidence = _text_evidence("2026-03-19 evidence")
+    before = model.estimate(evidence)
+    result = EvidenceProcessingResult(
+        evidence_id=evidence.evidence_id,
+        type=evidence.type,
+        status="completed",
+        stage_metrics=[StageMetrics(stage="llm", wall_ms=before * 2)],
+    )
+
+    model.learn([evidence], [result])
+
+    assert model.estimate(evidence) == pytest.approx(before * 2)
+
+def test_build_timeline_prototype_runs_scheduled_order_and_keeps_output_order():
+    class RecordingLLMClient:
+        def __init__(self) -> None:
+            self.contents: list[str] = []
+            self._lock = threading.Lock()
+            self._inner = MockLLMClient()
+
+        def generate(self, messages: list[dict]) -> str:
+            with self._lock:
+                self.contents.append(messages[1]["content"])
+            return self._inner.generate(messages)
+
+    evidences = [
+        _text_evidence("2026-03-19 short"),
+        _text_evidence("2026-03-20 " + "long evidence " * 20),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+    llm_client = RecordingLLMClient()
+    progress: list[tuple[int, int]] = []
+
+    class LengthCostModel(EvidenceCostModel):
+        def estimate(self, evidence: TimelinePrototypeEvidenceInput) -> float:
+            return float(len(evidence.extracted_text or ""))
+
+    result = build_timeline_prototype(
+        payload,
+        llm_client=llm_client,
+        schedule="longest_first",
+        cost_model=LengthCostModel(),
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert "long evidence" in llm_client.contents[0]
+    assert [item.evidence_id for item in result.evidence_results] == [
+        evidence.evidence_id for evidence in evidences
+    ]
+    long_cost = len(evidences[1].extracted_text)
+    total = long_cost + len(evidences[0].extracted_text)
+    assert progress == [(long_cost, total), (total, total)]
@@ -0,0 +1,173 @@
+import json
+from uuid import uuid4
+
+from ansimon_ai.llm.base import LLMResponse
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.structuring.metrics import StageRecorder, summarize_stage_metrics
+from ansimon_ai.structuring.types import StageMetrics
+from ansimon_ai.timeline import (
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    build_timeline_prototype,
+)
+
+class InMemoryCache:
+    def __init__(self) -> None:
+        self._store: dict[str, dict] = {}
+
+    def get(self, key: str):
+        return self._store.get(key)
+
+    def set(self, key: str, value: dict) -> None:
+        self._store[key] = value
+
+class VictimLLMClient:
+    def generate(self, messages: list[dict]) -> str:
+        return json.dumps(
+            {
+                "title": {"value": "신체 접촉 장면"},
+                "summary": {"value": "인물이 팔을 붙잡는 장면이 관찰된다."},
+            },
+            ensure_ascii=False,
+        )
+
+class UsageReportingLLMClient(MockLLMClient):
+    def generate_json(self, messages: list[dict]) -> LLMResponse:
+        text = self.generate(messages)
+        return LLMResponse(
+            text=text,
+            data=json.loads(text),
+            prompt_tokens=1_000,
+            completion_tokens=200,
+            cached_prompt_tokens=400,
+            model="gpt-5-mini-2025-08-07",
+        )
+
+def _build_report_record(text: str) -> TimelinePrototypeEvidenceInput:
+    return TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="REPORT_RECORD",
+        file_format="TXT",
+        file_name="record.txt",
+        file_bytes=text.encode("utf-8"),
+    )
+
+def test_build_timeline_prototype_records_stage_metrics_per_evidence():
+    evidence = _build_report_record("2026-03-19 repeated contact was documented")
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=[evidence])
+
+    result = build_timeline_prototype(payload, llm_client=MockLLMClient())
+
+    metrics = {item.stage: item for item in result.evidence_results[0].stage_metrics}
+    assert list(metrics) == ["extract", "llm", "anchor", "validation", "tags"]
+    assert metrics["extract"].input_bytes == len(evidence.file_bytes)
+    assert metrics["llm"].cache_hit is False
+    assert metrics["llm"].prompt_chars > 0
+    assert metrics["llm"].response_chars > 0
+    assert all(item.wall_ms >= 0 and item.cpu_ms is not None for item in metrics.values())
+
+def test_build_timeline_prototype_rolls_up_stage_metrics_with_cache_hits():
+    cache = InMemoryCache()
+    evidence = _build_report_record("2026-03-19 repeated contact was documented")
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=[evidence])
+
+    build_timeline_prototype(payload, llm_client=MockLLMClient(), cache=cache)
+    result = build_timeline_prototype(payload, llm_client=MockLLMClient(), cache=cache)
+
+    llm_metrics = next(
+        item for item in result.evidence_results[0].stage_metrics if item.stage == "llm"
+    )
+    assert llm_metrics.cache_hit is True
+    assert llm_metrics.prompt_chars is None
+
+    summary = {item.stage: item for item in result.stage_summary}
+    assert summary["llm"].count == 1
+    assert summary["llm"].cache_hits == 1
+    assert summary["anchor_store"].count == 1
+    assert summary["extract"].input_bytes == len(evidence.file_bytes)
+
+def test_build_timeline_prototype_records_victim_stage_metrics():
+    cache = InMemoryCache()
+    evidence = TimelinePrototypeEvidenceInput(
+        evidence_id=uuid4(),
+        type="VICTIM",
+        file_format="IMAGE",
+        file_name="victim.jpg",
+        file_bytes=b"fake-image",
+    )
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=[evidence])
+
+    first = build_timeline_prototype(payload, llm_client=VictimLLMClient(), cache=cache)
+    second = build_timeline_prototype(payload, llm_client=VictimLLMClient(), cache=cache)
+
+    first_stages = [item.stage for item in first.evidence_results[0].stage_metrics]
+    second_metrics = second.evidence_results[0].stage_metrics
+    assert first_stages == ["cache", "extract", "llm", "tags"]
+    assert [item.stage for item in second_metrics] == ["cache", "tags"]
+    assert second_metrics[0].cache_hit is True
+
+def test_summarize_stage_metrics_aggregates_by_stage():
+    summary = summarize_stage_metrics(
+        [
+            StageMetrics(stage="llm", wall_ms=10.0, cpu_ms=1.0, prompt_chars=100, cache_hit=False),
+            StageMetrics(stage="extract", wall_ms=5.0, cpu_ms=4.0, input_bytes=2048),
+            StageMetrics(stage="llm", wall_ms=30.0, prompt_chars=50, cache_hit=True),
+        ]
+    )
+
+    assert [item.stage for item in summary] == ["llm", "extract"]
+    llm = summary[0]
+    assert llm.count == 2
+    assert llm.wall_ms == 40.0
+    assert llm.max_wall_ms == 30.0
+    assert llm.cpu_ms == 1.0
+    assert llm.prompt_chars == 150
+    assert llm.cache_hits == 1
+    assert summary[1].input_bytes == 2048
+    assert llm.cached_prompt_ratio is None
+
+def test_summarize_stage_metrics_reports_cached_prompt_ratio():
+    (summary,) = summarize_stage_metrics(
+        [
+            StageMetrics(stage="llm", wall_ms=1.0, prompt_tokens=3000, cached_prompt_tokens=2048),
+            StageMetrics(stage="llm", wall_ms=1.0, prompt_tokens=1000, cached_prompt_tokens=0),
+        ]
+    )
+
+    assert summary.cached_prompt_tokens == 2048
+    assert summary.cached_prompt_ratio == 2048 / 4000
+
+def test_stage_recorder_records_failed_stage():
+    recorder = StageRecorder()
+
+    try:
+        with recorder.stage("llm", cache_hit=False):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert [item.stage for item in recorder.metrics] == ["llm"]
+    assert recorder.metrics[0].cache_hit is False
+
+def test_build_timeline_prototype_rolls_up_token_usage_and_cost():
+    evidences = [
+        _build_report_record("2026-03-19 repeated contact was documented"),
+        _build_report_record("2026-03-20 another visit was documented"),
+    ]
+    payload = TimelinePrototypeAiInput(complaint_id=uuid4(), evidences=evidences)
+
+    result = build_timeline_prototype(payload, llm_client=UsageReportingLLMClient())
+
+    llm_metrics = next(
+        item for item in result.evidence_results[0].stage_metrics if item.stage == "llm"
+    )
+    assert (llm_metrics.prompt_tokens, llm_metrics.completion_tokens) == (1_000, 200)
+    assert llm_metrics.cached_prompt_tokens == 400
+    # 600 uncached and 400 cached prompt tokens plus 200 output tokens at gpt-5-mini rates.
+    assert llm_metrics.estimated_cost == (600 * 0.25 + 400 * 0.025 + 200 * 2.0) / 1_000_000
+
+    summary = {item.stage: item for item in result.stage_summary}
+    assert summary["llm"].prompt_tokens == 2_000
+    assert summary["llm"].completion_tokens == 400
+    assert summary["llm"].cached_prompt_tokens == 800
+    assert summary["llm"].estimated_cost == 2 * llm_metrics.estimated_cost
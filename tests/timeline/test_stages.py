@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from ansimon_ai.timeline import PipelineStage, StageExit, StagePipeline
+
+def test_stage_pipeline_keeps_order_and_overlaps_stages():
+    first_stage_second_item_started = threading.Event()
+
+    def extract(item: int) -> int:
+        if item == 1:
+            first_stage_second_item_started.set()
+        return item * 10
+
+    def llm(value: int) -> int:
+        if value == 0:
+            assert first_stage_second_item_started.wait(timeout=1)
+        return value + 1
+
+    pipeline = StagePipeline(
+        [
+            PipelineStage(name="extract", fn=extract, workers=1),
+            PipelineStage(name="llm", fn=llm, workers=2),
+        ]
+    )
+
+    results, stats = pipeline.run([0, 1, 2, 3])
+
+    assert results == [1, 11, 21, 31]
+    assert [stage.name for stage in stats] == ["extract", "llm"]
+    assert [stage.processed for stage in stats] == [4, 4]
+    assert all(stage.wall_seconds > 0 for stage in stats)
+    assert all(stage.max_queue_depth >= 1 for stage in stats)
+
+def test_stage_pipeline_reports_busy_time_per_stage():
+    pipeline = StagePipeline(
+        [
+            PipelineStage(name="fast", fn=lambda item: item),
+            PipelineStage(name="slow", fn=lambda item: time.sleep(0.02) or item),
+        ]
+    )
+
+    _, stats = pipeline.run([1, 2, 3])
+
+    fast, slow = stats
+    assert slow.busy_seconds >= 0.06
+    assert slow.busy_seconds > fast.busy_seconds
+    assert 0 < slow.utilization <= 1
+
+def test_stage_pipeline_stage_exit_skips_remaining_stages():
+    calls: list[int] = []
+
+    def second(item: int) -> int:
+        calls.append(item)
+        return item
+
+    pipeline = StagePipeline(
+        [
+            PipelineStage(name="first", fn=lambda item: StageExit(-item) if item % 2 else item),
+            PipelineStage(name="second", fn=second),
+        ]
+    )
+
+    results, stats = pipeline.run([0, 1, 2, 3])
+
+    assert results == [0, -1, 2, -3]
+    assert calls == [0, 2]
+    assert stats[1].processed == 2
+
+def test_stage_pipeline_stops_admitting_items_on_cancel():
+    progress: list[int] = []
+    pipeline = StagePipeline([PipelineStage(name="only", fn=lambda item: item)], max_in_flight=1)
+
+    results, _ = pipeline.run(
+        range(10),
+        progress_callback=lambda done, total: progress.append(done),
+        cancel_callback=lambda: len(progress) >= 3,
+    )
+
+    assert results == [0, 1, 2]
+
+def test_stage_pipeline_raises_stage_errors_after_draining():
+    def explode(item: int) -> int:
+        if item == 2:
+            raise RuntimeError("boom")
+        return item
+
+    pipeline = StagePipeline([PipelineStage(name="only", fn=explode, workers=2)])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run(range(5))
+
+def test_stage_pipeline_raises_progress_callback_errors_on_caller():
+    def report(finished: int, total: int) -> None:
+        if finished == 2:
+            raise RuntimeError("progress failed")
+
+    pipeline = StagePipeline(
+        [
+            PipelineStage(name="first", fn=lambda item: item),
+            PipelineStage(name="second", fn=lambda item: item),
+        ]
+    )
+
+    with pytest.raises(RuntimeError, match="progress failed"):
+        pipeline.run(range(5), progress_callback=report)
+
+def test_stage_pipeline_rejects_empty_or_workerless_stages():
+    with pytest.raises(ValueError):
+        StagePipeline([])
+    with pytest.raises(ValueError):
+        StagePipeline([PipelineStage(name="broken", fn=lambda item: item, workers=0)])
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from uuid import uuid4
+
+import pytest
+
+from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.timeline import (
+    TimelineIndex,
+    TimelinePrototypeAiInput,
+    TimelinePrototypeEvidenceInput,
+    aiter_timeline_prototype,
+    assemble_timeline_items,
+    build_timeline_prototype,
+    iter_timeline_prototype,
+)
+
+def _build_payload(texts: list[str]) -> TimelinePrototypeAiInput:
+    return TimelinePrototypeAiInput(
+        complaint_id=uuid4(),
+        evidences=[
+            TimelinePrototypeEvidenceInput(
+                evidence_id=uuid4(),
+                type="REPORT_RECORD",
+                file_format="TXT",
+                extracted_text=text,
+            )
+            for text in texts
+        ],
+    )
+
+class GatedLLMClient:
+    """Holds the first evidence until the test releases it."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self._inner = MockLLMClient()
+
+    def generate(self, messages: list[dict]) -> str:
+        if "first" in messages[1]["content"]:
+            assert self.release.wait(timeout=2)
+        return self._inner.generate(messages)
+
+def test_iter_timeline_prototype_final_output_matches_batch_build():
+    payload = _build_payload(
+        ["2026-03-20 second day", "2026-03-19 first day", "2026-03-19 same day again"]
+    )
+
+    events = list(iter_timeline_prototype(payload, llm_client=MockLLMClient()))
+    expected = build_timeline_prototype(payload, llm_client=MockLLMClient())
+
+    assert [event.kind for event in events] == [
+        "evidence", "snapshot", "evidence", "snapshot", "evidence", "snapshot", "final",
+    ]
+    final = events[-1].output
+    assert final.items == expected.items
+    assert [item.evidence_id for item in final.evidence_results] == [
+        item.evidence_id for item in expected.evidence_results
+    ]
+    assert events[-2].items == expected.items
+
+def test_iter_timeline_prototype_emits_results_as_they_complete():
+    payload = _build_payload(["2026-03-19 first evidence", "2026-03-20 second evidence"])
+
+    llm_client = GatedLLMClient()
+    events = []
+    for event in iter_timeline_prototype(payload, llm_client=llm_client, max_workers=2):
+        events.append(event)
+        llm_client.release.set()
+
+    evidence_events = [event for event in events if event.kind == "evidence"]
+    assert [event.evidence_result.evidence_id for event in evidence_events] == [
+        payload.evidences[1].evidence_id,
+        payload.evidences[0].evidence_id,
+    ]
+    assert [event.completed for event in evidence_events] == [1, 2]
+    first_snapshot = next(event for event in events if event.kind == "snapshot")
+    assert [item.date for item in first_snapshot.items] == ["2026-03-20"]
+    final = events[-1].output
+    assert [item.evidence_id for item in final.evidence_results] == [
+        evidence.evidence_id for evidence in payload.evidences
+    ]
+    assert [item.date for item in final.items] == ["2026-03-19", "2026-03-20"]
+
+def test_iter_timeline_prototype_respects_snapshot_every():
+    payload = _build_payload([f"2026-03-{day:02d} evidence" for day in range(1, 6)])
+
+    events = list(
+        iter_timeline_prototype(payload, llm_client=MockLLMClient(), snapshot_every=2)
+    )
+
+    assert [event.completed for event in events if event.kind == "snapshot"] == [2, 4]
+    assert events[-1].kind == "final"
+    assert len(events[-1].output.items) == 5
+
+    with pytest.raises(ValueError):
+        list(iter_timeline_prototype(payload, llm_client=MockLLMClient(), snapshot_every=0))
+
+def test_aiter_timeline_prototype_streams_and_matches_batch_build():
+    payload = _build_payload(["2026-03-19 first evidence", "2026-03-20 second evidence"])
+
+    async def collect():
+        return [
+            event
+            async for event in aiter_timeline_prototype(
+                payload,
+                llm_client=MockLLMClient(),
+                max_concurrency=2,
+            )
+        ]
+
+    events = asyncio.run(collect())
+    expected = build_timeline_prototype(payload, llm_client=MockLLMClient())
+
+    assert sum(event.kind == "evidence" for event in events) == 2
+    assert events[-1].kind == "final"
+    assert events[-1].output.items == expected.items
+
+def test_timeline_index_is_independent_of_completion_order():
+    payload = _build_payload(
+        ["2026-03-19 a", "2026-03-19 b", "2026-03-18 c", "날짜 없는 증거"]
+    )
+    results = build_timeline_prototype(payload, llm_client=MockLLMClient()).evidence_results
+
+    index = TimelineIndex()
+    for position in (2, 0, 3, 1):
+        index.add(results[position], position=position)
+        index.snapshot()
+
+    assert index.snapshot() == assemble_timeline_items(results)
@@ -1,10 +1,13 @@
 import json
 from uuid import uuid4
 
+from ansimon_ai.llm.caching import CachingLLMClient
 from ansimon_ai.llm.mock import MockLLMClient
+from ansimon_ai.structuring.metrics import StageRecorder
 from ansimon_ai.writing.generate import (
     generate_complaint_document,
     generate_damage_facts_statement,
+    stream_complaint_document_sections,
 )
 from schemas.complaint_writing import (
     ComplaintWritingAiInput,
@@ -96,4 +99,44 @@ def test_generate_document_outputs_with_mock_llm_client() -> None:
     assert complaint_result.section_4_crime_facts
     assert complaint_result.section_5_complaint_reason
     assert complaint_result.section_6_evidence_list_text
-    assert statement_result.damage_facts_statement
\ No newline at end of file
+    assert statement_result.damage_facts_statement
+
+def test_generate_damage_facts_statement_records_llm_usage() -> None:
+    recorder = StageRecorder()
+
+    generate_damage_facts_statement(
+        _make_ai_input(),
+        llm_client=MockLLMClient(),
+        recorder=recorder,
+    )
+
+    (metrics,) = recorder.metrics
+    assert metrics.stage == "writing"
+    assert metrics.prompt_chars > 0
+    assert metrics.prompt_tokens is None
+
+def test_generate_damage_facts_statement_reuses_cached_llm_response() -> None:
+    llm_client = DummyLLMClient({"damage_facts_statement": "피해 사실 본문"})
+    client = CachingLLMClient(llm_client)
+    recorder = StageRecorder()
+    ai_input = _make_ai_input()
+
+    for _ in range(2):
+        result = generate_damage_facts_statement(ai_input, llm_client=client, recorder=recorder)
+
+    assert result.damage_facts_statement == "피해 사실 본문"
+    assert [metrics.cache_hit for metrics in recorder.metrics] == [False, True]
+    assert client.hits == 1
+
+def test_stream_complaint_document_sections_yields_sections_in_order() -> None:
+    client = MockLLMClient()
+    ai_input = _make_ai_input()
+    recorder = StageRecorder()
+
+    sections = list(
+        stream_complaint_document_sections(ai_input, llm_client=client, recorder=recorder)
+    )
+    document = generate_complaint_document(ai_input, llm_client=client)
+
+    assert sections == list(document.model_dump().items())
+    assert [metrics.stage for metrics in recorder.metrics] == ["writing"]